@@ -0,0 +1,20 @@
+"""
+Benchmarks for mizani
+
+The benchmarks are written in the style of airspeed velocity (asv).
+Each ``bench_*.py`` module has classes with ``time_*`` methods, the
+sizes of the data are the ``params`` of the class and the data is
+created in ``setup``.
+
+They can be run, from the root of the repository, without any other
+tools
+
+    python -m benchmarks run
+    python -m benchmarks run --max-size 10000000 --save results.json
+    python -m benchmarks compare benchmarks/baselines/main.json results.json
+
+See ``python -m benchmarks --help`` for all the options.
+"""
+
+# The sizes of the inputs
+SIZES = [10**2, 10**3, 10**4, 10**5, 10**6, 10**7]
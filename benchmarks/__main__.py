@@ -0,0 +1,229 @@
+"""
+Run the benchmarks and compare the results with a baseline
+
+Usage (from the root of the repository)::
+
+    python -m benchmarks run [-k PATTERN] [--max-size N] [--save FILE]
+                             [--compare BASELINE] [--threshold RATIO]
+    python -m benchmarks compare BASELINE RESULTS [--threshold RATIO]
+
+The results are saved as JSON. When compared, a benchmark whose
+(minimum) time is more than ``threshold`` times that of the baseline is
+a regression and the command exits with a non-zero status.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import inspect
+import json
+import pkgutil
+import platform
+import statistics
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterator
+
+THIS_DIR = Path(__file__).parent
+
+# Minimum duration of each timing sample in seconds
+SAMPLE_TIME = 0.1
+
+# Default ratio to the baseline above which a benchmark has regressed
+THRESHOLD = 1.25
+
+
+def discover(pattern: str | None = None) -> Iterator[tuple[str, type]]:
+    """
+    Find the benchmark classes
+
+    Yields the names (module.Class) and the classes
+    """
+    for info in sorted(pkgutil.iter_modules([str(THIS_DIR)])):
+        if not info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module(f"benchmarks.{info.name}")
+        for name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            if not any(m.startswith("time_") for m in dir(cls)):
+                continue
+            fullname = f"{info.name}.{name}"
+            if pattern is None or pattern in fullname:
+                yield fullname, cls
+
+
+def time_func(func: Callable[[], Any]) -> dict[str, float]:
+    """
+    Time a function
+
+    The function is called once to warm up and then repeatedly in
+    samples that last at least SAMPLE_TIME seconds.
+    """
+    start = perf_counter()
+    func()
+    duration = perf_counter() - start
+    number = max(1, int(SAMPLE_TIME / max(duration, 1e-9)))
+    repeat = 5 if duration < 1 else 3
+
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((perf_counter() - start) / number)
+    return {"min": min(samples), "median": statistics.median(samples)}
+
+
+def run(pattern: str | None, max_size: int) -> dict[str, dict[str, float]]:
+    """
+    Run the benchmarks
+    """
+    results = {}
+    for fullname, cls in discover(pattern):
+        params = getattr(cls, "params", [[None]])[0]
+        methods = sorted(m for m in dir(cls) if m.startswith("time_"))
+        for param in params:
+            if param is not None and param > max_size:
+                continue
+            bench = cls()
+            if hasattr(bench, "setup"):
+                bench.setup(param)
+            for method in methods:
+                func = getattr(bench, method)
+                name = f"{fullname}.{method}({param})"
+                timing = time_func(lambda: func(param))
+                results[name] = timing
+                print(f"{name:<60} {format_time(timing['min']):>10}")
+    return results
+
+
+def environment() -> dict[str, str]:
+    """
+    Versions and machine of the benchmark run
+    """
+    import numpy as np
+    import pandas as pd
+
+    import mizani
+
+    return {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "mizani": getattr(mizani, "__version__", "unknown"),
+    }
+
+
+def format_time(seconds: float) -> str:
+    """
+    Format a duration in the most readable units
+    """
+    for units, factor in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= factor:
+            return f"{seconds / factor:.3g}{units}"
+    return f"{seconds / 1e-9:.3g}ns"
+
+
+def compare(
+    baseline: dict[str, Any], results: dict[str, Any], threshold: float
+) -> bool:
+    """
+    Print a comparison of the results and the baseline
+
+    Returns
+    -------
+    out :
+        Whether any of the benchmarks has regressed.
+    """
+    base, new = baseline["results"], results["results"]
+    regressed = False
+    print(f"\n{'benchmark':<60} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for name in sorted(base.keys() & new.keys()):
+        ratio = new[name]["min"] / base[name]["min"]
+        if ratio > threshold:
+            mark = "  slower"
+            regressed = True
+        elif ratio < 1 / threshold:
+            mark = "  faster"
+        else:
+            mark = ""
+        print(
+            f"{name:<60} {format_time(base[name]['min']):>10} "
+            f"{format_time(new[name]['min']):>10} {ratio:>7.2f}{mark}"
+        )
+
+    missing = sorted(base.keys() - new.keys())
+    if missing:
+        print(f"\n{len(missing)} benchmarks in the baseline were not run.")
+    return regressed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.split("\n")[1]
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument(
+        "-k", dest="pattern", help="Only run benchmarks with this in the name"
+    )
+    run_parser.add_argument(
+        "--max-size",
+        type=lambda s: int(float(s)),
+        default=10**5,
+        help="Largest input size to run (default: 100000)",
+    )
+    run_parser.add_argument("--save", type=Path, help="Save the results")
+    run_parser.add_argument(
+        "--compare", type=Path, help="Compare the results with a baseline"
+    )
+
+    compare_parser = commands.add_parser(
+        "compare", help="Compare saved results with a baseline"
+    )
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("results", type=Path)
+
+    for p in (run_parser, compare_parser):
+        p.add_argument(
+            "--threshold",
+            type=float,
+            default=THRESHOLD,
+            help=(
+                "Ratio to the baseline time that is a regression "
+                f"(default: {THRESHOLD})"
+            ),
+        )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = {
+            "environment": environment(),
+            "results": run(args.pattern, args.max_size),
+        }
+        if args.save:
+            args.save.write_text(json.dumps(results, indent=2) + "\n")
+        if not args.compare:
+            return 0
+        baseline = json.loads(args.compare.read_text())
+    else:
+        baseline = json.loads(args.baseline.read_text())
+        results = json.loads(args.results.read_text())
+
+    return int(compare(baseline, results, args.threshold))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+import numpy as np
+
+from mizani.breaks import breaks_extended, breaks_log
+
+
+def random_limits(n: int, log: bool = False):
+    """
+    n pairs of limits with widths over many orders of magnitude
+    """
+    rng = np.random.default_rng(123)
+    if log:
+        low = 10 ** rng.uniform(-3, 3, n)
+        return np.column_stack([low, low * 10 ** rng.uniform(0.5, 8, n)])
+    low = rng.uniform(-1000, 1000, n)
+    return np.column_stack([low, low + 10 ** rng.uniform(-3, 6, n)])
+
+
+class BreaksExtended:
+    params = [[10**2, 10**3, 10**4]]
+    param_names = ["n"]
+
+    def setup(self, n):
+        self.limits = random_limits(n)
+        # e.g. redrawing the same 100 facets
+        self.repeated = self.limits[np.arange(n) % 100]
+
+    def time_uncached(self, n):
+        breaks = breaks_extended(cache=None)
+        for limits in self.limits:
+            breaks(limits)
+
+    def time_cached(self, n):
+        breaks = breaks_extended()
+        for limits in self.repeated:
+            breaks(limits)
+
+
+class BreaksExtendedExtreme:
+    """
+    Limits for which breaks_extended searches many candidates
+    """
+
+    params = [[5, 15, 50]]
+    param_names = ["n"]
+
+    def setup(self, n):
+        self.limits = [
+            (0, 10),
+            (1e-3, 1e6),
+            (-1e9, 1),
+            (1e6, 1e6 + 1),
+            (0.999999, 1.000001),
+            (1e15, 1e15 + 3),
+        ]
+
+    def time_uncached(self, n):
+        breaks = breaks_extended(n=n, cache=None)
+        for limits in self.limits:
+            breaks(limits)
+
+
+class BreaksLog:
+    params = [[10**2, 10**3, 10**4]]
+    param_names = ["n"]
+
+    def setup(self, n):
+        self.limits = random_limits(n, log=True)
+
+    def time_breaks(self, n):
+        breaks = breaks_log()
+        for limits in self.limits:
+            breaks(limits)
@@ -0,0 +1,33 @@
+import numpy as np
+
+from mizani.labels import label_date, label_number
+
+from . import SIZES
+
+
+class LabelNumber:
+    params = [SIZES]
+    param_names = ["n"]
+
+    def setup(self, n):
+        rng = np.random.default_rng(123)
+        self.x = rng.normal(0, 10**4, n)
+
+    def time_default(self, n):
+        label_number()(self.x)
+
+    def time_accuracy_big_mark(self, n):
+        label_number(accuracy=0.01, big_mark=",", prefix="$")(self.x)
+
+
+class LabelDate:
+    params = [SIZES]
+    param_names = ["n"]
+
+    def setup(self, n):
+        rng = np.random.default_rng(123)
+        seconds = rng.integers(0, 2 * 10**9, n)
+        self.x = np.datetime64("1970-01-01", "s") + seconds
+
+    def time_datetime64(self, n):
+        label_date("%Y-%m-%d %H:%M")(self.x)
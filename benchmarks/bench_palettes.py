@@ -0,0 +1,33 @@
+import numpy as np
+
+from mizani.palettes import cmap_pal, hue_pal
+
+from . import SIZES
+
+
+class CmapPal:
+    params = [SIZES]
+    param_names = ["n"]
+
+    def setup(self, n):
+        rng = np.random.default_rng(123)
+        self.x = rng.uniform(0, 1, n)
+        self.palette = cmap_pal("viridis")
+
+    def time_hex(self, n):
+        self.palette(self.x)
+
+
+class HuePal:
+    params = [[10**2, 10**3, 10**4, 10**5, 10**6]]
+    param_names = ["n"]
+
+    def setup(self, n):
+        self.palette = hue_pal()
+        self.palette(n)
+
+    def time_colors(self, n):
+        hue_pal(cache=None)(n)
+
+    def time_colors_cached(self, n):
+        self.palette(n)
@@ -0,0 +1,33 @@
+import numpy as np
+
+from mizani.palettes import hue_pal, rescale_pal
+from mizani.scale import scale_continuous, scale_discrete
+
+from . import SIZES
+
+
+class ScaleContinuousMap:
+    params = [SIZES]
+    param_names = ["n"]
+
+    def setup(self, n):
+        rng = np.random.default_rng(123)
+        self.x = rng.uniform(0, 10, n)
+        self.palette = rescale_pal()
+
+    def time_map(self, n):
+        scale_continuous.map(self.x, self.palette, (1, 9))
+
+
+class ScaleDiscreteMap:
+    params = [SIZES]
+    param_names = ["n"]
+
+    def setup(self, n):
+        rng = np.random.default_rng(123)
+        self.limits = [f"level-{i}" for i in range(26)]
+        self.x = np.array(self.limits, dtype=object)[rng.integers(0, 26, n)]
+        self.palette = hue_pal()
+
+    def time_map(self, n):
+        scale_discrete.map(self.x, self.palette, self.limits)
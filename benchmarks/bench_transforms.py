@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+from mizani.transforms import datetime_trans, timedelta_trans
+
+from . import SIZES
+
+
+class DatetimeTrans:
+    params = [SIZES]
+    param_names = ["n"]
+
+    def setup(self, n):
+        self.trans = datetime_trans()
+        self.x = pd.Series(
+            pd.date_range("2000-01-01", periods=n, freq="37s", tz="UTC")
+        )
+        self.xt = self.trans.transform(self.x)
+
+    def time_transform(self, n):
+        self.trans.transform(self.x)
+
+    def time_inverse(self, n):
+        self.trans.inverse(self.xt)
+
+
+class TimedeltaTrans:
+    params = [SIZES]
+    param_names = ["n"]
+
+    def setup(self, n):
+        rng = np.random.default_rng(123)
+        self.trans = timedelta_trans()
+        self.x = pd.Series(
+            pd.to_timedelta(rng.integers(0, 10**15, n), unit="ns")
+        )
+        self.xt = self.trans.transform(self.x)
+
+    def time_transform(self, n):
+        self.trans.transform(self.x)
+
+    def time_inverse(self, n):
+        self.trans.inverse(self.xt)
@@ -0,0 +1,18 @@
+import numpy as np
+
+from mizani.utils import match
+
+from . import SIZES
+
+
+class Match:
+    params = [SIZES]
+    param_names = ["n"]
+
+    def setup(self, n):
+        rng = np.random.default_rng(123)
+        self.v1 = rng.integers(0, 1000, n)
+        self.v2 = rng.permutation(1000)
+
+    def time_match(self, n):
+        match(self.v1, self.v2)
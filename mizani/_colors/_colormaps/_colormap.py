@@ -2,14 +2,23 @@ from __future__ import annotations
 
 import abc
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, overload
 
 import numpy as np
 
+from .._hex import hex_to_rgb256
+
 if TYPE_CHECKING:
-    from typing import Sequence
+    from typing import Literal, Sequence
+
+    from numpy.typing import NDArray
 
-    from mizani.typing import FloatArrayLike, RGBHexColor
+    from mizani.typing import (
+        ColorPaletteOutput,
+        FloatArrayLike,
+        NDArrayStr,
+        RGBHexColor,
+    )
 
 __all__ = ("ColorMap",)
 
@@ -28,11 +37,13 @@ class ColorMap(abc.ABC):
     """
 
     @abc.abstractmethod
-    def _generate_colors(self, x: FloatArrayLike) -> Sequence[RGBHexColor]:
+    def _generate_colors(self, x: FloatArrayLike) -> NDArrayStr:
         """
         Method to map [0, 1] values onto the a color range
 
-        Subclasses must implement this method
+        Subclasses must implement this method and return an array
+        of hex colors. :func:`mizani._colors._hex.rgb_to_hex_array`
+        does the conversion from RGB values.
 
         Parameters
         ----------
@@ -41,6 +52,24 @@ class ColorMap(abc.ABC):
             gradient, and 1 to the end of the gradient.
         """
 
+    def _generate_rgba256(self, x: FloatArrayLike) -> NDArray[np.uint8]:
+        """
+        Method to map [0, 1] values onto 8 bit RGBA colors
+
+        The default implementation decodes the hex colors created by
+        `_generate_colors`. Subclasses that can create the channel
+        values directly should override this method.
+
+        Parameters
+        ----------
+        x :
+            Values in the range [0, 1]. O maps to the start of the
+            gradient, and 1 to the end of the gradient.
+        """
+        rgb = hex_to_rgb256(self._generate_colors(x))
+        alpha = np.full((len(rgb), 1), 255, dtype=np.uint8)
+        return np.hstack([rgb, alpha])
+
     def discrete_palette(self, n: int) -> Sequence[RGBHexColor]:
         """
         Return n colors from the gradient
@@ -53,11 +82,26 @@ class ColorMap(abc.ABC):
             Number of colors to return from the gradient.
         """
         x = np.linspace(0, 1, n)
-        return self._generate_colors(x)
+        return self._generate_colors(x).tolist()
+
+    @overload
+    def continuous_palette(
+        self, x: FloatArrayLike, output: Literal["list"] = "list"
+    ) -> Sequence[RGBHexColor | None]: ...
+
+    @overload
+    def continuous_palette(
+        self, x: FloatArrayLike, output: Literal["array"]
+    ) -> np.ma.MaskedArray: ...
 
+    @overload
     def continuous_palette(
-        self, x: FloatArrayLike
-    ) -> Sequence[RGBHexColor | None]:
+        self, x: FloatArrayLike, output: Literal["uint8"]
+    ) -> NDArray[np.uint8]: ...
+
+    def continuous_palette(
+        self, x: FloatArrayLike, output: ColorPaletteOutput = "list"
+    ) -> Sequence[RGBHexColor | None] | np.ma.MaskedArray | NDArray[np.uint8]:
         """
         Return colors correspondsing to proportions in x
 
@@ -66,19 +110,45 @@ class ColorMap(abc.ABC):
         x :
             Values in the range [0, 1]. O maps to the start of the
             gradient, and 1 to the end of the gradient.
+        output :
+            How to return the colors.
+
+            - ``"list"`` - A list of hex colors, with ``None`` for
+              the non-finite values of ``x``.
+            - ``"array"`` - A masked array of hex colors (dtype
+              ``U7``), with the non-finite values of ``x`` masked.
+            - ``"uint8"`` - An array of shape ``(n, 4)`` with the
+              8 bit RGBA values of the colors. The non-finite values
+              of ``x`` are transparent, i.e. ``[0, 0, 0, 0]``.
+
+            The last two avoid creating python strings for every
+            value.
         """
+        if output not in ("list", "array", "uint8"):
+            raise ValueError(
+                "output should be one of ['list', 'array', 'uint8']. "
+                f"Got {output!r}"
+            )
+
         x = np.asarray(x)
         bad_bool_idx = np.isnan(x) | np.isinf(x)
         has_bad = bad_bool_idx.any()
 
         if has_bad:
-            x[bad_bool_idx] = 0
+            x = np.where(bad_bool_idx, 0, x)
+
+        if output == "uint8":
+            rgba = self._generate_rgba256(x)
+            if has_bad:
+                rgba[bad_bool_idx] = 0
+            return rgba
 
         hex_colors = self._generate_colors(x)
 
+        if output == "array":
+            return np.ma.MaskedArray(hex_colors, mask=bad_bool_idx)
+
         if has_bad:
-            hex_colors = [
-                None if isbad else c
-                for c, isbad in zip(hex_colors, bad_bool_idx)
-            ]
-        return hex_colors
+            hex_colors = hex_colors.astype(object)
+            hex_colors[bad_bool_idx] = None
+        return hex_colors.tolist()
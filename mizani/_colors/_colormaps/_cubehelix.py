@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
-from ..hsluv import rgb_to_hex
+from .._hex import rgb_to_hex_array
 from ._colormap import ColorMap, ColorMapKind
 
 if TYPE_CHECKING:
@@ -13,6 +13,7 @@ if TYPE_CHECKING:
 
     from mizani.typing import (
         FloatArrayLike,
+        NDArrayStr,
         RGBHexColor,
     )
 
@@ -35,7 +36,7 @@ class CubeHelixMap(ColorMap):
 
     kind: ClassVar[ColorMapKind] = ColorMapKind.miscellaneous
 
-    def _generate_colors(self, x: FloatArrayLike) -> Sequence[RGBHexColor]:
+    def _generate_colors(self, x: FloatArrayLike) -> NDArrayStr:
         x = np.asarray(x)
         # Apply gamma factor to emphasise low or high intensity values
         xg = x**self.gamma
@@ -51,7 +52,7 @@ class CubeHelixMap(ColorMap):
         if self.reverse:
             rgb = rgb[::-1, :]
 
-        return [rgb_to_hex(c) for c in rgb]
+        return rgb_to_hex_array(rgb)
 
     def discrete_palette(self, n: int) -> Sequence[RGBHexColor]:
         """
@@ -63,4 +64,4 @@ class CubeHelixMap(ColorMap):
             Number of colors to return from the gradient.
         """
         x = np.linspace(self.light, self.dark, n)
-        return self._generate_colors(x)
+        return self._generate_colors(x).tolist()
@@ -1,19 +1,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 import numpy as np
 
-from ..hsluv import hex_to_rgb, rgb_to_hex
+from .._hex import float_to_rgb256, rgb256_to_hex
+from ..hsluv import hex_to_rgb
 from ._colormap import ColorMap, ColorMapKind
 
 if TYPE_CHECKING:
     from typing import Sequence
 
+    from numpy.typing import NDArray
+
     from mizani.typing import (
         FloatArrayLike,
         NDArrayFloat,
+        NDArrayStr,
         RGBColor,
         RGBColorArray,
         RGBHexColor,
@@ -30,7 +35,41 @@ class _InterpolatedGen(ColorMap):
     _g_lookup: NDArrayFloat
     _b_lookup: NDArrayFloat
 
-    def _generate_colors(self, x: FloatArrayLike) -> Sequence[RGBHexColor]:
+    @cached_property
+    def _rgba256_lookup(self) -> NDArray[np.uint8]:
+        """
+        All the 256 colors of the gradient as 8 bit RGBA values
+
+        The colors are created on first use.
+        """
+        rgba = np.column_stack(
+            [
+                self._r_lookup,
+                self._g_lookup,
+                self._b_lookup,
+                np.ones(len(SPACE256)),
+            ]
+        )
+        return float_to_rgb256(rgba)
+
+    @cached_property
+    def _hex_lookup(self) -> NDArrayStr:
+        """
+        All the 256 colors of the gradient as hex strings
+
+        The colors are created on first use.
+        """
+        return rgb256_to_hex(self._rgba256_lookup)
+
+    def _lookup_index(self, x: FloatArrayLike) -> NDArray[np.intp]:
+        """
+        Position of x in the 256 color lookups
+        """
+        # A scalar gives a single color, as a list like the others
+        x = np.atleast_1d(x)
+        return np.round((x * 255) + ROUNDING_JITTER).astype(np.intp)
+
+    def _generate_colors(self, x: FloatArrayLike) -> NDArrayStr:
         """
         Lookup colors in the interpolated ranges
 
@@ -40,12 +79,19 @@ class _InterpolatedGen(ColorMap):
             Values in the range [0, 1]. O maps to the start of the
             gradient, and 1 to the end of the gradient.
         """
-        x = np.asarray(x)
-        idx = np.round((x * 255) + ROUNDING_JITTER).astype(int)
-        arr = np.column_stack(
-            [self._r_lookup[idx], self._g_lookup[idx], self._b_lookup[idx]],
-        )
-        return [rgb_to_hex(c) for c in arr]
+        return self._hex_lookup[self._lookup_index(x)]
+
+    def _generate_rgba256(self, x: FloatArrayLike) -> NDArray[np.uint8]:
+        """
+        Lookup 8 bit RGBA colors in the interpolated ranges
+
+        Parameters
+        ----------
+        x :
+            Values in the range [0, 1]. O maps to the start of the
+            gradient, and 1 to the end of the gradient.
+        """
+        return self._rgba256_lookup[self._lookup_index(x)]
 
 
 @dataclass
@@ -1,18 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 import numpy as np
 
-from ..hsluv import hex_to_rgb, rgb_to_hex
+from .._hex import float_to_rgb256, rgb256_to_hex
+from ..hsluv import hex_to_rgb
 from ._colormap import ColorMap, ColorMapKind
 
 if TYPE_CHECKING:
     from typing import Sequence
 
+    from numpy.typing import NDArray
+
     from mizani.typing import (
         FloatArrayLike,
+        NDArrayStr,
         RGBColor,
         RGBColorArray,
         RGBHexColor,
@@ -46,7 +51,35 @@ class ListedMap(ColorMap):
         self.n = len(colors)
         self._data = np.asarray(colors)
 
-    def _generate_colors(self, x: FloatArrayLike) -> Sequence[RGBHexColor]:
+    @cached_property
+    def _rgba256_lookup(self) -> NDArray[np.uint8]:
+        """
+        The colors of the map as 8 bit RGBA values
+
+        The colors are created on first use.
+        """
+        rgba = np.column_stack([self._data[:, :3], np.ones(self.n)])
+        return float_to_rgb256(rgba)
+
+    @cached_property
+    def _hex_lookup(self) -> NDArrayStr:
+        """
+        The colors of the map as hex strings
+
+        The colors are created on first use.
+        """
+        return rgb256_to_hex(self._rgba256_lookup)
+
+    def _lookup_index(self, x: FloatArrayLike) -> NDArray[np.intp]:
+        """
+        Position of x in the color lookups
+        """
+        # A scalar gives a single color, as a list like the others
+        x = np.atleast_1d(x)
+        idx = (x * self.n).astype(np.intp)
+        return np.clip(idx, 0, self.n - 1)
+
+    def _generate_colors(self, x: FloatArrayLike) -> NDArrayStr:
         """
         Lookup colors in the interpolated ranges
 
@@ -56,9 +89,16 @@ class ListedMap(ColorMap):
             Values in the range [0, 1]. O maps to the start of the
             gradient, and 1 to the end of the gradient.
         """
-        x = np.asarray(x)
-        idx = (x * self.n).astype(int)
-        idx[idx < 0] = 0
-        idx[idx >= self.n] = self.n - 1
-        arr = self._data.take(idx, axis=0, mode="clip")
-        return [rgb_to_hex(c) for c in arr]
+        return self._hex_lookup[self._lookup_index(x)]
+
+    def _generate_rgba256(self, x: FloatArrayLike) -> NDArray[np.uint8]:
+        """
+        Lookup 8 bit RGBA colors
+
+        Parameters
+        ----------
+        x :
+            Values in the range [0, 1]. O maps to the start of the
+            gradient, and 1 to the end of the gradient.
+        """
+        return self._rgba256_lookup[self._lookup_index(x)]
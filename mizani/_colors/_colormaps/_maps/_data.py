@@ -0,0 +1,67 @@
+"""
+Colors of the listed and segment interpolated colormaps
+
+The colors are stored as float64 arrays in ``colormaps.npz``, which
+sits next to this module. The arrays of a listed colormap are under
+``listed/<name>`` and have shape (n, 3). Those of a segment
+interpolated colormap are under ``segmented/<name>/red``,
+``segmented/<name>/green`` and ``segmented/<name>/blue``, and have
+the (n, 3) shape of the rows in matplotlib's LinearSegmentedColormap
+data.
+
+The file is read once, when the first of these colormaps is
+created, and each array is only decoded when its colormap is
+created. The file is written by ``tools/colormaps_npz.py``; to add
+a colormap, add it to the ``_kinds`` of its module and run the
+script.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from importlib.resources import files
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.lib.npyio import NpzFile
+
+    from mizani.typing import RGBColorArray, SegmentedColorMapData
+
+__all__ = (
+    "get_listed_colors",
+    "get_segmented_data",
+)
+
+DATA_FILE = "colormaps.npz"
+
+
+@cache
+def _colormap_data() -> NpzFile:
+    """
+    The colormap data file
+    """
+    package = __name__.rpartition(".")[0]
+    contents = files(package).joinpath(DATA_FILE).read_bytes()
+    return np.load(BytesIO(contents))
+
+
+def get_listed_colors(name: str) -> RGBColorArray:
+    """
+    Return the colors of a listed colormap
+    """
+    return _colormap_data()[f"listed/{name}"]
+
+
+def get_segmented_data(name: str) -> SegmentedColorMapData:
+    """
+    Return the data of a segment interpolated colormap
+    """
+    data = _colormap_data()
+    return {
+        "red": data[f"segmented/{name}/red"],
+        "green": data[f"segmented/{name}/green"],
+        "blue": data[f"segmented/{name}/blue"],
+    }
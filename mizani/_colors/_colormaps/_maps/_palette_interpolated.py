@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from mizani._colors._palettes.brewer import (
     diverging,
     qualitative,
@@ -7,6 +11,9 @@ from mizani._colors._palettes.other import (
     qualitative as other_qualitative,
 )
 
+if TYPE_CHECKING:
+    from mizani._colors._colormaps import PaletteInterpolatedMap
+
 __all__ = (
     # diverging
     "BrBG",
@@ -60,54 +67,116 @@ __all__ = (
     "tab20c",
 )
 
-BrBG = diverging.BrBG.colormap
-PiYG = diverging.PiYG.colormap
-PRGn = diverging.PRGn.colormap
-PuOr = diverging.PuOr.colormap
-RdBu = diverging.RdBu.colormap
-RdGy = diverging.RdGy.colormap
-RdYlBu = diverging.RdYlBu.colormap
-RdYlGn = diverging.RdYlGn.colormap
-Spectral = diverging.Spectral.colormap
+# The colormaps are created when first used, by __getattr__
+if TYPE_CHECKING:
+    # diverging
+    BrBG: PaletteInterpolatedMap
+    PiYG: PaletteInterpolatedMap
+    PRGn: PaletteInterpolatedMap
+    PuOr: PaletteInterpolatedMap
+    RdBu: PaletteInterpolatedMap
+    RdGy: PaletteInterpolatedMap
+    RdYlBu: PaletteInterpolatedMap
+    RdYlGn: PaletteInterpolatedMap
+    Spectral: PaletteInterpolatedMap
+    # qualitative
+    Accent: PaletteInterpolatedMap
+    Dark2: PaletteInterpolatedMap
+    Paired: PaletteInterpolatedMap
+    Pastel1: PaletteInterpolatedMap
+    Pastel2: PaletteInterpolatedMap
+    Set1: PaletteInterpolatedMap
+    Set2: PaletteInterpolatedMap
+    Set3: PaletteInterpolatedMap
+    # sequential
+    Blues: PaletteInterpolatedMap
+    BuGn: PaletteInterpolatedMap
+    BuPu: PaletteInterpolatedMap
+    GnBu: PaletteInterpolatedMap
+    Greens: PaletteInterpolatedMap
+    Greys: PaletteInterpolatedMap
+    Oranges: PaletteInterpolatedMap
+    OrRd: PaletteInterpolatedMap
+    PuBu: PaletteInterpolatedMap
+    PuBuGn: PaletteInterpolatedMap
+    PuRd: PaletteInterpolatedMap
+    Purples: PaletteInterpolatedMap
+    RdPu: PaletteInterpolatedMap
+    Reds: PaletteInterpolatedMap
+    YlGn: PaletteInterpolatedMap
+    YlGnBu: PaletteInterpolatedMap
+    YlOrBr: PaletteInterpolatedMap
+    YlOrRd: PaletteInterpolatedMap
+    # qualitative
+    category10: PaletteInterpolatedMap
+    category20: PaletteInterpolatedMap
+    category20b: PaletteInterpolatedMap
+    category20c: PaletteInterpolatedMap
+    observable10: PaletteInterpolatedMap
+    tableau10: PaletteInterpolatedMap
+    tableau20: PaletteInterpolatedMap
+    tab10: PaletteInterpolatedMap
+    tab20: PaletteInterpolatedMap
+    tab20b: PaletteInterpolatedMap
+    tab20c: PaletteInterpolatedMap
 
-Accent = qualitative.Accent.colormap
-Dark2 = qualitative.Dark2.colormap
-Paired = qualitative.Paired.colormap
-Pastel1 = qualitative.Pastel1.colormap
-Pastel2 = qualitative.Pastel2.colormap
-Set1 = qualitative.Set1.colormap
-Set2 = qualitative.Set2.colormap
-Set3 = qualitative.Set3.colormap
+_palettes = {
+    "BrBG": diverging.BrBG,
+    "PiYG": diverging.PiYG,
+    "PRGn": diverging.PRGn,
+    "PuOr": diverging.PuOr,
+    "RdBu": diverging.RdBu,
+    "RdGy": diverging.RdGy,
+    "RdYlBu": diverging.RdYlBu,
+    "RdYlGn": diverging.RdYlGn,
+    "Spectral": diverging.Spectral,
+    "Accent": qualitative.Accent,
+    "Dark2": qualitative.Dark2,
+    "Paired": qualitative.Paired,
+    "Pastel1": qualitative.Pastel1,
+    "Pastel2": qualitative.Pastel2,
+    "Set1": qualitative.Set1,
+    "Set2": qualitative.Set2,
+    "Set3": qualitative.Set3,
+    "Blues": sequential.Blues,
+    "BuGn": sequential.BuGn,
+    "BuPu": sequential.BuPu,
+    "GnBu": sequential.GnBu,
+    "Greens": sequential.Greens,
+    "Greys": sequential.Greys,
+    "Oranges": sequential.Oranges,
+    "OrRd": sequential.OrRd,
+    "PuBu": sequential.PuBu,
+    "PuBuGn": sequential.PuBuGn,
+    "PuRd": sequential.PuRd,
+    "Purples": sequential.Purples,
+    "RdPu": sequential.RdPu,
+    "Reds": sequential.Reds,
+    "YlGn": sequential.YlGn,
+    "YlGnBu": sequential.YlGnBu,
+    "YlOrBr": sequential.YlOrBr,
+    "YlOrRd": sequential.YlOrRd,
+    "category10": other_qualitative.category10,
+    "category20": other_qualitative.category20,
+    "category20b": other_qualitative.category20b,
+    "category20c": other_qualitative.category20c,
+    "observable10": other_qualitative.observable10,
+    "tableau10": other_qualitative.tableau10,
+    "tableau20": other_qualitative.tableau20,
+    # Aliases to accomodate the names of the vega colormaps
+    # according to matplotlib
+    "tab10": other_qualitative.category10,
+    "tab20": other_qualitative.category20,
+    "tab20b": other_qualitative.category20b,
+    "tab20c": other_qualitative.category20c,
+}
 
-Blues = sequential.Blues.colormap
-BuGn = sequential.BuGn.colormap
-BuPu = sequential.BuPu.colormap
-GnBu = sequential.GnBu.colormap
-Greens = sequential.Greens.colormap
-Greys = sequential.Greys.colormap
-Oranges = sequential.Oranges.colormap
-OrRd = sequential.OrRd.colormap
-PuBu = sequential.PuBu.colormap
-PuBuGn = sequential.PuBuGn.colormap
-PuRd = sequential.PuRd.colormap
-Purples = sequential.Purples.colormap
-RdPu = sequential.RdPu.colormap
-Reds = sequential.Reds.colormap
-YlGn = sequential.YlGn.colormap
-YlGnBu = sequential.YlGnBu.colormap
-YlOrBr = sequential.YlOrBr.colormap
-YlOrRd = sequential.YlOrRd.colormap
 
-category10 = other_qualitative.category10.colormap
-category20 = other_qualitative.category20.colormap
-category20b = other_qualitative.category20b.colormap
-category20c = other_qualitative.category20c.colormap
-observable10 = other_qualitative.observable10.colormap
-tableau10 = other_qualitative.tableau10.colormap
-tableau20 = other_qualitative.tableau20.colormap
-# Aliases to accomodate the names of the vega colormaps
-# according to matplotlib
-tab10 = other_qualitative.category10.colormap
-tab20 = other_qualitative.category20.colormap
-tab20b = other_qualitative.category20b.colormap
-tab20c = other_qualitative.category20c.colormap
+def __getattr__(name: str) -> PaletteInterpolatedMap:
+    # The colormaps are created when first used
+    try:
+        palette = _palettes[name]
+    except KeyError as err:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from err
+    return palette.colormap
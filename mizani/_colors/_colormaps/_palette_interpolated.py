@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import numpy as np
-
 from ._interpolated import InterpolatedMap
 
 if TYPE_CHECKING:
@@ -16,7 +14,7 @@ class PaletteInterpolatedMap(InterpolatedMap):
     """
 
     def __init__(self, palette: palette):
-        colors = np.asarray(palette.swatches[-1], dtype=float) / 255
+        colors = palette.swatch_arrays[-1] / 255
         super().__init__(colors, kind=palette.kind)
         self.palette = palette
 
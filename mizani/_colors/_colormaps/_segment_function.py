@@ -5,15 +5,13 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
-from ..hsluv import rgb_to_hex
+from .._hex import rgb_to_hex_array
 from ._colormap import ColorMap, ColorMapKind
 
 if TYPE_CHECKING:
-    from typing import Sequence
-
     from mizani.typing import (
         FloatArrayLike,
-        RGBHexColor,
+        NDArrayStr,
         SegmentFunctionColorMapData,
     )
 
@@ -30,7 +28,7 @@ class SegmentFunctionMap(ColorMap):
     data: SegmentFunctionColorMapData
     kind: ColorMapKind = ColorMapKind.miscellaneous
 
-    def _generate_colors(self, x: FloatArrayLike) -> Sequence[RGBHexColor]:
+    def _generate_colors(self, x: FloatArrayLike) -> NDArrayStr:
         x = np.asarray(x)
         arr = np.column_stack(
             [
@@ -39,4 +37,4 @@ class SegmentFunctionMap(ColorMap):
                 self.data["green"](x),
             ]
         )
-        return [rgb_to_hex(c) for c in arr]
+        return rgb_to_hex_array(arr)
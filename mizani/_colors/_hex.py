@@ -0,0 +1,132 @@
+"""
+Bulk conversion of RGB color arrays to hex strings
+
+The scalar conversion (:func:`mizani._colors.hsluv.rgb_to_hex`) does
+a string format per color. When mapping millions of values onto a
+colormap, that is where most of the time goes. The functions here
+quantize the colors to 8 bit channels and assemble the hex strings
+from a table of precomputed digits so that the work stays in numpy.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+
+__all__ = (
+    "float_to_rgb256",
+    "hex_to_rgb256",
+    "rgb256_to_hex",
+    "rgb_to_hex_array",
+)
+
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+_SPACE256 = np.arange(256)
+
+# ASCII codes of the two (lowercase) hex digits for each value in
+# the range [0, 255]. Shape is (256, 2).
+_HEX_TABLE = np.column_stack(
+    [_HEX_DIGITS[_SPACE256 >> 4], _HEX_DIGITS[_SPACE256 & 0xF]]
+)
+
+# Value of each hex digit (lower or upper case) indexed by its
+# ASCII code
+_HEX_VALUES = np.zeros(256, dtype=np.uint8)
+_HEX_VALUES[_HEX_DIGITS] = np.arange(16)
+_HEX_VALUES[np.frombuffer(b"ABCDEF", dtype=np.uint8)] = np.arange(10, 16)
+
+
+def float_to_rgb256(rgb: ArrayLike) -> NDArray[np.uint8]:
+    """
+    Quantize color channels in the range [0, 1] to [0, 255]
+
+    The rounding is the same as that of
+    :func:`mizani._colors.hsluv.rgb_to_hex`, and values outside
+    the [0, 1] range are clipped.
+
+    Parameters
+    ----------
+    rgb :
+        Array of shape (n, 3) or (n, 4) with channel values in
+        the range [0, 1].
+    """
+    rgb = np.asarray(rgb, dtype=float)
+    rgb256 = np.floor(rgb * 255 + 0.5)
+    return np.clip(rgb256, 0, 255).astype(np.uint8)
+
+
+def rgb256_to_hex(rgb256: ArrayLike) -> NDArray[np.str_]:
+    """
+    Convert 8 bit RGB(A) colors to hex strings
+
+    Parameters
+    ----------
+    rgb256 :
+        Array of shape (n, 3) or (n, 4) with integer channel values
+        in the range [0, 255]. Only the first 3 channels are encoded.
+
+    Returns
+    -------
+    out :
+        Array of dtype ``U7`` with colors of the form ``"#rrggbb"``.
+    """
+    rgb256 = np.asarray(rgb256, dtype=np.uint8)
+    n = len(rgb256)
+    buf = np.empty((n, 7), dtype=np.uint8)
+    buf[:, 0] = ord("#")
+    buf[:, 1:] = _HEX_TABLE[rgb256[:, :3]].reshape(n, 6)
+    return buf.view("S7").ravel().astype("U7")
+
+
+def rgb_to_hex_array(rgb: ArrayLike) -> NDArray[np.str_]:
+    """
+    Convert RGB(A) colors to hex strings
+
+    Parameters
+    ----------
+    rgb :
+        Array of shape (n, 3) or (n, 4) with channel values in
+        the range [0, 1].
+
+    Returns
+    -------
+    out :
+        Array of dtype ``U7`` with colors of the form ``"#rrggbb"``.
+
+    Examples
+    --------
+    >>> rgb_to_hex_array([[1, 0, 0], [0, 0.5, 1]])
+    array(['#ff0000', '#0080ff'], dtype='<U7')
+    """
+    return rgb256_to_hex(float_to_rgb256(rgb))
+
+
+def hex_to_rgb256(hex_colors: ArrayLike) -> NDArray[np.uint8]:
+    """
+    Convert hex colors to 8 bit RGB values
+
+    Parameters
+    ----------
+    hex_colors :
+        Colors of the form ``"#rrggbb"``.
+
+    Returns
+    -------
+    out :
+        Array of shape (n, 3) with the channel values.
+
+    Examples
+    --------
+    >>> hex_to_rgb256(["#ff0000", "#0080FF"])
+    array([[255,   0,   0],
+           [  0, 128, 255]], dtype=uint8)
+    """
+    hex_colors = np.ascontiguousarray(hex_colors, dtype="S7")
+    digits = _HEX_VALUES[hex_colors.view(np.uint8).reshape(-1, 7)[:, 1:]]
+    rgb256 = (digits[:, ::2] << 4) | digits[:, 1::2]
+    return rgb256.astype(np.uint8, copy=False)
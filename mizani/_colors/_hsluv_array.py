@@ -0,0 +1,301 @@
+"""
+Array versions of the HSLuv color space conversions
+
+The functions in :mod:`mizani._colors.hsluv` convert a single color
+at a time. The functions here convert arrays of shape (n, 3), with a
+color in each row, following the same steps (and the same order of
+floating point operations) so that the results agree to within
+1e-10, or to 1e-12 relative for the large saturations of colors
+outside the gamut.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ._hex import hex_to_rgb256, rgb_to_hex_array
+from .hsluv import (
+    _epsilon,
+    _kappa,
+    _m,
+    _m_inv,
+    _ref_u,
+    _ref_v,
+    _ref_y,
+)
+
+if TYPE_CHECKING:
+    from typing import TypeAlias
+
+    from numpy.typing import ArrayLike, NDArray
+
+    # An array of shape (n, 3)
+    TripletArray: TypeAlias = NDArray[np.float64]
+    FloatArray: TypeAlias = NDArray[np.float64]
+
+
+__all__ = (
+    "hex_to_hpluv_array",
+    "hex_to_hsluv_array",
+    "hpluv_to_hex_array",
+    "hpluv_to_lch_array",
+    "hpluv_to_rgb_array",
+    "hsluv_to_hex_array",
+    "hsluv_to_lch_array",
+    "hsluv_to_rgb_array",
+    "lch_to_hex_array",
+    "lch_to_hpluv_array",
+    "lch_to_hsluv_array",
+    "lch_to_luv_array",
+    "lch_to_rgb_array",
+    "luv_to_lch_array",
+    "luv_to_xyz_array",
+    "rgb_to_hpluv_array",
+    "rgb_to_hsluv_array",
+    "rgb_to_lch_array",
+    "rgb_to_xyz_array",
+    "xyz_to_luv_array",
+    "xyz_to_rgb_array",
+)
+
+# The coefficients of the 6 lines that bound the sRGB gamut in
+# the chroma-hue plane, two (t=0 and t=1) for each row of _m
+_M = np.array(_m)
+_M1 = np.repeat(_M[:, 0], 2)
+_M2 = np.repeat(_M[:, 1], 2)
+_M3 = np.repeat(_M[:, 2], 2)
+_T = np.tile([0, 1], 3)
+
+
+def _as_triplets(x: ArrayLike) -> TripletArray:
+    """
+    Convert input to a float array of shape (n, 3)
+    """
+    x = np.asarray(x, dtype=float)
+    return x.reshape(-1, 3)
+
+
+def _get_bounds(l: FloatArray) -> tuple[FloatArray, FloatArray]:
+    """
+    Slopes and intercepts of the gamut bounds for each lightness
+
+    Returns two arrays of shape (n, 6).
+    """
+    l = l[:, np.newaxis]
+    sub1 = ((l + 16) ** 3) / 1560896
+    sub2 = np.where(sub1 > _epsilon, sub1, l / _kappa)
+    top1 = (284517 * _M1 - 94839 * _M3) * sub2
+    top2 = (838422 * _M3 + 769860 * _M2 + 731718 * _M1) * l * sub2 - (
+        769860 * _T
+    ) * l
+    bottom = (632260 * _M3 - 126452 * _M2) * sub2 + 126452 * _T
+    return top1 / bottom, top2 / bottom
+
+
+def _max_safe_chroma_for_l(l: FloatArray) -> FloatArray:
+    slope, intercept = _get_bounds(l)
+    distance = np.abs(intercept) / np.sqrt(slope**2 + 1)
+    return distance.min(axis=1)
+
+
+def _max_chroma_for_lh(l: FloatArray, h: FloatArray) -> FloatArray:
+    slope, intercept = _get_bounds(l)
+    hrad = np.radians(h)[:, np.newaxis]
+    with np.errstate(divide="ignore"):
+        lengths = intercept / (np.sin(hrad) - slope * np.cos(hrad))
+    return np.where(lengths >= 0, lengths, np.inf).min(axis=1)
+
+
+def _dot_product(m: tuple[float, float, float], x: TripletArray) -> FloatArray:
+    return 0 + m[0] * x[:, 0] + m[1] * x[:, 1] + m[2] * x[:, 2]
+
+
+def _from_linear(c: FloatArray) -> FloatArray:
+    power = 1.055 * np.maximum(c, 0) ** (5 / 12) - 0.055
+    v = np.where(c <= 0.0031308, 12.92 * c, power)
+    return np.clip(v, 0, 1)
+
+
+def _to_linear(c: FloatArray) -> FloatArray:
+    power = ((np.maximum(c, 0) + 0.055) / 1.055) ** 2.4
+    v = np.where(c > 0.04045, power, c / 12.92)
+    return np.clip(v, 0, 1)
+
+
+def _y_to_l(y: FloatArray) -> FloatArray:
+    cube_root = 116 * ((np.maximum(y, 0) / _ref_y) ** (1 / 3)) - 16
+    return np.where(y <= _epsilon, y / _ref_y * _kappa, cube_root)
+
+
+def _l_to_y(l: FloatArray) -> FloatArray:
+    return np.where(
+        l <= 8, _ref_y * l / _kappa, _ref_y * (((l + 16) / 116) ** 3)
+    )
+
+
+def xyz_to_rgb_array(x: ArrayLike) -> TripletArray:
+    x = _as_triplets(x)
+    return np.column_stack([_from_linear(_dot_product(row, x)) for row in _m])
+
+
+def rgb_to_xyz_array(x: ArrayLike) -> TripletArray:
+    rgbl = _to_linear(_as_triplets(x))
+    return np.column_stack([_dot_product(row, rgbl) for row in _m_inv])
+
+
+def xyz_to_luv_array(x: ArrayLike) -> TripletArray:
+    x = _as_triplets(x)
+    X, Y, Z = x[:, 0], x[:, 1], x[:, 2]
+    l = _y_to_l(Y)
+    divider = X + 15 * Y + 3 * Z
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var_u = 4 * X / divider
+        var_v = 9 * Y / divider
+    u = 13 * l * (var_u - _ref_u)
+    v = 13 * l * (var_v - _ref_v)
+    res = np.column_stack([l, u, v])
+    res[l == 0] = 0
+    return res
+
+
+def luv_to_xyz_array(x: ArrayLike) -> TripletArray:
+    x = _as_triplets(x)
+    l, u, v = x[:, 0], x[:, 1], x[:, 2]
+    y = _l_to_y(l)
+    # Black (l == 0) is set below
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var_u = u / (13 * l) + _ref_u
+        var_v = v / (13 * l) + _ref_v
+        X = y * 9 * var_u / (4 * var_v)
+        Z = y * (12 - 3 * var_u - 20 * var_v) / (4 * var_v)
+    res = np.column_stack([X, y, Z])
+    res[l == 0] = 0
+    return res
+
+
+def luv_to_lch_array(x: ArrayLike) -> TripletArray:
+    x = _as_triplets(x)
+    l, u, v = x[:, 0], x[:, 1], x[:, 2]
+    c = np.hypot(u, v)
+    h = np.degrees(np.arctan2(v, u))
+    h = np.where(h < 0, h + 360, h)
+    h[c < 1e-08] = 0
+    return np.column_stack([l, c, h])
+
+
+def lch_to_luv_array(x: ArrayLike) -> TripletArray:
+    x = _as_triplets(x)
+    l, c, h = x[:, 0], x[:, 1], x[:, 2]
+    hrad = np.radians(h)
+    return np.column_stack([l, np.cos(hrad) * c, np.sin(hrad) * c])
+
+
+def _lightness_limits(l: FloatArray) -> tuple[NDArray[np.bool_], ...]:
+    """
+    Masks of the white, black and other colors
+    """
+    white = l > 100 - 1e-7
+    black = ~white & (l < 1e-08)
+    return white, black, ~(white | black)
+
+
+def hsluv_to_lch_array(x: ArrayLike) -> TripletArray:
+    x = _as_triplets(x)
+    h, s, l = x[:, 0], x[:, 1], x[:, 2]
+    white, black, other = _lightness_limits(l)
+    c = np.zeros(len(x))
+    c[other] = _max_chroma_for_lh(l[other], h[other]) / 100 * s[other]
+    l = np.where(white, 100, np.where(black, 0, l))
+    return np.column_stack([l, c, h])
+
+
+def lch_to_hsluv_array(x: ArrayLike) -> TripletArray:
+    x = _as_triplets(x)
+    l, c, h = x[:, 0], x[:, 1], x[:, 2]
+    white, black, other = _lightness_limits(l)
+    s = np.zeros(len(x))
+    s[other] = c[other] / _max_chroma_for_lh(l[other], h[other]) * 100
+    l = np.where(white, 100, np.where(black, 0, l))
+    return np.column_stack([h, s, l])
+
+
+def hpluv_to_lch_array(x: ArrayLike) -> TripletArray:
+    x = _as_triplets(x)
+    h, s, l = x[:, 0], x[:, 1], x[:, 2]
+    white, black, other = _lightness_limits(l)
+    c = np.zeros(len(x))
+    c[other] = _max_safe_chroma_for_l(l[other]) / 100 * s[other]
+    l = np.where(white, 100, np.where(black, 0, l))
+    return np.column_stack([l, c, h])
+
+
+def lch_to_hpluv_array(x: ArrayLike) -> TripletArray:
+    x = _as_triplets(x)
+    l, c, h = x[:, 0], x[:, 1], x[:, 2]
+    white, black, other = _lightness_limits(l)
+    s = np.zeros(len(x))
+    s[other] = c[other] / _max_safe_chroma_for_l(l[other]) * 100
+    l = np.where(white, 100, np.where(black, 0, l))
+    return np.column_stack([h, s, l])
+
+
+def lch_to_rgb_array(x: ArrayLike) -> TripletArray:
+    return xyz_to_rgb_array(luv_to_xyz_array(lch_to_luv_array(x)))
+
+
+def rgb_to_lch_array(x: ArrayLike) -> TripletArray:
+    return luv_to_lch_array(xyz_to_luv_array(rgb_to_xyz_array(x)))
+
+
+def hsluv_to_rgb_array(x: ArrayLike) -> TripletArray:
+    # Rounded like hsluv.hsluv_to_rgb
+    return np.round(lch_to_rgb_array(hsluv_to_lch_array(x)), 10)
+
+
+def rgb_to_hsluv_array(x: ArrayLike) -> TripletArray:
+    return lch_to_hsluv_array(rgb_to_lch_array(x))
+
+
+def hpluv_to_rgb_array(x: ArrayLike) -> TripletArray:
+    # Rounded like hsluv.hpluv_to_rgb
+    return np.round(lch_to_rgb_array(hpluv_to_lch_array(x)), 10)
+
+
+def rgb_to_hpluv_array(x: ArrayLike) -> TripletArray:
+    return lch_to_hpluv_array(rgb_to_lch_array(x))
+
+
+def hsluv_to_hex_array(x: ArrayLike) -> NDArray[np.str_]:
+    return rgb_to_hex_array(hsluv_to_rgb_array(x))
+
+
+def hpluv_to_hex_array(x: ArrayLike) -> NDArray[np.str_]:
+    return rgb_to_hex_array(hpluv_to_rgb_array(x))
+
+
+def lch_to_hex_array(x: ArrayLike) -> NDArray[np.str_]:
+    """
+    Convert LCh colors to hex strings
+
+    Parameters
+    ----------
+    x :
+        Array of shape (n, 3) with the lightness, chroma and hue
+        (in degrees) of the colors.
+
+    Examples
+    --------
+    >>> lch_to_hex_array([[65, 100, 15], [65, 100, 135]])
+    array(['#f8766d', '#00ba38'], dtype='<U7')
+    """
+    return rgb_to_hex_array(lch_to_rgb_array(x))
+
+
+def hex_to_hsluv_array(x: ArrayLike) -> TripletArray:
+    return rgb_to_hsluv_array(hex_to_rgb256(x) / 255.0)
+
+
+def hex_to_hpluv_array(x: ArrayLike) -> TripletArray:
+    return rgb_to_hpluv_array(hex_to_rgb256(x) / 255.0)
@@ -16,10 +16,14 @@ from dataclasses import dataclass, field
 from functools import cached_property
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from .._colormaps import PaletteInterpolatedMap
 from .._colormaps._colormap import ColorMapKind
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
     from mizani.typing import (
         RGB256Color,
         RGB256Swatch,
@@ -63,8 +67,43 @@ class palette:
         """
         Get a swatch with given number of colors in hex
         """
-        swatch = self.get_swatch(num_colors)
-        return RGB256Swatch_to_RGBHexSwatch(swatch)
+        index = num_colors - self.min_colors
+        return list(self.hex_swatches[index])
+
+    def get_swatch_array(self, num_colors: int) -> NDArray[np.uint8]:
+        """
+        Get a swatch with given number of colors as a uint8 array
+
+        The array has shape (num_colors, 3) and is read-only.
+        """
+        index = num_colors - self.min_colors
+        return self.swatch_arrays[index]
+
+    @cached_property
+    def hex_swatches(self) -> tuple[tuple[RGBHexColor, ...], ...]:
+        """
+        All the swatches in hex
+
+        They are created when first used.
+        """
+        return tuple(
+            tuple(RGB256Swatch_to_RGBHexSwatch(swatch))
+            for swatch in self.swatches
+        )
+
+    @cached_property
+    def swatch_arrays(self) -> tuple[NDArray[np.uint8], ...]:
+        """
+        All the swatches as read-only uint8 arrays of shape (n, 3)
+
+        They are created when first used.
+        """
+        arrays = []
+        for swatch in self.swatches:
+            arr = np.array(swatch, dtype=np.uint8).reshape(-1, 3)
+            arr.flags.writeable = False
+            arrays.append(arr)
+        return tuple(arrays)
 
     @cached_property
     def colormap(self) -> PaletteInterpolatedMap:
@@ -25,9 +25,12 @@ class _color_lookup(dict):
 class _colormap_lookup(dict[str, ColorMap]):
     """
     Lookup (by name) for all available colormaps
+
+    A colormap is created the first time it is looked up.
     """
 
     d: dict[str, ColorMap] = {}
+    modules: dict[str, ModuleType] = {}
 
     def _lazy_init(self):
         from ._colormaps._maps import (
@@ -38,10 +41,11 @@ class _colormap_lookup(dict[str, ColorMap]):
             _segment_interpolated,
         )
 
-        def _get(mod: ModuleType) -> dict[str, ColorMap]:
-            return {name: getattr(mod, name) for name in mod.__all__}
+        def _get(mod: ModuleType) -> dict[str, ModuleType]:
+            return dict.fromkeys(mod.__all__, mod)
 
-        self.d = {
+        self.d = {}
+        self.modules = {
             **_get(_interpolated),
             **_get(_listed),
             **_get(_palette_interpolated),
@@ -50,14 +54,22 @@ class _colormap_lookup(dict[str, ColorMap]):
         }
 
     def __getitem__(self, name: str) -> ColorMap:
-        if not self.d:
+        try:
+            return self.d[name]
+        except KeyError:
+            pass
+
+        if not self.modules:
             self._lazy_init()
 
         try:
-            return self.d[name]
+            mod = self.modules[name]
         except KeyError as err:
             raise ValueError(f"Unknown colormap: {name}") from err
 
+        cmap = self.d[name] = getattr(mod, name)
+        return cmap
+
 
 NAMED_COLORS = _color_lookup(**SHORT, **CSS4, **XKCD, **CRAYON, **TABLEAU)
 
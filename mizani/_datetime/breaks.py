@@ -1,12 +1,10 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from functools import cached_property
 from typing import TYPE_CHECKING, cast
 
-import dateutil.rrule as rr
 import numpy as np
-from dateutil.rrule import rrule
 
 from mizani._datetime.utils import (
     PerSecond,
@@ -17,11 +15,13 @@ from mizani._datetime.utils import (
 from ..utils import forward_fill, round_any, trim_breaks
 
 if TYPE_CHECKING:
+    from datetime import tzinfo
     from typing import Sequence
 
     from mizani.typing import (
         DatetimeOffset,
         DatetimeWidthUnits,
+        NDArrayDatetime,
     )
 
     from .types import DateTimeRounder
@@ -31,22 +31,16 @@ __all__ = (
     "by_width",
 )
 
-MICROSECONDLY = 7
 per_sec = PerSecond()
 
-FREQ_LOOKUP: dict[DatetimeWidthUnits, int] = {
-    "microseconds": MICROSECONDLY,
-    "seconds": rr.SECONDLY,
-    "minutes": rr.MINUTELY,
-    "hours": rr.HOURLY,
-    "days": rr.DAILY,
-    "weeks": rr.WEEKLY,
-    "months": rr.MONTHLY,
-    "years": rr.YEARLY,
-}
-
-FREQ_LOOKUP_INV: dict[int, DatetimeWidthUnits] = {
-    code: unit for unit, code in FREQ_LOOKUP.items()
+# numpy codes of the units with a fixed width
+TIMEDELTA64_UNITS: dict[DatetimeWidthUnits, str] = {
+    "microseconds": "us",
+    "seconds": "s",
+    "minutes": "m",
+    "hours": "h",
+    "days": "D",
+    "weeks": "W",
 }
 
 
@@ -142,32 +136,27 @@ class Helper:
         span = (limits[1] - limits[0]).total_seconds()
         ns = span / np.array(H.intervals_sec)
         idx = cast("int", np.argmin(np.abs(ns - n)))
-        freq, rounding = self.freq[idx], self.rounders[idx]
+        units, rounding = self.units[idx], self.rounders[idx]
         interval = self.intervals[idx]
-        units = FREQ_LOOKUP_INV[freq]
         if units == "microseconds":
             return microsecondly_breaks(limits, interval)
 
-        bymonthday = None
-
-        # Reinterprete any float intervals in the declarations as integers.
-        # e.g. half-month intervals becomes daily interval with the 1st & 15th
-        # of the month as the only permitted days.
-        if isinstance(interval, float):
-            if (interval, freq) == (0.5, rr.MONTHLY):
-                interval = 1
-                freq = rr.DAILY
-                bymonthday = (1, 15)
-            assert isinstance(interval, int), (
-                f"{interval=} should be an integer"
-            )
+        # Half-month intervals are the 1st & 15th of the month
+        half_month = (interval, units) == (0.5, "months")
 
         # Add a padding the end limit so that the generated breaks include
-        pad = as_relativedelta(f"{interval} {units}")
-        dtstart = rounding.floor(limits[0])
-        until = rounding.ceil(limits[1] + pad)
-        r = rrule(freq, dtstart, interval, until=until, bymonthday=bymonthday)
-        return list(r)
+        pad = as_relativedelta(f"{1 if half_month else interval} {units}")
+        t0, t1 = round_limits(rounding, limits[0], limits[1] + pad)
+        tz = limits[0].tzinfo
+
+        if half_month:
+            firsts = datetime64_range(t0, t1, "months", 1)
+            fifteenths = firsts + np.timedelta64(14, "D")
+            breaks = np.sort(np.hstack([firsts, fifteenths[fifteenths <= t1]]))
+            return as_datetimes(breaks, tz)
+
+        assert isinstance(interval, int), f"{interval=} should be an integer"
+        return as_datetimes(datetime64_range(t0, t1, units, interval), tz)
 
     def breaks_given_width(
         self, limits: tuple[datetime, datetime], width: str
@@ -179,31 +168,30 @@ class Helper:
             return microsecondly_breaks(limits, interval)
 
         si_units = SI_LOOKUP[units]
-        freq = FREQ_LOOKUP[units]
         s = per_sec(interval, si_units)
         idx = int(np.array(H.intervals_sec).searchsorted(s))
         rounding = self.rounders[idx]
         pad = as_relativedelta(f"{interval} {units}")
-        dtstart = rounding.floor(limits[0])
-        until = rounding.ceil(limits[1] + pad)
-        r = rrule(freq, dtstart, interval, until=until)
-        return list(r)
+        t0, t1 = round_limits(rounding, limits[0], limits[1] + pad)
+        breaks = datetime64_range(t0, t1, units, interval)
+        return as_datetimes(breaks, limits[0].tzinfo)
 
     @cached_property
-    def freq(self) -> Sequence[int]:
+    def units(self) -> Sequence[DatetimeWidthUnits]:
         """
-        RRule frequency at each interval
+        Units of each interval
         """
-        return [
-            *(MICROSECONDLY,) * len(self.microseconds),
-            *(rr.SECONDLY,) * len(self.seconds),
-            *(rr.MINUTELY,) * len(self.minutes),
-            *(rr.HOURLY,) * len(self.hours),
-            *(rr.DAILY,) * len(self.days),
-            *(rr.WEEKLY,) * len(self.weeks),
-            *(rr.MONTHLY,) * len(self.months),
-            *(rr.YEARLY,) * len(self.years),
+        intervals: list[tuple[DatetimeWidthUnits, Sequence[float]]] = [
+            ("microseconds", self.microseconds),
+            ("seconds", self.seconds),
+            ("minutes", self.minutes),
+            ("hours", self.hours),
+            ("days", self.days),
+            ("weeks", self.weeks),
+            ("months", self.months),
+            ("years", self.years),
         ]
+        return [units for units, values in intervals for _ in values]
 
 
 H = Helper()
@@ -230,7 +218,8 @@ def by_width(
         offset = f"{offset} {units}"
     offset = as_relativedelta(offset)
     breaks = H.breaks_given_width(limits, width)
-    return [b + offset for b in trim_breaks(breaks, limits)]
+    breaks = trim_breaks(breaks, limits)
+    return [b + offset for b in breaks] if offset else list(breaks)
 
 
 def microsecondly_breaks(limits: tuple[datetime, datetime], interval: float):
@@ -243,11 +232,104 @@ def microsecondly_breaks(limits: tuple[datetime, datetime], interval: float):
     # Round the limits to times with good microsecond values
     u0 = int(round_any(l0.microsecond, interval, np.floor))
     u1 = int(round_any(l1.microsecond, interval, np.ceil))
-    start = l0.replace(microsecond=u0)
-    stop = l1.replace(microsecond=u1)
+    t0, t1 = wall_time(l0, l1)
+    start = t0 + np.timedelta64(u0 - l0.microsecond, "us")
+    stop = t1 + np.timedelta64(u1 - l1.microsecond, "us")
 
     # Find the number of breaks that fits into the new span
     # and generate the sequence of breaks.
-    span = (stop - start).total_seconds() * 1_000_000
-    n = int(np.ceil(span / interval)) + 1
-    return [start + timedelta(microseconds=interval * i) for i in range(n)]
+    span = (stop - start) // np.timedelta64(1, "us")
+    n = -(-span // interval) + 1
+    breaks = start + np.arange(n) * np.timedelta64(interval, "us")
+    return as_datetimes(breaks, l0.tzinfo)
+
+
+def wall_time(
+    start: datetime, until: datetime
+) -> tuple[np.datetime64, np.datetime64]:
+    """
+    Convert datetimes to datetime64 values of the clock time at start
+
+    If the datetimes have different timezones, until is first
+    converted to the timezone of start.
+    """
+    tz = start.tzinfo
+    if tz is not None and until.tzinfo is not None and until.tzinfo != tz:
+        until = until.astimezone(tz)
+    t0 = np.datetime64(start.replace(tzinfo=None), "us")
+    t1 = np.datetime64(until.replace(tzinfo=None), "us")
+    return t0, t1
+
+
+def round_limits(
+    rounding: DateTimeRounder, start: datetime, until: datetime
+) -> tuple[np.datetime64, np.datetime64]:
+    """
+    Round start down and until up, in the clock time of start
+
+    Returns
+    -------
+    out :
+        The rounded limits as datetime64 values of the clock time.
+    """
+    wall = np.array(wall_time(start, until))
+    return rounding.floor_array(wall)[0], rounding.ceil_array(wall)[1]
+
+
+def datetime64_range(
+    start: np.datetime64,
+    until: np.datetime64,
+    units: DatetimeWidthUnits,
+    interval: int,
+) -> NDArrayDatetime:
+    """
+    Datetimes at regular intervals from start up to and including until
+
+    Parameters
+    ----------
+    start :
+        First datetime
+    until :
+        Upper limit of the datetimes
+    units :
+        Units of the interval
+    interval :
+        Number of units between the datetimes
+
+    Returns
+    -------
+    out :
+        A datetime64[us] array.
+
+    Notes
+    -----
+    Months and years are calendar intervals. The datetimes have the
+    same day of the month and time as start, and months without that
+    day (e.g. February 30th) are skipped.
+    """
+    if units in TIMEDELTA64_UNITS:
+        step = np.timedelta64(interval, TIMEDELTA64_UNITS[units])
+        step = step.astype("timedelta64[us]")
+        n = max((until - start) // step + 1, 0)
+        return start + np.arange(n) * step
+
+    if units == "years":
+        interval *= 12
+
+    # Count the whole months, then move to the day and time of start
+    m0 = start.astype("datetime64[M]")
+    m1 = until.astype("datetime64[M]")
+    months = m0 + np.arange(0, (m1 - m0).astype(int) + 1, interval)
+    res = months.astype("datetime64[us]") + (start - m0)
+    res = res[(res.astype("datetime64[M]") == months) & (res <= until)]
+    return res
+
+
+def as_datetimes(x: NDArrayDatetime, tz: tzinfo | None) -> list[datetime]:
+    """
+    Convert datetime64 clock times to datetimes in timezone tz
+    """
+    res: list[datetime] = x.astype("datetime64[us]").tolist()
+    if tz is not None:
+        res = [d.replace(tzinfo=tz) for d in res]
+    return res
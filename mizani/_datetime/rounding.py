@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-from datetime import datetime, time, timedelta
-from typing import TYPE_CHECKING
+from datetime import datetime, time, timedelta, tzinfo
+from typing import TYPE_CHECKING, Callable
 
+import numpy as np
+import pandas as pd
 from dateutil.relativedelta import relativedelta
 
+from ..utils import has_dtype
 from .types import DateTimeRounder
 
 if TYPE_CHECKING:
-    pass
+    from mizani.typing import (
+        DatetimeArrayLike,
+        NDArrayDatetime,
+        NDArrayTimedelta,
+    )
 
 
 ONE_DAY = timedelta(days=1)
@@ -39,6 +46,20 @@ class microseconds(DateTimeRounder):
         """
         return d
 
+    @classmethod
+    def floor_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round down to the microsecond
+        """
+        return floor_array(x, "us")
+
+    @classmethod
+    def ceil_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round up to the microsecond
+        """
+        return ceil_array(x, "us")
+
 
 class seconds(DateTimeRounder):
     """
@@ -63,6 +84,20 @@ class seconds(DateTimeRounder):
             return d
         return cls.floor(d) + ONE_SECOND
 
+    @classmethod
+    def floor_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round down to the start of the second
+        """
+        return floor_array(x, "s")
+
+    @classmethod
+    def ceil_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round up to the next second
+        """
+        return ceil_array(x, "s")
+
 
 class minutes(DateTimeRounder):
     """
@@ -87,6 +122,20 @@ class minutes(DateTimeRounder):
             return d
         return cls.floor(d) + ONE_MINUTE
 
+    @classmethod
+    def floor_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round down to the start of the minute
+        """
+        return floor_array(x, "m")
+
+    @classmethod
+    def ceil_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round up to the start of the next minute
+        """
+        return ceil_array(x, "m")
+
 
 class hours(DateTimeRounder):
     """
@@ -111,6 +160,20 @@ class hours(DateTimeRounder):
             return d
         return cls.floor(d) + ONE_HOUR
 
+    @classmethod
+    def floor_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round down to the start of the hour
+        """
+        return floor_array(x, "h")
+
+    @classmethod
+    def ceil_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round up to the start of the next hour
+        """
+        return ceil_array(x, "h")
+
 
 class days(DateTimeRounder):
     """
@@ -131,6 +194,20 @@ class days(DateTimeRounder):
         """
         return cls.floor(d) + ONE_DAY if has_time(d) else d
 
+    @classmethod
+    def floor_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round down to the start of the day
+        """
+        return floor_array(x, "D")
+
+    @classmethod
+    def ceil_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round up to the start of the next day
+        """
+        return ceil_array(x, "D")
+
 
 class weeks(DateTimeRounder):
     """
@@ -152,6 +229,20 @@ class weeks(DateTimeRounder):
         d = days.ceil(d)
         return d + timedelta(days=(7 - d.weekday()) % 7)
 
+    @classmethod
+    def floor_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round down to the start (Monday) of the week
+        """
+        return floor_array(x, "W")
+
+    @classmethod
+    def ceil_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round up to the start of the next week
+        """
+        return ceil_array(x, "W")
+
 
 class months(DateTimeRounder):
     """
@@ -173,6 +264,20 @@ class months(DateTimeRounder):
         floor = cls.floor(d)
         return d if d == floor else floor + ONE_MONTH
 
+    @classmethod
+    def floor_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round down to the start of the month
+        """
+        return floor_array(x, "M")
+
+    @classmethod
+    def ceil_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round up to the start of the next month
+        """
+        return ceil_array(x, "M")
+
 
 class years(DateTimeRounder):
     """
@@ -194,6 +299,20 @@ class years(DateTimeRounder):
         floor = cls.floor(d)
         return d if d == floor else floor + ONE_YEAR
 
+    @classmethod
+    def floor_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round down to the start of the year
+        """
+        return floor_array(x, "Y")
+
+    @classmethod
+    def ceil_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round up to the start of the next year
+        """
+        return ceil_array(x, "Y")
+
 
 class decades(DateTimeRounder):
     """
@@ -215,6 +334,20 @@ class decades(DateTimeRounder):
         floor = cls.floor(d)
         return d if d == floor else floor.replace(floor.year + 10)
 
+    @classmethod
+    def floor_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round down to the start of the decade
+        """
+        return floor_array(x, "Y", 10)
+
+    @classmethod
+    def ceil_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round up to the start of the next decade
+        """
+        return ceil_array(x, "Y", 10)
+
 
 class centurys(DateTimeRounder):
     """
@@ -236,6 +369,20 @@ class centurys(DateTimeRounder):
         floor = cls.floor(d)
         return d if d == floor else floor.replace(floor.year + 100)
 
+    @classmethod
+    def floor_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round down to the start of the century
+        """
+        return floor_array(x, "Y", 100)
+
+    @classmethod
+    def ceil_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime:
+        """
+        Round up to the start of the next century
+        """
+        return ceil_array(x, "Y", 100)
+
 
 def has_time(d: datetime) -> bool:
     """
@@ -265,3 +412,140 @@ def at_the_minute(d: datetime) -> bool:
     """
     t = d.time()
     return t.second == 0 and t.microsecond == 0
+
+
+def floor_array(
+    x: DatetimeArrayLike, unit: str, n: int = 1
+) -> NDArrayDatetime:
+    """
+    Round down datetimes to multiples of a unit
+
+    Parameters
+    ----------
+    x :
+        Datetimes. Timezone aware datetimes are rounded in their
+        local (clock) time.
+    unit :
+        A numpy datetime unit code, ``"Y"``, ``"M"``, ``"W"``, ``"D"``,
+        ``"h"``, ``"m"``, ``"s"`` or ``"us"``. Weeks start on Monday.
+    n :
+        Number of units to round to. Only used for years, e.g. ``10``
+        for decades.
+
+    Returns
+    -------
+    out :
+        A datetime64 array. For timezone aware datetimes, it holds
+        the UTC instants of the rounded datetimes, as does the
+        ``values`` of a timezone aware :class:`pandas.DatetimeIndex`.
+    """
+    return _wall_clock_apply(x, lambda t: _floor64(t, unit, n))
+
+
+def ceil_array(x: DatetimeArrayLike, unit: str, n: int = 1) -> NDArrayDatetime:
+    """
+    Round up datetimes to multiples of a unit
+
+    See :func:`floor_array` for the parameters. Datetimes that are
+    already at a multiple of the unit are not changed.
+    """
+    return _wall_clock_apply(x, lambda t: _ceil64(t, unit, n))
+
+
+def _floor64(x: NDArrayDatetime, unit: str, n: int = 1) -> NDArrayDatetime:
+    """
+    Round down naive datetime64 values
+    """
+    if unit == "W":
+        days = x.astype("datetime64[D]")
+        # 1970-01-01 was a Thursday
+        weekday = (days.astype(np.int64) + 3) % 7
+        res = days - weekday.astype("timedelta64[D]")
+    else:
+        res = x.astype(f"datetime64[{unit}]")
+        if n > 1:
+            year = res.astype(np.int64) + 1970
+            res = res - (year % n).astype(f"timedelta64[{unit}]")
+    return res.astype(x.dtype)
+
+
+def _ceil64(x: NDArrayDatetime, unit: str, n: int = 1) -> NDArrayDatetime:
+    """
+    Round up naive datetime64 values
+    """
+    floor = _floor64(x, unit, n)
+    if unit == "W":
+        unit, n = "D", 7
+    step = np.timedelta64(n, unit)
+    up = (floor.astype(f"datetime64[{unit}]") + step).astype(x.dtype)
+    return np.where(x == floor, x, up)
+
+
+def _wall_clock_apply(
+    x: DatetimeArrayLike, func: Callable[[NDArrayDatetime], NDArrayDatetime]
+) -> NDArrayDatetime:
+    """
+    Apply a function to the clock times of datetimes
+
+    For timezone aware datetimes, the results are localized back into
+    the timezone and returned as UTC instants. A result with an
+    ambiguous clock time gets the UTC offset of the datetime it came
+    from, if that is one of the choices, and otherwise the first of
+    the choices.
+    """
+    if isinstance(x, np.ndarray) and x.dtype.kind == "M":
+        return func(x)
+
+    idx = pd.DatetimeIndex(x if has_dtype(x) else list(x))
+    if idx.tz is None:
+        return func(idx.to_numpy())
+
+    wall = pd.DatetimeIndex(func(idx.tz_localize(None).to_numpy()))
+    first = _localize(wall, idx.tz, ambiguous=True)
+    second = _localize(wall, idx.tz, ambiguous=False)
+    use_second = np.asarray(first != second) & (
+        _utcoffset(second) == _utcoffset(idx)
+    )
+    return first.where(~use_second, second).tz_convert(None).to_numpy()
+
+
+def _localize(
+    wall: pd.DatetimeIndex, tz: tzinfo, ambiguous: bool
+) -> pd.DatetimeIndex:
+    """
+    Localize clock times into a timezone the way datetime does
+
+    Parameters
+    ----------
+    wall :
+        Naive clock times
+    tz :
+        Timezone
+    ambiguous :
+        Whether an ambiguous clock time is the first of its two
+        instants.
+
+    Notes
+    -----
+    A clock time in a daylight saving gap does not exist. Like a
+    datetime, it gets the UTC offset from before the gap.
+    """
+    flags = np.full(len(wall), ambiguous)
+    res = wall.tz_localize(tz, ambiguous=flags, nonexistent="NaT")
+    gap = np.asarray(res.isna()) & np.asarray(wall.notna())
+    if not gap.any():
+        return res
+
+    before = wall[gap].tz_localize(
+        tz, ambiguous=flags[gap], nonexistent="shift_backward"
+    )
+    utc = res.tz_convert(None).to_numpy().copy()
+    utc[gap] = (wall[gap] - _utcoffset(before)).to_numpy()
+    return pd.DatetimeIndex(utc).tz_localize("UTC").tz_convert(tz)
+
+
+def _utcoffset(x: pd.DatetimeIndex) -> NDArrayTimedelta:
+    """
+    UTC offsets of timezone aware datetimes
+    """
+    return (x.tz_localize(None) - x.tz_convert(None)).to_numpy()
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
-    pass
+    from mizani.typing import DatetimeArrayLike, NDArrayDatetime
 
 
 class DateTimeRounder(Protocol):
@@ -17,3 +17,9 @@ class DateTimeRounder(Protocol):
 
     @classmethod
     def ceil(cls, d: datetime) -> datetime: ...
+
+    @classmethod
+    def floor_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime: ...
+
+    @classmethod
+    def ceil_array(cls, x: DatetimeArrayLike) -> NDArrayDatetime: ...
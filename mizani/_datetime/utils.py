@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import re
 from datetime import date, datetime, timedelta, tzinfo
 from typing import TYPE_CHECKING, cast, overload
 from zoneinfo import ZoneInfo
 
 import numpy as np
+import pandas as pd
 from dateutil.relativedelta import relativedelta
 
+from ..utils import has_dtype
+
 if TYPE_CHECKING:
     from typing import Sequence, TypeVar
 
+    from numpy.typing import NDArray
+    from pandas.arrays import DatetimeArray
+
     from mizani.typing import (
         Datetime,
         DatetimeOffset,
@@ -17,6 +24,7 @@ if TYPE_CHECKING:
         FloatArrayLike,
         NDArrayDatetime,
         NDArrayFloat,
+        NDArrayStr,
         SeqDatetime,
         TimeIntervalSIUnits,
     )
@@ -32,8 +40,14 @@ MICROSECONDS_PER_DAY = SECONDS_PER_DAY * (10**6)
 NaT_int = np.datetime64("NaT").astype(np.int64)
 MIN_DATETIME64 = np.datetime64("0001-01-01")
 MAX_DATETIME64 = np.datetime64("10000-01-01")
+# The range of num_to_datetime in microseconds since the epoch
+MIN_MICROSECONDS = int((MIN_DATETIME64 - EPOCH64) // np.timedelta64(1, "us"))
+MAX_MICROSECONDS = int((MAX_DATETIME64 - EPOCH64) // np.timedelta64(1, "us"))
 UTC = ZoneInfo("UTC")
 
+# The strftime directives that strftime_array can format
+STRFTIME_DIRECTIVES = set("YymdHIMSfjbBaAp%")
+
 
 class PerSecond:
     """
@@ -62,45 +76,6 @@ class PerSecond:
             return type(x)((value * s_per_unit for value in x))  # pyright: ignore[reportCallIssue]
 
 
-def _from_ordinalf(x: float, tz: tzinfo | None) -> datetime:
-    """
-    Convert float array to datetime
-    """
-    dt64 = EPOCH64 + np.timedelta64(
-        int(np.round(x * MICROSECONDS_PER_DAY)), "us"
-    )
-    if not (MIN_DATETIME64 < dt64 <= MAX_DATETIME64):
-        raise ValueError(
-            f"Date ordinal {x} converts to {dt64} (using "
-            f"epoch {EPOCH}). The supported dates must be  "
-            "between year 0001 and 9999."
-        )
-
-    # convert from datetime64 to datetime:
-    dt: datetime = dt64.astype(object)
-
-    # but maybe we are working in a different timezone so move.
-    if tz:
-        # datetime64 is always UTC:
-        dt = dt.replace(tzinfo=UTC)
-        dt = dt.astimezone(tz)
-
-    # fix round off errors
-    if np.abs(x) > 70 * 365:
-        # if x is big, round off to nearest twenty microseconds.
-        # This avoids floating point roundoff error
-        ms = round(dt.microsecond / 20) * 20
-        if ms == 1000000:
-            dt = dt.replace(microsecond=0) + timedelta(seconds=1)
-        else:
-            dt = dt.replace(microsecond=ms)
-
-    return dt
-
-
-_from_ordinalf_np_vectorized = np.vectorize(_from_ordinalf, otypes="O")
-
-
 def get_tzinfo(tz: str | tzinfo | None = None) -> tzinfo | None:
     """
     Generate `~datetime.tzinfo` from a string or return `~datetime.tzinfo`.
@@ -131,6 +106,12 @@ def datetime_to_num(x: SeqDatetime | Datetime) -> NDArrayFloat | float:
     """
     Convery any datetime sequence to float array
     """
+    if has_dtype(x) and isinstance(x.dtype, pd.DatetimeTZDtype):
+        # The values of timezone aware pandas datetimes are stored in
+        # UTC, removing the timezone does not copy them
+        utc = pd.DatetimeIndex(x, copy=False).tz_convert(None)
+        return datetime64_to_num(utc.to_numpy())
+
     iterable = np.iterable(x)
     _x = x if iterable else [x]
     try:
@@ -169,12 +150,56 @@ def datetime64_to_num(x: NDArrayDatetime) -> NDArrayFloat:
 
 def num_to_datetime(
     x: FloatArrayLike, tz: str | tzinfo | None = None
-) -> NDArrayDatetime:
+) -> DatetimeArray:
     """
-    Convert any float array to numpy datetime64 array
+    Convert any float array to a timezone aware datetime array
+
+    Parameters
+    ----------
+    x :
+        Days since the epoch (1970-01-01 UTC). ``NaN`` values become
+        ``NaT``.
+    tz :
+        Timezone of the result. The default is UTC.
+
+    Returns
+    -------
+    out :
+        Datetimes with a resolution of microseconds.
+
+    Raises
+    ------
+    ValueError
+        If any of the values is outside the years 0001 - 9999.
     """
     tz = get_tzinfo(tz) or UTC
-    return _from_ordinalf_np_vectorized(x, tz)
+    days = np.asarray(x, dtype=float)
+    us = np.rint(days * MICROSECONDS_PER_DAY)
+
+    nan = np.isnan(days)
+    invalid = ((us <= MIN_MICROSECONDS) | (us > MAX_MICROSECONDS)) & ~nan
+    if invalid.any():
+        bad = days[invalid][0]
+        raise ValueError(
+            f"Date ordinal {bad} converts to a date outside the range "
+            f"{MIN_DATETIME64} to {MAX_DATETIME64} (using epoch {EPOCH})."
+            " The supported dates must be between year 0001 and 9999."
+        )
+
+    us_int = np.where(nan, 0, us).astype(np.int64)
+
+    # For dates far from the epoch, the floating point days cannot
+    # represent the microseconds. Round them off to the nearest
+    # twenty microseconds.
+    big = np.abs(days) > 70 * 365
+    if big.any():
+        frac = us_int % 10**6
+        rounded = us_int - frac + np.rint(frac / 20).astype(np.int64) * 20
+        us_int = np.where(big, rounded, us_int)
+
+    us_int[nan] = NaT_int
+    utc = pd.DatetimeIndex(us_int.view("datetime64[us]"), tz=UTC)
+    return utc.tz_convert(tz).array
 
 
 def as_datetime(
@@ -280,3 +305,113 @@ def dt(s: str | tuple[str, ...]) -> datetime | Sequence[datetime]:
     if isinstance(s, str):
         return datetime.fromisoformat(s)
     return tuple(datetime.fromisoformat(x) for x in s)
+
+
+def strftime_array(x: pd.DatetimeIndex, fmt: str) -> NDArrayStr | None:
+    """
+    Format datetimes using a strftime format string
+
+    This is a vectorized version of ``[d.strftime(fmt) for d in x]``
+    for the common format directives. NaT values are formatted
+    as ``"NaT"``.
+
+    Parameters
+    ----------
+    x :
+        Datetimes. The fields (year, month, ...) of timezone
+        aware datetimes are those in their timezone.
+    fmt :
+        Format string.
+
+    Returns
+    -------
+    out :
+        The formatted datetimes or ``None`` if the format string
+        has a directive that is not supported (e.g. ``%z``) or
+        some years are not 4 digits long. Then each datetime has
+        to be formatted with :meth:`datetime.strftime`.
+    """
+    # The literals are at even and the directives at odd positions
+    parts = re.split(r"(%.)", fmt)
+    if any("%" in s for s in parts[::2]) or any(
+        d[1] not in STRFTIME_DIRECTIVES for d in parts[1::2]
+    ):
+        return None
+
+    nat = np.asarray(x.isna())
+    valid = x[~nat] if nat.any() else x
+    res = np.zeros(len(valid), dtype=str)
+
+    if len(valid) and parts[1::2]:
+        years = valid.year
+        if years.min() < 1000 or years.max() > 9999:
+            return None
+
+    for i, s in enumerate(parts):
+        if i % 2 == 0:
+            if s:
+                res = np.char.add(res, s)
+            continue
+
+        d = s[1]
+        if d == "%":
+            piece = "%"
+        elif d == "Y":
+            piece = _zero_padded(valid.year.to_numpy(), 4)
+        elif d == "y":
+            piece = _zero_padded(valid.year.to_numpy() % 100, 2)
+        elif d == "m":
+            piece = _zero_padded(valid.month.to_numpy(), 2)
+        elif d == "d":
+            piece = _zero_padded(valid.day.to_numpy(), 2)
+        elif d == "H":
+            piece = _zero_padded(valid.hour.to_numpy(), 2)
+        elif d == "I":
+            piece = _zero_padded((valid.hour.to_numpy() + 11) % 12 + 1, 2)
+        elif d == "M":
+            piece = _zero_padded(valid.minute.to_numpy(), 2)
+        elif d == "S":
+            piece = _zero_padded(valid.second.to_numpy(), 2)
+        elif d == "f":
+            piece = _zero_padded(valid.microsecond.to_numpy(), 6)
+        elif d == "j":
+            piece = _zero_padded(valid.dayofyear.to_numpy(), 3)
+        elif d in "bB":
+            piece = _strftime_names(d, "month")[valid.month - 1]
+        elif d in "aA":
+            piece = _strftime_names(d, "weekday")[valid.dayofweek]
+        else:
+            piece = _strftime_names(d, "hour")[valid.hour // 12]
+        res = np.char.add(res, piece)
+
+    if nat.any():
+        out = np.full(
+            len(x), "NaT", dtype=np.result_type(res, np.array("NaT"))
+        )
+        out[~nat] = res
+        res = out
+    return res
+
+
+def _zero_padded(x: NDArray[np.integer], width: int) -> NDArrayStr:
+    """
+    Convert non-negative integers to zero padded strings
+    """
+    powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+    codepoints = (x.astype(np.int64)[:, None] // powers) % 10 + ord("0")
+    return codepoints.astype(np.uint32).view(f"U{width}").ravel()
+
+
+def _strftime_names(directive: str, kind: str) -> NDArrayStr:
+    """
+    Names of the months, weekdays or the AM/PM in the current locale
+    """
+    if kind == "month":
+        dates = [datetime(2000, m, 1) for m in range(1, 13)]
+    elif kind == "weekday":
+        # 2024-01-01 is a Monday, which is the first day of the week
+        # for pandas
+        dates = [datetime(2024, 1, d) for d in range(1, 8)]
+    else:
+        dates = [datetime(2000, 1, 1, h) for h in (0, 12)]
+    return np.array([d.strftime(f"%{directive}") for d in dates])
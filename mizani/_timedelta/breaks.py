@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import TYPE_CHECKING
@@ -7,17 +8,22 @@ from typing import TYPE_CHECKING
 import numpy as np
 import pandas as pd
 
-from ..utils import round_any, trim_breaks
+from ..utils import has_dtype, round_any, trim_breaks
 from .utils import (
     SI_LOOKUP,
     SI_LOOKUP_INV,
     as_timedelta,
+    as_timedelta64,
+    is_timedelta64,
     parse_timedelta_width,
     timedelta_to_microseconds,
+    total_seconds,
 )
 
 if TYPE_CHECKING:
-    from typing import Literal, Sequence
+    from typing import Literal
+
+    from numpy.typing import NDArray
 
     from mizani.typing import (
         NDArrayFloat,
@@ -98,16 +104,26 @@ class Helper:
     units: TimeIntervalUnits | TimeIntervalSIUnits | None = None
 
     def __post_init__(self):
-        l, h = min(self.x), max(self.x)
-        self.package = self.determine_package(self.x[0])
-        self.limits = self.value(l), self.value(h)
+        self.package = self.determine_package(self.x)
+        values = self.values(self.x)
+        l, h = np.nanmin(values), np.nanmax(values)
+        self.limits = l.item(), h.item()
         self._units: TimeIntervalSIUnits = (
-            SI_LOOKUP[self.units] if self.units else self.best_units((l, h))
+            SI_LOOKUP[self.units]
+            if self.units
+            else self._best_units(self.limits[1] - self.limits[0])
         )
         self.factor = self.get_scaling_factor(self._units)
 
     @classmethod
-    def determine_package(cls, td: Timedelta) -> Literal["pandas", "cpython"]:
+    def determine_package(
+        cls, td: Timedelta | TimedeltaArrayLike
+    ) -> Literal["pandas", "cpython"]:
+        if is_timedelta64(td):
+            return "pandas"
+        elif isinstance(td, Sequence) or has_dtype(td):
+            td = next(iter(td))
+
         if hasattr(td, "components"):
             package = "pandas"
         elif hasattr(td, "total_seconds"):
@@ -122,7 +138,7 @@ class Helper:
         cls,
         x: TimedeltaArrayLike,
         units: TimeIntervalUnits | TimeIntervalSIUnits | None = None,
-    ) -> tuple[Sequence[int | float], TimeIntervalSIUnits]:
+    ) -> tuple[NDArrayFloat, TimeIntervalSIUnits]:
         ins = cls(x, units)
         return ins.timedelta_to_numeric(x), ins._units
 
@@ -130,14 +146,19 @@ class Helper:
         """
         Determine good units for representing a sequence of timedeltas
         """
+        values = self.values(x)
+        return self._best_units(float(np.nanmax(values) - np.nanmin(values)))
+
+    def _best_units(self, ts_range: float) -> TimeIntervalSIUnits:
+        """
+        Determine good units for a range of numeric timedelta values
+        """
         # Read
         #   [(0.9, 's'),
         #    (9, 'm)]
         # as, break ranges between 0.9 seconds (inclusive)
         # and 9 minutes are represented in seconds. And so on.
-        ts_range = self.value(max(x)) - self.value(min(x))
-        package = self.determine_package(x[0])
-        if package == "pandas":
+        if self.package == "pandas":
             cuts: list[tuple[float, TimeIntervalSIUnits]] = [
                 (0.9, "us"),
                 (0.9, "ms"),
@@ -178,6 +199,26 @@ class Helper:
         else:
             return td.total_seconds()
 
+    def values(
+        self, x: TimedeltaArrayLike
+    ) -> NDArray[np.int64] | NDArrayFloat:
+        """
+        Return the numeric values of timedeltas
+
+        For pandas timedeltas (and timedelta64 arrays) the values are
+        integer nanoseconds, and for python timedeltas they are seconds.
+        Missing values are NaN.
+        """
+        if self.package == "pandas":
+            td64 = as_timedelta64(x)
+            ns = td64.view(np.int64)
+            if (nat := np.isnat(td64)).any():
+                ns = ns.astype(float)
+                ns[nat] = np.nan
+            return ns
+
+        return total_seconds(x)
+
     def scaled_limits(self) -> tuple[float, float]:
         """
         Minimum and Maximum to use for computing breaks
@@ -188,21 +229,21 @@ class Helper:
 
     def timedelta_to_numeric(
         self, timedeltas: TimedeltaArrayLike
-    ) -> Sequence[int | float]:
+    ) -> NDArrayFloat:
         """
         Convert sequence of timedelta to numerics
         """
-        return [self.to_numeric(td) for td in timedeltas]
+        return self.values(timedeltas) / self.factor
 
-    def numeric_to_timedelta(self, values: NDArrayFloat) -> TimedeltaArrayLike:
+    def numeric_to_timedelta(
+        self, values: NDArrayFloat
+    ) -> Sequence[timedelta]:
         """
         Convert sequence of numerical values to timedelta
         """
         if self.package == "pandas":
-            return [
-                pd.Timedelta(int(x * self.factor), unit="ns") for x in values
-            ]
-
+            ns = (np.asarray(values) * self.factor).astype(np.int64)
+            return list(pd.to_timedelta(ns, unit="ns"))
         else:
             units = SI_LOOKUP_INV[self._units]
             return [timedelta(**{units: x}) for x in values]
@@ -7,8 +7,13 @@ import numpy as np
 import pandas as pd
 from dateutil.relativedelta import relativedelta
 
+from ..utils import has_dtype
+
 if TYPE_CHECKING:
-    from typing import Sequence
+    from typing import Any
+
+    from numpy.typing import NDArray
+    from pandas.arrays import TimedeltaArray
 
     from mizani.typing import (
         FloatArrayLike,
@@ -28,6 +33,8 @@ __all__ = (
 
 SECONDS_PER_DAY = 24 * 60 * 60
 MICROSECONDS_PER_DAY = SECONDS_PER_DAY * (10**6)
+NANOSECONDS_PER_DAY = SECONDS_PER_DAY * (10**9)
+MAX_TIMEDELTA64_DAYS = pd.Timedelta.max.days
 SI_LOOKUP: dict[str, TimeIntervalSIUnits] = {
     # plural
     "nanoseconds": "ns",
@@ -117,25 +124,105 @@ def timedelta_to_num(
     This function gives us a numeric representation a timedelta that
     we can add/subtract from the numeric representation of datetimes.
     """
-    _x = x if (sized := isinstance(x, Sized)) else pd.Series([x])
+    if not isinstance(x, Sized):
+        return total_seconds([x])[0] / SECONDS_PER_DAY
 
-    if not len(_x):
+    if not len(x):
         return np.array([], dtype=float)
 
-    res: NDArrayFloat = np.array(
-        [td.total_seconds() / SECONDS_PER_DAY for td in _x]
+    return total_seconds(x) / SECONDS_PER_DAY
+
+
+def num_to_timedelta(x: FloatArrayLike) -> TimedeltaArray:
+    """
+    Convert any float array to a timedelta array
+
+    The values are in days. Returns pandas timedeltas because they
+    have a larger range than datetime.timedelta.
+    """
+    x = np.asarray(x, dtype=float)
+    finite = np.isfinite(x)
+    if (np.abs(x[finite]) > MAX_TIMEDELTA64_DAYS).any():
+        # Let pandas complain
+        return pd.to_timedelta(x, unit="D").array
+
+    # Whole days and the fraction of a day are converted separately
+    # so that the nanoseconds are exact
+    with np.errstate(invalid="ignore"):
+        days = np.floor(x)
+        ns = days.astype(np.int64) * NANOSECONDS_PER_DAY + np.rint(
+            (x - days) * NANOSECONDS_PER_DAY
+        ).astype(np.int64)
+    td64 = ns.view("timedelta64[ns]")
+    td64[~finite] = np.timedelta64("NaT")
+    return pd.array(td64)
+
+
+def total_seconds(x: TimedeltaArrayLike) -> NDArrayFloat:
+    """
+    Return the total seconds in each timedelta
+
+    The seconds of pandas & numpy timedeltas include the nanoseconds,
+    and those of python timedeltas are the same as
+    :meth:`datetime.timedelta.total_seconds`. Missing values are NaN.
+    """
+    python = not is_timedelta64(x) and not isinstance(
+        next(iter(x), None), (pd.Timedelta, np.timedelta64)
     )
-    return res if sized else res[0]
+
+    try:
+        td64 = as_timedelta64(x)
+    except (OverflowError, pd.errors.OutOfBoundsTimedelta):
+        # Beyond the range of timedelta64[ns]
+        if is_timedelta64(x):
+            return np.asarray(x) / np.timedelta64(1, "s")
+        return np.array([td.total_seconds() for td in x], dtype=float)
+
+    ns = td64.view(np.int64)
+    if python:
+        # Beyond 2**53 microseconds, the seconds may not be exactly
+        # the same as those from timedelta.total_seconds()
+        us = ns // 1000
+        if np.abs(us).max(initial=0) > 2**53:
+            return np.array([td.total_seconds() for td in x], dtype=float)
+        res = us / 1e6
+    else:
+        res = ns / 1e9
+
+    if (nat := np.isnat(td64)).any():
+        res[nat] = np.nan
+    return res
+
+
+def is_timedelta64(x: Any) -> bool:
+    """
+    Return True if x is a timedelta64 array, series or index
+    """
+    return has_dtype(x) and x.dtype.kind == "m"
 
 
-def num_to_timedelta(x: FloatArrayLike) -> Sequence[pd.Timedelta]:
+def as_timedelta64(x: TimedeltaArrayLike) -> NDArray[np.timedelta64]:
     """
-    Convert any float array to numpy datetime64 array
+    Convert timedeltas to a timedelta64[ns] array
+
+    Arrays, series and indexes that are already timedelta64[ns]
+    are not copied.
 
-    Returns pd.Timedelta because they have a larger range than
-    datetime.timedelta.
+    Raises
+    ------
+    pandas.errors.OutOfBoundsTimedelta
+        If a timedelta is beyond the range of timedelta64[ns],
+        i.e. about 106751 days.
     """
-    return tuple(pd.Timedelta(days=val) for val in x)
+    if is_timedelta64(x):
+        arr = np.asarray(x)
+        if arr.dtype == "timedelta64[ns]":
+            return arr
+        td = pd.TimedeltaIndex(arr)
+    else:
+        td = pd.to_timedelta(np.asarray(x, dtype=object))
+    # Casting with numpy would overflow silently
+    return td.as_unit("ns").to_numpy()
 
 
 def timedelta_to_microseconds(x) -> int:
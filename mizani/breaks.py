@@ -13,8 +13,9 @@ provide ways to calculate good(hopefully) breaks.
 
 from __future__ import annotations
 
+import math
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from itertools import product
 from typing import TYPE_CHECKING
@@ -23,17 +24,22 @@ import numpy as np
 import pandas as pd
 
 from .utils import (
+    LRUCache,
     log,
     min_max,
     round_any,
 )
 
 if TYPE_CHECKING:
-    from typing import Sequence
+    from typing import Any, Sequence
+
+    from numpy.typing import NDArray
 
     from mizani.typing import (
+        BreaksFunction,
         DatetimeOffset,
         FloatArrayLike,
+        NDArrayAny,
         NDArrayFloat,
         Timedelta,
         TimedeltaArrayLike,
@@ -53,8 +59,22 @@ __all__ = [
     "breaks_timedelta",
     "breaks_timedelta_width",
     "breaks_extended",
+    "breaks_batch",
 ]
 
+# Breaks computed by breaks_extended, shared by all instances that
+# do not use their own cache.
+BREAKS_EXTENDED_CACHE = LRUCache(maxsize=1024)
+
+# Breaks computed by breaks_date and breaks_date_width, shared by all
+# instances that do not use their own cache.
+BREAKS_DATE_CACHE = LRUCache(maxsize=1024)
+
+# Number of starting points of the breaks_extended candidates above
+# which they are scored as an array. For fewer, creating the arrays
+# costs more than scoring each candidate.
+EXTENDED_BATCH_STARTS = 64
+
 
 @dataclass
 class breaks_log:
@@ -411,6 +431,12 @@ class breaks_date:
     ----------
     n :
         Desired number of breaks.
+    cache : LRUCache | None
+        Where to keep computed breaks, so that they are not generated
+        again when the same limits (and timezone) are requested. The
+        default is a cache shared by all instances of
+        :class:`breaks_date` and :class:`breaks_date_width`. If
+        ``None``, the breaks are not cached.
 
     Examples
     --------
@@ -426,6 +452,9 @@ class breaks_date:
     """
 
     n: int = 5
+    cache: LRUCache | None = field(
+        default=BREAKS_DATE_CACHE, repr=False, compare=False
+    )
 
     def __call__(
         self, limits: tuple[datetime, datetime] | tuple[date, date]
@@ -455,7 +484,15 @@ class breaks_date:
             limits = limits[0].astype(object), limits[1].astype(object)
 
         limits = as_datetime(limits)
-        return by_n(limits, self.n)
+        if self.cache is None:
+            return by_n(limits, self.n)
+
+        key = (type(self), *_datetime_limits_key(limits), self.n)
+        breaks = self.cache.get(key)
+        if breaks is None:
+            breaks = tuple(by_n(limits, self.n))
+            self.cache.put(key, breaks)
+        return list(breaks)
 
 
 @dataclass
@@ -496,6 +533,13 @@ class breaks_date_width:
           e.g. `"2 years"`.
         - If `None`, do not shift.
 
+    cache : LRUCache | None
+        Where to keep computed breaks, so that they are not generated
+        again when the same limits (and timezone) are requested. The
+        default is a cache shared by all instances of
+        :class:`breaks_date` and :class:`breaks_date_width`. If
+        ``None``, the breaks are not cached.
+
     Examples
     --------
     Breaks at 4 year intervals
@@ -511,6 +555,9 @@ class breaks_date_width:
 
     width: str
     offset: int | DatetimeOffset = None
+    cache: LRUCache | None = field(
+        default=BREAKS_DATE_CACHE, repr=False, compare=False
+    )
 
     def __call__(
         self, limits: tuple[datetime, datetime] | tuple[date, date]
@@ -540,7 +587,30 @@ class breaks_date_width:
             limits = limits[0].astype(object), limits[1].astype(object)
 
         limits = as_datetime(limits)
-        return by_width(limits, self.width, self.offset)
+        if self.cache is None:
+            return by_width(limits, self.width, self.offset)
+
+        offset = self.offset
+        if isinstance(offset, list):
+            offset = tuple(offset)
+        key = (type(self), *_datetime_limits_key(limits), self.width, offset)
+        breaks = self.cache.get(key)
+        if breaks is None:
+            breaks = tuple(by_width(limits, self.width, self.offset))
+            self.cache.put(key, breaks)
+        return list(breaks)
+
+
+def _datetime_limits_key(limits: tuple[datetime, datetime]) -> tuple:
+    """
+    Key of datetime limits in a cache of breaks
+
+    Timezone aware datetimes that are the same instant are equal, but
+    the breaks are created in the clock time of the limits so the
+    timezones are part of the key.
+    """
+    l0, l1 = limits
+    return (l0, l1, l0.tzinfo, l1.tzinfo)
 
 
 @dataclass
@@ -662,6 +732,20 @@ class breaks_extended:
         Weights applied to the four optimization components
         (simplicity, coverage, density, and legibility). They
         should add up to 1.
+    cache : LRUCache | None
+        Where to keep computed breaks, so that they are not searched
+        for again when the same limits (and parameters) are
+        requested. The default is a cache shared by all instances,
+        including those used by the transforms. To share a
+        different cache between some transforms, pass them
+        ``breaks_func=breaks_extended(cache=cache)``. If ``None``,
+        the breaks are not cached.
+    cache_digits : int | None
+        Number of significant digits of the limits to use when
+        looking up the breaks in the cache. If ``None``, the limits
+        must be exactly the same. With fewer digits, nearly identical
+        limits (e.g. when panning) use the breaks computed for the
+        first of them.
 
     Examples
     --------
@@ -671,6 +755,17 @@ class breaks_extended:
     >>> breaks_extended(n=6)(limits)
     array([  0.,   2.,   4.,   6.,   8.,  10.])
 
+    Use a cache other than the shared one
+
+    >>> from mizani.utils import LRUCache
+    >>> cache = LRUCache(maxsize=100)
+    >>> breaks_extended(cache=cache)(limits)
+    array([  0. ,   2.5,   5. ,   7.5,  10. ])
+    >>> breaks_extended(cache=cache)(limits)
+    array([  0. ,   2.5,   5. ,   7.5,  10. ])
+    >>> cache.info()
+    CacheInfo(hits=1, misses=1, maxsize=100, currsize=1)
+
     References
     ----------
     - Talbot, J., Lin, S., Hanrahan, P. (2010) An Extension of
@@ -685,6 +780,10 @@ class breaks_extended:
     Q: Sequence[float] = (1, 5, 2, 2.5, 4, 3)
     only_inside: bool = False
     w: Sequence[float] = (0.25, 0.2, 0.5, 0.05)
+    cache: LRUCache | None = field(
+        default=BREAKS_EXTENDED_CACHE, repr=False, compare=False
+    )
+    cache_digits: int | None = None
 
     def __post_init__(self):
         # Used for lookups during the computations
@@ -748,6 +847,49 @@ class breaks_extended:
         # a score. Return 1 ignores all that.
         return 1
 
+    def _score_array(
+        self,
+        q: float,
+        j: float,
+        k: float,
+        dmin: float,
+        dmax: float,
+        lmin: NDArrayFloat,
+        lmax: NDArrayFloat,
+        lstep: float,
+    ) -> NDArrayFloat:
+        """
+        Score many candidates that differ only by where they start
+
+        This is the weighted sum of simplicity, coverage, density and
+        legibility computed over arrays.
+        """
+        w = self.w
+        n = len(self.Q)
+        i = self.Q_index[q] + 1
+        eps = 1e-10
+
+        # simplicity
+        rem = lmin % lstep
+        v = ((rem < eps) | ((lstep - rem) < eps)) & (lmin <= 0) & (lmax >= 0)
+        s = (n - i) / (n - 1.0) + v - j
+
+        # coverage
+        p1 = (dmax - lmax) ** 2
+        p2 = (dmin - lmin) ** 2
+        p3 = (0.1 * (dmax - dmin)) ** 2
+        c = 1 - 0.5 * (p1 + p2) / p3
+
+        # density
+        r = (k - 1.0) / (lmax - lmin)
+        rt = (self.n - 1) / (np.maximum(lmax, dmax) - np.minimum(lmin, dmin))
+        d = 2 - np.maximum(r / rt, rt / r)
+
+        # legibility, see the legibility method
+        l = 1
+
+        return w[0] * s + w[1] * c + w[2] * d + w[3] * l
+
     def __call__(self, limits: tuple[float, float]) -> NDArrayFloat:
         """
         Calculate the breaks
@@ -762,6 +904,53 @@ class breaks_extended:
         out : array_like
             Sequence of break points.
         """
+        # casting prevents the typechecker from mixing
+        # float & np.float32
+        dmin, dmax = float(limits[0]), float(limits[1])
+
+        if dmin > dmax:
+            dmin, dmax = dmax, dmin
+        elif dmin == dmax:
+            return np.array([dmin])
+
+        if self.cache is None or not np.isfinite([dmin, dmax]).all():
+            return self._calculate(dmin, dmax)
+
+        key = self._cache_key(dmin, dmax)
+        breaks = self.cache.get(key)
+        if breaks is None:
+            breaks = self._calculate(dmin, dmax)
+            self.cache.put(key, breaks)
+        return breaks.copy()
+
+    def _cache_key(self, dmin: float, dmax: float) -> tuple:
+        """
+        Key of the breaks for the limits in the cache
+        """
+        if self.cache_digits is not None:
+            dmin = float(f"{dmin:.{self.cache_digits}g}")
+            dmax = float(f"{dmax:.{self.cache_digits}g}")
+        return (
+            type(self),
+            dmin,
+            dmax,
+            self.n,
+            tuple(self.Q),
+            tuple(self.w),
+            self.only_inside,
+        )
+
+    def _calculate(self, dmin: float, dmax: float) -> NDArrayFloat:
+        """
+        Search for the best breaks
+
+        Parameters
+        ----------
+        dmin :
+            Minimum value
+        dmax :
+            Maximum value, strictly greater than dmin
+        """
         Q = self.Q
         w = self.w
         only_inside = self.only_inside
@@ -772,18 +961,8 @@ class breaks_extended:
         coverage = self.coverage
         density = self.density
         legibility = self.legibility
-        log10 = np.log10
-        ceil = np.ceil
-        floor = np.floor
-        # casting prevents the typechecker from mixing
-        # float & np.float32
-        dmin, dmax = float(limits[0]), float(limits[1])
-
-        if dmin > dmax:
-            dmin, dmax = dmax, dmin
-        elif dmin == dmax:
-            return np.array([dmin])
-
+        ceil = math.ceil
+        floor = math.floor
         best_score = -2.0
         best = (0, 0, 0, 0, 0)  # Gives Empty breaks
         j = 1.0
@@ -804,7 +983,7 @@ class breaks_extended:
                         break
 
                     delta = (dmax - dmin) / (k + 1) / j / q
-                    z: float = ceil(log10(delta))
+                    z = _ceil_log10(delta)
 
                     while z < float("inf"):
                         step = j * q * (10**z)
@@ -823,24 +1002,46 @@ class breaks_extended:
                             z = z + 1
                             break
 
-                        for start in range(min_start, max_start + 1):
-                            lmin = start * (step / j)
+                        if max_start - min_start < EXTENDED_BATCH_STARTS:
+                            for start in range(min_start, max_start + 1):
+                                lmin = start * (step / j)
+                                lmax = lmin + step * (k - 1)
+                                lstep = step
+
+                                s = simplicity(q, j, lmin, lmax, lstep)
+                                c = coverage(dmin, dmax, lmin, lmax)
+                                d = density(k, dmin, dmax, lmin, lmax)
+                                l = legibility(lmin, lmax, lstep)
+
+                                score = (
+                                    w[0] * s + w[1] * c + w[2] * d + w[3] * l
+                                )
+
+                                if score > best_score and (
+                                    not only_inside
+                                    or (lmin >= dmin and lmax <= dmax)
+                                ):
+                                    best_score = score
+                                    best = (lmin, lmax, lstep, q, k)
+                        else:
+                            # Many starting points, score them at once
+                            starts = np.arange(min_start, max_start + 1)
+                            lmin = starts * (step / j)
                             lmax = lmin + step * (k - 1)
                             lstep = step
-
-                            s = simplicity(q, j, lmin, lmax, lstep)
-                            c = coverage(dmin, dmax, lmin, lmax)
-                            d = density(k, dmin, dmax, lmin, lmax)
-                            l = legibility(lmin, lmax, lstep)
-
-                            score = w[0] * s + w[1] * c + w[2] * d + w[3] * l
-
-                            if score > best_score and (
-                                not only_inside
-                                or (lmin >= dmin and lmax <= dmax)
-                            ):
-                                best_score = score
-                                best = (lmin, lmax, lstep, q, k)
+                            score = self._score_array(
+                                q, j, k, dmin, dmax, lmin, lmax, lstep
+                            )
+
+                            if only_inside:
+                                inside = (lmin >= dmin) & (lmax <= dmax)
+                                score = np.where(inside, score, -np.inf)
+
+                            # The first of the best candidates
+                            i = int(np.argmax(score))
+                            if score[i] > best_score:
+                                best_score = float(score[i])
+                                best = (lmin[i], lmax[i], lstep, q, k)
                         z = z + 1
                     k = k + 1
             j = j + 1
@@ -849,6 +1050,21 @@ class breaks_extended:
         return locs
 
 
+def _ceil_log10(x: float) -> float:
+    """
+    Return ceil(log10(x)), as numpy would compute it, as a python float
+
+    A python float keeps the arithmetic of the breaks_extended search
+    off numpy scalars, which are much slower.
+    """
+    lg = math.log10(x)
+    # math.log10 and numpy.log10 can differ in the last digit, that
+    # only matters if the logarithm is (nearly) an integer
+    if math.isfinite(lg) and abs(lg - round(lg)) > 1e-9:
+        return float(math.ceil(lg))
+    return float(np.ceil(np.log10(x)))
+
+
 class breaks_symlog:
     """
     Breaks for the Symmetric Logarithm Transform
@@ -908,6 +1124,70 @@ class breaks_width:
         return np.arange(start, end, self.width, dtype=dtype)
 
 
+def breaks_batch(
+    func: BreaksFunction,
+    limits: Sequence[tuple[Any, Any]] | NDArrayAny,
+) -> tuple[NDArrayAny, NDArray[np.intp]]:
+    """
+    Compute the breaks for many pairs of limits
+
+    This is useful when there are many panels (e.g. facets with free
+    scales) that need breaks. ``func`` is called once for each
+    distinct pair of limits, and the breaks of all the pairs are
+    returned in a single array. Nothing is computed across pairs of
+    limits, so the savings come from repeated limits and the one
+    call instead of many.
+
+    Parameters
+    ----------
+    func :
+        Function that computes the breaks for one pair of limits,
+        e.g. :class:`breaks_extended`, :class:`breaks_log` or the
+        :meth:`~mizani.transforms.trans.breaks` method of a transform.
+    limits :
+        Array of shape ``(m, 2)``, the minimum and maximum value
+        of each pair of limits.
+
+    Returns
+    -------
+    values : array
+        The breaks of all the limits, one after the other.
+    offsets : array
+        Array of size ``m + 1``. The breaks of the ``i``-th pair
+        of limits are ``values[offsets[i]:offsets[i+1]]``.
+
+    Examples
+    --------
+    >>> limits = [(0, 9), (0, 1), (0, 9)]
+    >>> values, offsets = breaks_batch(breaks_extended(), limits)
+    >>> values
+    array([ 0.  ,  2.5 ,  5.  ,  7.5 , 10.  ,  0.  ,  0.25,  0.5 ,  0.75,
+            1.  ,  0.  ,  2.5 ,  5.  ,  7.5 , 10.  ])
+    >>> offsets
+    array([ 0,  5, 10, 15])
+    >>> values[offsets[1] : offsets[2]]
+    array([0.  , 0.25, 0.5 , 0.75, 1.  ])
+    """
+    shape = np.shape(limits)
+    if shape != (0,) and (len(shape) != 2 or shape[1] != 2):
+        raise ValueError(f"Expected limits of shape (m, 2), got {shape}.")
+
+    computed: dict[tuple[Any, Any], NDArrayAny] = {}
+    chunks = []
+    for lo, hi in limits:
+        key = (lo, hi)
+        try:
+            breaks = computed[key]
+        except KeyError:
+            breaks = computed[key] = np.asarray(func(key))
+        chunks.append(breaks)
+
+    offsets = np.zeros(len(chunks) + 1, dtype=np.intp)
+    np.cumsum([len(b) for b in chunks], out=offsets[1:])
+    values = np.concatenate(chunks) if chunks else np.array([])
+    return values, offsets
+
+
 # Deprecated
 log_breaks = breaks_log
 trans_minor_breaks = minor_breaks_trans
@@ -19,8 +19,11 @@ from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
 import numpy as np
+import pandas as pd
 
+from ._datetime.utils import strftime_array
 from .utils import (
+    has_dtype,
     match,
     precision,
     round_any,
@@ -31,9 +34,13 @@ if TYPE_CHECKING:
     from datetime import datetime, tzinfo
     from typing import Literal, Sequence
 
+    from numpy.typing import NDArray
+
     from mizani.typing import (
         BytesSymbol,
+        DatetimeArrayLike,
         FloatArrayLike,
+        NDArrayStr,
         TimedeltaArrayLike,
         TimeIntervalSIUnits,
         TimeIntervalUnits,
@@ -57,6 +64,29 @@ __all__ = [
 
 UTC = ZoneInfo("UTC")
 
+# Numbers with more decimal digits than this, or that become integers
+# larger than this, cannot be rounded exactly in float64 arithmetic
+MAX_FIXED_DIGITS = 15
+MAX_EXACT_FLOAT_INT = 2**52
+POWERS_OF_10 = 10 ** np.arange(19, dtype=np.int64)
+ZERO = ord("0")
+
+
+def _put_text(
+    out: NDArray[np.uint32],
+    rows: NDArray[np.intp],
+    cols: NDArray[np.intp],
+    text: str,
+):
+    """
+    Write text into a matrix of code points
+
+    The text is written in each of the rows starting at the
+    column of that row.
+    """
+    for i, c in enumerate(text):
+        out[rows, cols + i] = ord(c)
+
 
 @dataclass
 class label_number:
@@ -75,6 +105,15 @@ class label_number:
     decimal_mark : str
         What to use to separate the decimals digits.
 
+    Notes
+    -----
+    The labels of ``n`` values are created in ``O(n*w)`` time, where
+    ``w`` is the length of the longest label, and the only ``O(n*w)``
+    allocation is the array with the characters of the labels. If
+    neither ``accuracy`` nor ``precision`` are given, computing the
+    precision of the values sorts them, which takes ``O(n*log(n))``
+    time.
+
     Examples
     --------
     >>> label_number()([.654, .8963, .1])
@@ -121,56 +160,148 @@ class label_number:
             self.accuracy = 10**-self.precision
 
     def __call__(self, x: FloatArrayLike) -> Sequence[str]:
-        # Construct formatting according to
-        # https://docs.python.org/3/library/string.html#format-string-syntax
-        # Specfically using the Format Specification Mini-Language
+        return self._format(x).tolist()
 
-        # python format only accepts ",", "_" to separate the thousands
-        # if we have a non-standard value, we use "," & replace it after
-        valid_big_mark = self.big_mark in ("", ",", "_")
-        sep = self.big_mark if valid_big_mark else ","
+    def _format(self, x: FloatArrayLike) -> NDArrayStr:
+        """
+        Create the labels as an array of strings
 
-        fmt = (
-            f"{self.prefix}{{num:{sep}.{{precision}}f}}{self.suffix}"
-        ).format
+        All the characters are written into a single ``(n, w)`` array
+        of unicode code points, which is then viewed as an array of
+        ``n`` strings. The parts of a label are, from left to right:
+        the left padding, the sign, the prefix, the number, the suffix,
+        the closing parenthesis of a negative and the right padding.
+        """
+        x = np.asarray(x).ravel()
+        size = len(x)
+        if not size:
+            return np.array([], dtype=str)
 
-        x = np.asarray(x)
-        x_scaled = x * self.scale
+        if self.width is not None:
+            # Let python complain about invalid fill and align values
+            f"{'':{self.fill}{self.align}{self.width}}"
+
+        big_mark, decimal_mark = self.big_mark, self.decimal_mark
+        prefix, suffix = self.prefix, self.suffix
+        if self.style_negative == "-":
+            neg_before, neg_after = "-", ""
+        elif self.style_negative == "hyphen":
+            neg_before, neg_after = "\u2212", ""
+        else:
+            neg_before, neg_after = "(", ")"
 
+        x_scaled = x * self.scale
         if self.accuracy is None:
             accuracy = precision(x_scaled)
         else:
             accuracy = self.accuracy
 
-        x = round_any(x, accuracy / self.scale)
         digits = -np.floor(np.log10(accuracy)).astype(int)
-        digits = np.minimum(np.maximum(digits, 0), 20)
-
-        res = [fmt(num=abs(n), precision=digits) for n in x_scaled]
-        if not valid_big_mark:
-            res = [s.replace(",", self.big_mark) for s in res]
-
-        if self.decimal_mark != ".":
-            res = [s.replace(".", self.decimal_mark) for s in res]
+        digits = int(np.minimum(np.maximum(digits, 0), 20))
+        neg = round_any(x, accuracy / self.scale) < 0
+
+        # Round the numbers to integers in units of the last digit.
+        # Where that may disagree with python (at a tie or when the
+        # integer is too large), python formats the number.
+        absx = np.abs(x_scaled)
+        exact = np.zeros(size, dtype=bool)
+        if digits <= MAX_FIXED_DIGITS:
+            t = absx * (10.0**digits)
+            with np.errstate(invalid="ignore"):
+                exact = (t < MAX_EXACT_FLOAT_INT) & (
+                    np.abs(t - np.floor(t) - 0.5) > 4 * np.spacing(t)
+                )
+            t[~exact] = 0
+        else:
+            t = np.zeros(size)
+
+        whole, frac = np.divmod(np.rint(t).astype(np.int64), 10**digits)
+        nwhole = np.searchsorted(POWERS_OF_10[1:], whole, side="right") + 1
+        nnum = nwhole
+        if big_mark:
+            nnum = nnum + len(big_mark) * ((nwhole - 1) // 3)
+        if digits:
+            nnum = nnum + len(decimal_mark) + digits
+
+        inexact = np.flatnonzero(~exact)
+        others: list[str] = []
+        if len(inexact):
+            sep = "," if big_mark else ""
+            marks = str.maketrans({",": big_mark, ".": decimal_mark})
+            others = [
+                f"{v:{sep}.{digits}f}".translate(marks) for v in absx[inexact]
+            ]
+            nnum[inexact] = [len(s) for s in others]
+
+        # The number of characters before the number and in each label
+        nbefore = np.where(neg, len(neg_before), len(self.style_positive))
+        length = nbefore + len(prefix) + nnum + len(suffix)
+        if neg_after:
+            length += neg * len(neg_after)
+
+        left = np.zeros(size, dtype=np.intp)
+        if self.width is not None:
+            pad = np.maximum(self.width - length, 0)
+            if self.align == ">":
+                left = pad
+            elif self.align == "^":
+                left = pad // 2
+            length += pad
+
+        # The last column is a sink for the characters of the numbers
+        # that are shorter than the longest number, and it is always
+        # empty in the end.
+        width = int(length.max())
+        out = np.zeros((size, width + 1), dtype=np.uint32)
+        rows = np.arange(size)
 
-        pos_fmt = f"{self.style_positive}{{s}}".format
+        if self.width is not None:
+            out[:, :width] = ord(self.fill or " ")
+
+        _put_text(out, rows[neg], left[neg], neg_before)
+        _put_text(out, rows[~neg], left[~neg], self.style_positive)
+        start = left + nbefore
+        _put_text(out, rows, start, prefix)
+        start += len(prefix)
+        end = start + nnum
+
+        # The numbers are aligned to the right, from the right, the r-th
+        # character of each number is the same kind of character.
+        # e.g. "1,234.5" & "34.5" have a digit at r=1 & r=3
+        nnum[inexact] = 0
+        ngroup = 3 + len(big_mark)
+        for r in range(int(nnum.max())):
+            cols = np.where(nnum > r, end - 1 - r, width)
+            if r < digits:
+                out[rows, cols] = (frac // POWERS_OF_10[r]) % 10 + ZERO
+                continue
+
+            i = r - digits
+            if digits and i < len(decimal_mark):
+                out[rows, cols] = ord(decimal_mark[-1 - i])
+                continue
+
+            if digits:
+                i -= len(decimal_mark)
+            k, j = divmod(i, ngroup)
+            if j < 3:
+                power = 3 * k + j
+                out[rows, cols] = (whole // POWERS_OF_10[power]) % 10 + ZERO
+            else:
+                out[rows, cols] = ord(big_mark[-1 - (j - 3)])
 
-        if self.style_negative == "-":
-            neg_fmt = "-{s}".format
-        elif self.style_negative == "hyphen":
-            neg_fmt = "\u2212{s}".format
-        else:
-            neg_fmt = "({s})".format
+        for i, s in zip(inexact, others):
+            out[i, start[i] : start[i] + len(s)] = [ord(c) for c in s]
 
-        res = [
-            neg_fmt(s=s) if num < 0 else pos_fmt(s=s) for num, s in zip(x, res)
-        ]
+        _put_text(out, rows, end, suffix)
+        if neg_after:
+            _put_text(out, rows[neg], end[neg] + len(suffix), neg_after)
 
-        if self.width is not None:
-            fmt = f"{{s:{self.fill}{self.align}{self.width}}}".format
-            res = [fmt(s=s) for s in res]
+        # Clear the right padding beyond the length of each label
+        for j in range(int(length.min()), width + 1):
+            out[length <= j, j] = 0
 
-        return res
+        return out.view(f"U{width + 1}").ravel()
 
 
 @dataclass
@@ -552,7 +683,9 @@ class label_date:
         if isinstance(self.tz, str):
             self.tz = ZoneInfo(self.tz)
 
-    def __call__(self, x: Sequence[datetime]) -> Sequence[str]:
+    def __call__(
+        self, x: Sequence[datetime] | DatetimeArrayLike
+    ) -> Sequence[str]:
         """
         Format a sequence of inputs
 
@@ -566,6 +699,21 @@ class label_date:
         out : list
             List of strings.
         """
+        if has_dtype(x) and pd.api.types.is_datetime64_any_dtype(x.dtype):
+            # Convert the timezone and format all the dates at once
+            dates = pd.DatetimeIndex(x)
+            if self.tz is not None and dates.tz is not None:
+                dates = dates.tz_convert(self.tz)
+
+            # Naive datetimes cannot be converted to another timezone
+            # in bulk, they are left to datetime.astimezone
+            if self.tz is None or dates.tz is not None:
+                res = strftime_array(dates, self.fmt)
+                if res is not None:
+                    return res.tolist()
+
+            x = list(dates.to_pydatetime())
+
         if self.tz is not None:
             x = [d.astimezone(self.tz) for d in x]
         return [d.strftime(self.fmt) for d in x]
@@ -652,7 +800,7 @@ class label_timedelta:
 
         values, si_units = Helper.format_info(x, self.units)
         units = SI_LOOKUP_INV[si_units]
-        labels = list(label_number()(values))
+        labels = label_number()._format(values)
 
         if self.show_units:
             space = " " if self.space else ""
@@ -670,14 +818,17 @@ class label_timedelta:
                 _units = units.rstrip("s")
                 _units_plural = units if self.use_plurals else _units
 
-            for i, (num, label) in enumerate(zip(values, labels)):
-                if num == 0 and not self.zero_has_units:
-                    continue
-                elif num == 1:
-                    labels[i] = f"{label}{space}{_units}"
-                else:
-                    labels[i] = f"{label}{space}{_units_plural}"
-        return labels
+            suffix = np.where(
+                values == 1, f"{space}{_units}", f"{space}{_units_plural}"
+            )
+            if not self.zero_has_units:
+                suffix[values == 0] = ""
+            labels = np.char.add(labels, suffix)
+
+        # Missing values are labelled as by label_date
+        if (nat := np.isnan(values)).any():
+            labels = np.where(nat, "NaT", labels)
+        return labels.tolist()
 
 
 @dataclass
@@ -16,9 +16,10 @@ functions that create and return the actual palette functions.
 
 from __future__ import annotations
 
+import abc
 import colorsys
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Protocol
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Protocol, overload
 from warnings import warn
 
 import numpy as np
@@ -29,17 +30,22 @@ from ._colors import (
     get_colormap,
     get_named_color,
     hex_to_rgb,
-    hsluv,
     rgb_to_hex,
 )
+from ._colors._hex import rgb_to_hex_array
+from ._colors._hsluv_array import hsluv_to_rgb_array, lch_to_hex_array
 from .bounds import rescale
-from .utils import identity
+from .utils import LRUCache, identity
 
 if TYPE_CHECKING:
-    from typing import Any, Literal, Sequence, TypeVar
+    from dataclasses import Field
+    from typing import Any, ClassVar, Literal, Sequence, TypeVar
+
+    from numpy.typing import NDArray
 
     from mizani.typing import (
         Callable,
+        ColorPaletteOutput,
         ColorScheme,
         ColorSchemeShort,
         FloatArrayLike,
@@ -71,6 +77,15 @@ __all__ = [
     "none_pal",
 ]
 
+# Colors made by the discrete palettes, shared by all instances
+# that do not use their own cache.
+DISCRETE_PAL_CACHE = LRUCache(maxsize=128)
+
+# Hue boundaries used by colorsys.hls_to_rgb
+_ONE_THIRD = 1.0 / 3.0
+_ONE_SIXTH = 1.0 / 6.0
+_TWO_THIRD = 2.0 / 3.0
+
 
 class _discrete_pal(Protocol):
     """
@@ -84,6 +99,50 @@ class _discrete_pal(Protocol):
         ...
 
 
+class _cached_discrete_pal(_discrete_pal):
+    """
+    Discrete palette maker that caches the colors it makes
+
+    The colors depend only on the parameters of the palette and
+    ``n``. Subclasses make them in ``_make_colors`` and they are
+    kept, as tuples, in the ``cache``.
+    """
+
+    __dataclass_fields__: ClassVar[dict[str, Field[Any]]]
+    cache: LRUCache | None
+
+    def __call__(self, n: int) -> Sequence[Any]:
+        if self.cache is None:
+            return list(self._make_colors(n))
+
+        key = self._cache_key(n)
+        try:
+            colors = self.cache.get(key)
+        except TypeError:
+            # Unhashable parameters
+            return list(self._make_colors(n))
+
+        if colors is None:
+            colors = tuple(self._make_colors(n))
+            self.cache.put(key, colors)
+        return list(colors)
+
+    @abc.abstractmethod
+    def _make_colors(self, n: int) -> Sequence[Any]:
+        """
+        Make n colors
+        """
+
+    def _cache_key(self, n: int) -> tuple[Any, ...]:
+        """
+        Key of the n colors of this palette in the cache
+        """
+        params = tuple(
+            getattr(self, f.name) for f in fields(self) if f.compare
+        )
+        return (type(self), params, n)
+
+
 class _continuous_pal(Protocol):
     """
     Continuous palette maker
@@ -101,7 +160,24 @@ class _continuous_color_pal(Protocol):
     Continuous color palette maker
     """
 
-    def __call__(self, x: FloatArrayLike) -> Sequence[RGBHexColor | None]:
+    @overload
+    def __call__(
+        self, x: FloatArrayLike, output: Literal["list"] = "list"
+    ) -> Sequence[RGBHexColor | None]: ...
+
+    @overload
+    def __call__(
+        self, x: FloatArrayLike, output: Literal["array"]
+    ) -> np.ma.MaskedArray: ...
+
+    @overload
+    def __call__(
+        self, x: FloatArrayLike, output: Literal["uint8"]
+    ) -> NDArray[np.uint8]: ...
+
+    def __call__(
+        self, x: FloatArrayLike, output: ColorPaletteOutput = "list"
+    ) -> Sequence[RGBHexColor | None] | np.ma.MaskedArray | NDArray[np.uint8]:
         """
         Palette method
         """
@@ -145,12 +221,7 @@ def hls_palette(
     >>> len(hls_palette(9))
     9
     """
-    hues = np.linspace(0, 1, n_colors + 1)[:-1]
-    hues += h
-    hues %= 1
-    hues -= hues.astype(int)
-    palette = [colorsys.hls_to_rgb(h_i, l, s) for h_i in hues]
-    return palette
+    return [tuple(c) for c in _hls_palette_array(n_colors, h, l, s).tolist()]
 
 
 def hsluv_palette(
@@ -190,14 +261,64 @@ def hsluv_palette(
     >>> len(hsluv_palette(11))
     11
     """
+    rgb = _hsluv_palette_array(n_colors, h, s, l)
+    return [tuple(c) for c in rgb.tolist()]
+
+
+def _hls_palette_array(
+    n_colors: int, h: float, l: float, s: float
+) -> NDArrayFloat:
+    """
+    Evenly spaced colors in HLS hue space
+
+    The same colors as :func:`hls_palette`, as an array of
+    shape (n_colors, 3).
+    """
+    hues = np.linspace(0, 1, n_colors + 1)[:-1]
+    hues += h
+    hues %= 1
+    hues -= hues.astype(int)
+
+    # colorsys.hls_to_rgb for all the hues
+    if s == 0:
+        return np.full((n_colors, 3), float(l))
+
+    m2 = l * (1.0 + s) if l <= 0.5 else l + s - (l * s)
+    m1 = 2.0 * l - m2
+    hues = np.column_stack([hues + _ONE_THIRD, hues, hues - _ONE_THIRD])
+    hues %= 1.0
+    return np.select(
+        [
+            hues < _ONE_SIXTH,
+            hues < 0.5,
+            hues < _TWO_THIRD,
+        ],
+        [
+            m1 + (m2 - m1) * hues * 6.0,
+            m2,
+            m1 + (m2 - m1) * (_TWO_THIRD - hues) * 6.0,
+        ],
+        m1,
+    )
+
+
+def _hsluv_palette_array(
+    n_colors: int, h: float, s: float, l: float
+) -> NDArrayFloat:
+    """
+    Evenly spaced colors in HSLuv hue space
+
+    The same colors as :func:`hsluv_palette`, as an array of
+    shape (n_colors, 3).
+    """
     hues = np.linspace(0, 1, n_colors + 1)[:-1]
     hues += h
     hues %= 1
     hues *= 359
-    s *= 99
-    l *= 99
-    palette = [hsluv.hsluv_to_rgb((h_i, s, l)) for h_i in hues]
-    return palette
+    hsl = np.column_stack(
+        [hues, np.full(n_colors, s * 99), np.full(n_colors, l * 99)]
+    )
+    return hsluv_to_rgb_array(hsl)
 
 
 @dataclass
@@ -311,7 +432,7 @@ class abs_area(_continuous_pal):
 
 
 @dataclass
-class grey_pal(_discrete_pal):
+class grey_pal(_cached_discrete_pal):
     """
     Utility for creating continuous grey scale palette
 
@@ -321,6 +442,11 @@ class grey_pal(_discrete_pal):
         grey value at low end of palette
     end : float
         grey value at high end of palette
+    cache : LRUCache | None
+        Where to keep the colors, so that they are not made again
+        when the same number of colors is requested. The default is
+        a cache shared by all the discrete palettes. If ``None``, the
+        colors are not cached.
 
     Returns
     -------
@@ -338,13 +464,16 @@ class grey_pal(_discrete_pal):
 
     start: float = 0.2
     end: float = 0.8
+    cache: LRUCache | None = field(
+        default=DISCRETE_PAL_CACHE, repr=False, compare=False
+    )
 
     def __post_init__(self):
         start, end = self.start, self.end
         colors = (start, start, start), (end, end, end)
         self._cmap = InterpolatedMap(colors)
 
-    def __call__(self, n: int) -> Sequence[RGBHexColor | None]:
+    def _make_colors(self, n: int) -> Sequence[RGBHexColor | None]:
         gamma = 2.2
         # The grey scale points are linearly separated in
         # gamma encoded space
@@ -355,7 +484,7 @@ class grey_pal(_discrete_pal):
 
 
 @dataclass
-class hue_pal(_discrete_pal):
+class hue_pal(_cached_discrete_pal):
     """
     Make a hue palette in HCL colour space
 
@@ -373,6 +502,11 @@ class hue_pal(_discrete_pal):
     direction : 1 | -1
         The order of colours in the scale. If -1 the order
         of colours is reversed. The default is 1.
+    cache : LRUCache | None
+        Where to keep the colors, so that they are not made again
+        when the same number of colors is requested. The default is
+        a cache shared by all the discrete palettes. If ``None``, the
+        colors are not cached.
 
     Returns
     -------
@@ -392,6 +526,9 @@ class hue_pal(_discrete_pal):
     c: float = 100
     l: float = 65
     direction: Literal[1, -1] = 1
+    cache: LRUCache | None = field(
+        default=DISCRETE_PAL_CACHE, repr=False, compare=False
+    )
 
     def __post_init__(self):
         # Ensure a proper range for the palette
@@ -400,7 +537,7 @@ class hue_pal(_discrete_pal):
         else:
             self._hue_range = self.h, self.h + 360
 
-    def __call__(self, n: int) -> Sequence[RGBHexColor]:
+    def _make_colors(self, n: int) -> list[RGBHexColor]:
         h = self._hue_range
 
         # Make a hue range that is functionally zero wrap around and
@@ -411,11 +548,12 @@ class hue_pal(_discrete_pal):
             h = h[0] % 360, (h[1] - 360 / n) % 360
 
         hues = np.linspace(h[0], h[1], n)[:: self.direction] % 360
-        return [hsluv.lch_to_hex((self.l, self.c, h)) for h in hues]
+        lch = np.column_stack([np.full(n, self.l), np.full(n, self.c), hues])
+        return lch_to_hex_array(lch).tolist()
 
 
 @dataclass
-class hls_pal(_discrete_pal):
+class hls_pal(_cached_discrete_pal):
     """
     Make a hue palette in HLS or HSLUV colour space
 
@@ -431,6 +569,11 @@ class hls_pal(_discrete_pal):
         Color space to use for the palette.
         `hls` for https://en.wikipedia.org/wiki/HSL_and_HSV
         or `hsluv` for https://www.hsluv.org/.
+    cache : LRUCache | None
+        Where to keep the colors, so that they are not made again
+        when the same number of colors is requested. The default is
+        a cache shared by all the discrete palettes. If ``None``, the
+        colors are not cached.
 
     Returns
     -------
@@ -454,6 +597,9 @@ class hls_pal(_discrete_pal):
     l: float = 0.6
     s: float = 0.65
     color_space: Literal["hls", "hsluv"] = "hls"
+    cache: LRUCache | None = field(
+        default=DISCRETE_PAL_CACHE, repr=False, compare=False
+    )
 
     def __post_init__(self):
         h, l, s = self.h, self.l, self.s
@@ -472,15 +618,15 @@ class hls_pal(_discrete_pal):
             msg = "color_space should be one of ['hls', 'hsluv']"
             raise ValueError(msg)
 
-    def __call__(self, n: int) -> Sequence[RGBHexColor]:
-        lookup = {"hls": hls_palette, "hsluv": hsluv_palette}
+    def _make_colors(self, n: int) -> list[RGBHexColor]:
+        lookup = {"hls": _hls_palette_array, "hsluv": _hsluv_palette_array}
         palette = lookup[self.color_space]
-        colors = palette(n, h=self.h, l=self.l, s=self.s)
-        return [hsluv.rgb_to_hex(c) for c in colors]
+        rgb = palette(n, h=self.h, l=self.l, s=self.s)
+        return rgb_to_hex_array(rgb).tolist()
 
 
 @dataclass
-class brewer_pal(_discrete_pal):
+class brewer_pal(_cached_discrete_pal):
     """
     Utility for making a brewer palette
 
@@ -499,6 +645,11 @@ class brewer_pal(_discrete_pal):
     direction : int
         The order of colours in the scale. If -1 the order
         of colors is reversed. The default is 1.
+    cache : LRUCache | None
+        Where to keep the colors, so that they are not made again
+        when the same number of colors is requested. The default is
+        a cache shared by all the discrete palettes. If ``None``, the
+        colors are not cached.
 
     Returns
     -------
@@ -532,6 +683,9 @@ class brewer_pal(_discrete_pal):
     type: ColorScheme | ColorSchemeShort = "seq"
     palette: int | str = 1
     direction: Literal[1, -1] = 1
+    cache: LRUCache | None = field(
+        default=DISCRETE_PAL_CACHE, repr=False, compare=False
+    )
 
     def __post_init__(self):
         from mizani._colors._palettes.brewer import get_brewer_palette
@@ -542,11 +696,6 @@ class brewer_pal(_discrete_pal):
         self.bpal = get_brewer_palette(self.type, self.palette)
 
     def __call__(self, n: int) -> Sequence[RGBHexColor | None]:
-        # Only draw the maximum allowable colors from the palette
-        # and fill any remaining spots with None
-        _n = min(max(n, self.bpal.min_colors), self.bpal.max_colors)
-        color_map = self.bpal.get_hex_swatch(_n)
-        colors = color_map[:n]
         if n > self.bpal.max_colors:
             msg = (
                 "Warning message:"
@@ -555,6 +704,15 @@ class brewer_pal(_discrete_pal):
                 "palette you asked for with that many colors"
             )
             warn(msg)
+        return super().__call__(n)
+
+    def _make_colors(self, n: int) -> Sequence[RGBHexColor | None]:
+        # Only draw the maximum allowable colors from the palette
+        # and fill any remaining spots with None
+        _n = min(max(n, self.bpal.min_colors), self.bpal.max_colors)
+        color_map = self.bpal.get_hex_swatch(_n)
+        colors = color_map[:n]
+        if n > self.bpal.max_colors:
             colors = list(colors) + [None] * (n - self.bpal.max_colors)
         return colors[:: self.direction]
 
@@ -580,7 +738,10 @@ class gradient_n_pal(_continuous_color_pal):
         parameter either a :class:`float` or a sequence
         of floats maps those value(s) onto the palette
         and returns color(s). The float(s) must be
-        in the range [0, 1].
+        in the range [0, 1]. An optional second parameter
+        ``output`` (one of ``"list"``, ``"array"`` or ``"uint8"``)
+        controls the type of the returned colors. See
+        :meth:`~mizani._colors.ColorMap.continuous_palette`.
 
     Examples
     --------
@@ -589,6 +750,13 @@ class gradient_n_pal(_continuous_color_pal):
     ['#ff0000', '#bf0040', '#7f0080', '#4000bf', '#0000ff']
     >>> palette([-np.inf, 0, np.nan, 1, np.inf])
     [None, '#ff0000', None, '#0000ff', None]
+
+    For many values, get an array of the RGBA values
+
+    >>> palette([0, .5, np.nan], output="uint8")
+    array([[255,   0,   0, 255],
+           [127,   0, 128, 255],
+           [  0,   0,   0,   0]], dtype=uint8)
     """
 
     colors: Sequence[str]
@@ -597,8 +765,25 @@ class gradient_n_pal(_continuous_color_pal):
     def __post_init__(self):
         self._cmap = InterpolatedMap(self.colors, self.values)
 
-    def __call__(self, x: FloatArrayLike) -> Sequence[RGBHexColor | None]:
-        return self._cmap.continuous_palette(x)
+    @overload
+    def __call__(
+        self, x: FloatArrayLike, output: Literal["list"] = "list"
+    ) -> Sequence[RGBHexColor | None]: ...
+
+    @overload
+    def __call__(
+        self, x: FloatArrayLike, output: Literal["array"]
+    ) -> np.ma.MaskedArray: ...
+
+    @overload
+    def __call__(
+        self, x: FloatArrayLike, output: Literal["uint8"]
+    ) -> NDArray[np.uint8]: ...
+
+    def __call__(
+        self, x: FloatArrayLike, output: ColorPaletteOutput = "list"
+    ) -> Sequence[RGBHexColor | None] | np.ma.MaskedArray | NDArray[np.uint8]:
+        return self._cmap.continuous_palette(x, output)
 
 
 @dataclass
@@ -618,13 +803,21 @@ class cmap_pal(_continuous_color_pal):
         parameter either a :class:`float` or a sequence
         of floats maps those value(s) onto the palette
         and returns color(s). The float(s) must be
-        in the range [0, 1].
+        in the range [0, 1]. An optional second parameter
+        ``output`` (one of ``"list"``, ``"array"`` or ``"uint8"``)
+        controls the type of the returned colors. See
+        :meth:`~mizani._colors.ColorMap.continuous_palette`.
 
     Examples
     --------
     >>> palette = cmap_pal('viridis')
     >>> palette([.1, .2, .3, .4, .5])
     ['#482475', '#414487', '#355f8d', '#2a788e', '#21918c']
+    >>> palette([.1, np.nan, .5], output="array")
+    masked_array(data=['#482475', --, '#21918c'],
+                 mask=[False,  True, False],
+           fill_value='N/A',
+                dtype='<U7')
     """
 
     name: str
@@ -638,14 +831,31 @@ class cmap_pal(_continuous_color_pal):
             self.name = self.name[:-2]
         self.cm = get_colormap(self.name)
 
-    def __call__(self, x: FloatArrayLike) -> Sequence[RGBHexColor | None]:
+    @overload
+    def __call__(
+        self, x: FloatArrayLike, output: Literal["list"] = "list"
+    ) -> Sequence[RGBHexColor | None]: ...
+
+    @overload
+    def __call__(
+        self, x: FloatArrayLike, output: Literal["array"]
+    ) -> np.ma.MaskedArray: ...
+
+    @overload
+    def __call__(
+        self, x: FloatArrayLike, output: Literal["uint8"]
+    ) -> NDArray[np.uint8]: ...
+
+    def __call__(
+        self, x: FloatArrayLike, output: ColorPaletteOutput = "list"
+    ) -> Sequence[RGBHexColor | None] | np.ma.MaskedArray | NDArray[np.uint8]:
         if self._direction == -1:
             x = 1.0 - np.asarray(x)
-        return self.cm.continuous_palette(x)
+        return self.cm.continuous_palette(x, output)
 
 
 @dataclass
-class cmap_d_pal(_discrete_pal):
+class cmap_d_pal(_cached_discrete_pal):
     """
     Create a discrete palette from a colormap
 
@@ -653,6 +863,11 @@ class cmap_d_pal(_discrete_pal):
     ----------
     name : str
         Name of colormap
+    cache : LRUCache | None
+        Where to keep the colors, so that they are not made again
+        when the same number of colors is requested. The default is
+        a cache shared by all the discrete palettes. If ``None``, the
+        colors are not cached.
 
     Returns
     -------
@@ -670,6 +885,9 @@ class cmap_d_pal(_discrete_pal):
     """
 
     name: str
+    cache: LRUCache | None = field(
+        default=DISCRETE_PAL_CACHE, repr=False, compare=False
+    )
 
     def __post_init__(self):
         self._direction: Literal[1, -1] = 1
@@ -680,9 +898,13 @@ class cmap_d_pal(_discrete_pal):
             self.name = self.name[:-2]
         self.cm = get_colormap(self.name)
 
-    def __call__(self, n: int) -> Sequence[RGBHexColor]:
+    def _make_colors(self, n: int) -> Sequence[RGBHexColor]:
         return self.cm.discrete_palette(n)[:: self._direction]
 
+    def _cache_key(self, n: int) -> tuple[Any, ...]:
+        # The name has lost the "_r" of a reversed colormap
+        return (*super()._cache_key(n), self._direction)
+
 
 class desaturate_pal(gradient_n_pal):
     """
@@ -829,7 +1051,7 @@ def crayon_palette(colors: Sequence[str]) -> Sequence[RGBHexColor]:
 
 
 @dataclass
-class cubehelix_pal(_discrete_pal):
+class cubehelix_pal(_cached_discrete_pal):
     """
     Utility for creating discrete palette from the cubehelix system.
 
@@ -854,6 +1076,11 @@ class cubehelix_pal(_discrete_pal):
         Intensity of the lightest color in the palette.
     reverse : bool
         If True, the palette will go from dark to light.
+    cache : LRUCache | None
+        Where to keep the colors, so that they are not made again
+        when the same number of colors is requested. The default is
+        a cache shared by all the discrete palettes. If ``None``, the
+        colors are not cached.
 
     Returns
     -------
@@ -883,6 +1110,9 @@ class cubehelix_pal(_discrete_pal):
     light: float = 0.85
     dark: float = 0.15
     reverse: bool = False
+    cache: LRUCache | None = field(
+        default=DISCRETE_PAL_CACHE, repr=False, compare=False
+    )
 
     def __post_init__(self):
         self._chmap = CubeHelixMap(
@@ -895,7 +1125,7 @@ class cubehelix_pal(_discrete_pal):
             self.reverse,
         )
 
-    def __call__(self, n: int) -> Sequence[RGBHexColor]:
+    def _make_colors(self, n: int) -> Sequence[RGBHexColor]:
         return self._chmap.discrete_palette(n)
 
 
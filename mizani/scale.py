@@ -30,6 +30,7 @@ The **apply** methods are simple examples of how to put it all together.
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING, cast
 
 import numpy as np
@@ -40,9 +41,10 @@ from .utils import (
     CONTINUOUS_KINDS,
     DISCRETE_KINDS,
     get_categories,
+    get_indexer,
     has_dtype,
     match,
-    min_max,
+    to_index,
 )
 
 if TYPE_CHECKING:
@@ -54,6 +56,7 @@ if TYPE_CHECKING:
         ContinuousPalette,
         DiscretePalette,
         FloatArrayLike,
+        NDArrayAny,
         NDArrayFloat,
         Trans,
     )
@@ -61,7 +64,12 @@ if TYPE_CHECKING:
     TVector = TypeVar("TVector", NDArrayFloat, pd.Series[float])
 
 
-__all__ = ["scale_continuous", "scale_discrete"]
+__all__ = [
+    "scale_continuous",
+    "scale_discrete",
+    "range_continuous",
+    "range_discrete",
+]
 
 
 class scale_continuous:
@@ -128,13 +136,7 @@ class scale_continuous:
         if not len(new_data):
             return old
 
-        new_data = np.asarray(new_data)
-
-        if new_data.dtype.kind not in CONTINUOUS_KINDS:
-            raise TypeError("Discrete value supplied to continuous scale")
-
-        new_data = np.hstack([new_data, old])
-        return min_max(new_data, na_rm=True, finite=True)
+        return range_continuous(old).train(new_data).limits
 
     @classmethod
     def map(
@@ -170,6 +172,211 @@ class scale_continuous:
         pal[pd.isna(x)] = na_value
         return pal
 
+    @classmethod
+    def map_chunked(
+        cls,
+        x: FloatArrayLike | Iterable[FloatArrayLike],
+        palette: ContinuousPalette,
+        limits: tuple[float, float],
+        na_value: Any = None,
+        oob: Callable[[TVector], TVector] = censor,
+        out: NDArrayAny | None = None,
+        chunksize: int = 1_000_000,
+    ) -> NDArrayAny:
+        """
+        Map values to a continuous palette, a chunk at a time
+
+        This is the same as :meth:`map`, but the temporary arrays
+        created when mapping are at most ``chunksize`` long. Use it
+        for very large (e.g. memory-mapped) arrays.
+
+        Parameters
+        ----------
+        x : array_like | iterable
+            Continuous values to scale. If it is an iterator, or an
+            iterable (e.g. a list) of arrays, each array is a chunk.
+            Otherwise it is sliced into chunks of size ``chunksize``,
+            which does not copy a :class:`numpy.memmap`.
+        palette : callable ``f(x)``
+            palette to use
+        limits : tuple
+            Limits of the scale
+        na_value : object
+            Value to use for missing values.
+        oob : callable ``f(x)``
+            Function to deal with values that are
+            beyond the limits
+        out : array_like
+            Array in which to place the mapped values. It should be
+            at least as long as ``x``, and of a dtype that can hold
+            the values created by the palette. If ``None``, the
+            mapped chunks are concatenated into a new array.
+        chunksize : int
+            Number of values to map at a time. It is ignored when
+            ``x`` is made of chunks.
+
+        Returns
+        -------
+        out : array_like
+            Values mapped onto a palette
+
+        Examples
+        --------
+        >>> x = np.arange(11)
+        >>> out = np.zeros(11)
+        >>> scale_continuous.map_chunked(
+        ...     x, list, (0, 10), out=out, chunksize=4
+        ... )
+        array([0. , 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1. ])
+        """
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be positive. Got {chunksize}")
+
+        if _is_chunks(x):
+            chunks = cast("Iterable[FloatArrayLike]", x)
+        else:
+            x = np.asarray(x)
+            chunks = (
+                x[start : start + chunksize]
+                for start in range(0, len(x), chunksize)
+            )
+
+        mapped = []
+        start = 0
+        for chunk in chunks:
+            pal = cls.map(chunk, palette, limits, na_value, oob)
+            end = start + len(pal)
+            if out is None:
+                mapped.append(pal)
+            elif end > len(out):
+                raise ValueError(
+                    f"The output array (length={len(out)}) is shorter "
+                    "than the values to map."
+                )
+            else:
+                out[start:end] = pal
+            start = end
+
+        if out is not None:
+            return out
+        elif mapped:
+            return np.concatenate(mapped)
+        else:
+            return np.asarray(palette([]))
+
+
+class range_continuous:
+    """
+    Range of continuous values accumulated over many trainings
+
+    Use it to train a continuous scale on data that comes in
+    pieces, e.g. the chunks of a large array or the partitions of
+    a dataset handled by different processes. The pieces are not
+    concatenated, only their minimum and maximum are kept. Ranges
+    trained separately can be merged, and they can be pickled.
+
+    Parameters
+    ----------
+    limits : tuple
+        Initial ``(min, max)`` range. Non-finite values are ignored.
+
+    Examples
+    --------
+    >>> rng = range_continuous()
+    >>> rng.train([3, 1, 2]).train([np.nan, 5, np.inf]).limits == (1, 5)
+    True
+    >>> other = range_continuous().train([-2, 0])
+    >>> rng.merge(other).limits == (-2, 5)
+    True
+    """
+
+    low: Any
+    high: Any
+
+    def __init__(self, limits: tuple[float, float] | None = None):
+        self.low, self.high = np.inf, -np.inf
+        if limits is not None:
+            self.train(limits)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.limits})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, range_continuous):
+            return NotImplemented
+        return self.limits == other.limits
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Whether the range has not been trained on any finite value
+        """
+        return self.low > self.high
+
+    @property
+    def limits(self) -> tuple[float, float]:
+        """
+        The ``(min, max)`` of the range
+
+        If the range is empty, it is ``(-inf, inf)``.
+        """
+        if self.is_empty:
+            return float("-inf"), float("inf")
+        return self.low, self.high
+
+    def _update(self, low: Any, high: Any):
+        if low < self.low:
+            self.low = low
+        if high > self.high:
+            self.high = high
+
+    def train(self, x: FloatArrayLike) -> range_continuous:
+        """
+        Update the range with new values
+
+        Parameters
+        ----------
+        x : array_like
+            New values
+
+        Returns
+        -------
+        out : range_continuous
+            This range
+        """
+        if not len(x):
+            return self
+
+        x = np.asarray(x)
+        if x.dtype.kind not in CONTINUOUS_KINDS:
+            raise TypeError("Discrete value supplied to continuous scale")
+
+        x = x[np.isfinite(x)]
+        if len(x):
+            # Integer limits would overflow when they are expanded
+            dtype = np.result_type(x.dtype, np.float64)
+            low, high = np.array([x.min(), x.max()], dtype=dtype)
+            self._update(low, high)
+        return self
+
+    def merge(self, other: range_continuous) -> range_continuous:
+        """
+        Update the range with another range
+
+        Parameters
+        ----------
+        other : range_continuous
+            Range e.g. trained in another process.
+
+        Returns
+        -------
+        out : range_continuous
+            This range
+        """
+        if not other.is_empty:
+            self._update(other.low, other.high)
+        return self
+
 
 class scale_discrete:
     """
@@ -236,53 +443,213 @@ class scale_discrete:
         if not len(new_data):
             return old
 
-        old_set = set(old)
+        return range_discrete(old).train(new_data, drop, na_rm).limits
+
+    @classmethod
+    def map(
+        cls,
+        x: AnyArrayLike,
+        palette: DiscretePalette,
+        limits: Sequence[Any],
+        na_value: Any = None,
+    ) -> AnyArrayLike:
+        """
+        Map values to a discrete palette
+
+        Parameters
+        ----------
+        palette : callable ``f(x)``
+            palette to use
+        x : array_like
+            Continuous values to scale
+        na_value : object
+            Value to use for missing values.
+
+        Returns
+        -------
+        out : array_like
+            Values mapped onto a palette
+        """
+        return range_discrete(limits).map(x, palette, na_value)
+
+
+class range_discrete:
+    """
+    Range of discrete values accumulated over many trainings
+
+    The values known to the range (the limits) are kept in a hash
+    index that is created once and reused by all calls to
+    :meth:`map`, until a training adds new values. Use it instead of
+    :meth:`scale_discrete.train` and :meth:`scale_discrete.map` when
+    the data comes in many pieces or has many levels.
+
+    Parameters
+    ----------
+    limits : list
+        Initial values known to the range.
+
+    Examples
+    --------
+    >>> rng = range_discrete()
+    >>> rng.train(["b", "a", "b"]).train(["c", "a"]).limits
+    ['a', 'b', 'c']
+    >>> rng.map(["c", "a", None], np.arange, na_value=-1)
+    array([ 2,  0, -1])
+    """
+
+    def __init__(self, limits: Sequence[Any] | None = None):
+        self._limits: list[Any] = [] if limits is None else list(limits)
+        self._index: pd.Index | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._limits})"
+
+    def __len__(self) -> int:
+        return len(self._limits)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The index is recreated when needed
+        return {"_limits": self._limits, "_index": None}
+
+    @property
+    def limits(self) -> list[Any]:
+        """
+        The values known to the range
+        """
+        return list(self._limits)
+
+    @property
+    def index(self) -> pd.Index:
+        """
+        Hash index of the limits
+        """
+        if self._index is None:
+            self._index = to_index(self._limits)
+        return self._index
+
+    def _extend(self, values: Sequence[Any]):
+        """
+        Add values to the end of the limits
+        """
+        if len(values):
+            self._limits.extend(values)
+            self._index = None
+
+    def train(
+        self,
+        x: AnyArrayLike,
+        drop: bool = False,
+        na_rm: bool = False,
+    ) -> range_discrete:
+        """
+        Update the range with new values
+
+        Parameters
+        ----------
+        x : array_like
+            New values
+        drop : bool
+            Whether to drop(not include) unused categories
+        na_rm : bool
+            If ``True``, remove missing values. Missing values
+            are either ``NaN`` or ``None``.
+
+        Returns
+        -------
+        out : range_discrete
+            This range
+        """
+        if not len(x):
+            return self
+
+        old = self._limits
 
         # Get the missing values (NaN & Nones) locations and remove them
-        nan_bool_idx = pd.isna(new_data)  # type: ignore
+        nan_bool_idx = pd.isna(x)  # type: ignore
         has_na = np.any(nan_bool_idx)
 
-        if not has_dtype(new_data):
-            new_data = np.asarray(new_data)
+        if not has_dtype(x):
+            x = np.asarray(x)
 
-        new_data = cast(np.ndarray, new_data)
+        x = cast(np.ndarray, x)
 
-        if new_data.dtype.kind not in DISCRETE_KINDS:
+        if x.dtype.kind not in DISCRETE_KINDS:
             raise TypeError("Continuous value supplied to discrete scale")
 
-        new_data = new_data[~nan_bool_idx]
+        x = x[~nan_bool_idx]
 
         # 1. Train i.e. get the new values
         # 2. Update old
-        if isinstance(new_data.dtype, pd.CategoricalDtype):
-            categories = get_categories(new_data)
+        if isinstance(x.dtype, pd.CategoricalDtype):
+            categories = get_categories(x)
             if drop:
-                present = set(new_data)
-                new = [i for i in categories if i in present]
+                codes = pd.Categorical(x).codes
+                new = categories[np.unique(codes)]
             else:
-                new = list(categories)
+                new = categories
 
-            all_set = old_set | set(new)
+            all_set = set(old) | set(new)
             ordered_cats = categories.union(old, sort=False)
             limits = [c for c in ordered_cats if c in all_set]
+            self._limits = limits
+            self._index = None
         else:
-            new = np.unique(new_data)
-            new.sort()
-
-            limits = old + [i for i in new if (i not in old_set)]
+            # Unique values by hashing, and only sort those
+            new = np.sort(np.asarray(pd.unique(x)))
+            if old:
+                new = new[self.get_indexer(new) == -1]
+            self._extend(new.tolist())
 
         # Add nan if required
-        has_na_limits = pd.isna(limits).any()
+        has_na_limits = pd.isna(self._limits).any()
         if not has_na_limits and not na_rm and has_na:
-            limits.append(np.nan)
-        return limits
+            self._extend([np.nan])
+        return self
+
+    def merge(self, other: range_discrete) -> range_discrete:
+        """
+        Update the range with the values of another range
+
+        The values of the other range that are not in this range
+        are added at the end, in their order.
+
+        Parameters
+        ----------
+        other : range_discrete
+            Range e.g. trained in another process.
+
+        Returns
+        -------
+        out : range_discrete
+            This range
+        """
+        if not self._limits:
+            self._extend(other._limits)
+        elif other._limits:
+            missing = self.get_indexer(other._limits) == -1
+            self._extend([v for v, m in zip(other._limits, missing) if m])
+        return self
+
+    def get_indexer(self, x: AnyArrayLike) -> NDArrayAny:
+        """
+        Return the positions of x in the limits
+
+        Values that are not in the limits get ``-1``.
+
+        Parameters
+        ----------
+        x : array_like
+            Values to locate
+        """
+        index = self.index
+        if not index.is_unique:
+            return match(x, self._limits)
+        return get_indexer(index, x)
 
-    @classmethod
     def map(
-        cls,
+        self,
         x: AnyArrayLike,
         palette: DiscretePalette,
-        limits: Sequence[Any],
         na_value: Any = None,
     ) -> AnyArrayLike:
         """
@@ -290,10 +657,10 @@ class scale_discrete:
 
         Parameters
         ----------
+        x : array_like
+            Discrete values to scale
         palette : callable ``f(x)``
             palette to use
-        x : array_like
-            Continuous values to scale
         na_value : object
             Value to use for missing values.
 
@@ -302,8 +669,8 @@ class scale_discrete:
         out : array_like
             Values mapped onto a palette
         """
-        n = len(limits)
-        pal = np.asarray(palette(n))[match(x, limits)]
+        n = len(self._limits)
+        pal = np.asarray(palette(n))[self.get_indexer(x)]
         nas = pd.isna(x)  # type: ignore
         try:
             pal[nas] = na_value
@@ -311,3 +678,22 @@ class scale_discrete:
             pal = [na_value if isna else v for v, isna in zip(pal, nas)]
 
         return pal
+
+
+def _is_chunks(x: Any) -> bool:
+    """
+    Return True if x is an iterable of arrays
+
+    An array-like of values, e.g. a list of numbers, is not.
+    """
+    if isinstance(x, Iterator):
+        return True
+    elif (
+        not isinstance(x, Iterable)
+        or isinstance(x, (str, bytes))
+        or hasattr(x, "__array__")
+    ):
+        return False
+
+    items = list(x)
+    return len(items) > 0 and all(np.ndim(item) > 0 for item in items)
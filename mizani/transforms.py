@@ -36,6 +36,7 @@ import pandas as pd
 from ._datetime.utils import datetime_to_num, num_to_datetime
 from ._timedelta.utils import num_to_timedelta, timedelta_to_num
 from .breaks import (
+    breaks_batch,
     breaks_date,
     breaks_extended,
     breaks_log,
@@ -54,6 +55,9 @@ from .labels import (
 if TYPE_CHECKING:
     from typing import Any, Sequence, Type
 
+    from numpy.typing import NDArray
+    from pandas.arrays import DatetimeArray, TimedeltaArray
+
     from mizani.typing import (
         BreaksFunction,
         DatetimeArrayLike,
@@ -62,7 +66,7 @@ if TYPE_CHECKING:
         FormatFunction,
         InverseFunction,
         MinorBreaksFunction,
-        NDArrayDatetime,
+        NDArrayAny,
         NDArrayFloat,
         TFloatArrayLike,
         TimedeltaArrayLike,
@@ -218,6 +222,34 @@ class trans(ABC):
         )
         return breaks
 
+    def breaks_batch(
+        self, limits: Sequence[DomainType] | NDArrayAny
+    ) -> tuple[NDArrayAny, NDArray[np.intp]]:
+        """
+        Calculate breaks for many pairs of limits
+
+        The breaks are calculated with :meth:`breaks`, once for each
+        distinct pair of limits.
+
+        Parameters
+        ----------
+        limits : array_like
+            The scale limits of each panel. Shape ``(m, 2)``.
+
+        Returns
+        -------
+        values : array
+            The breaks of all the limits, one after the other.
+        offsets : array
+            Array of size ``m + 1``. The breaks of the ``i``-th pair
+            of limits are ``values[offsets[i]:offsets[i+1]]``.
+
+        See Also
+        --------
+        mizani.breaks.breaks_batch
+        """
+        return breaks_batch(self.breaks, limits)
+
     def format(self, x: Any) -> Sequence[str]:
         """
         Format breaks
@@ -779,7 +811,7 @@ class datetime_trans(trans):
 
         return datetime_to_num(x)  # type: ignore
 
-    def inverse(self, x: FloatArrayLike) -> NDArrayDatetime:  # pyright: ignore[reportIncompatibleMethodOverride]
+    def inverse(self, x: FloatArrayLike) -> DatetimeArray:  # pyright: ignore[reportIncompatibleMethodOverride]
         """
         Transform to date from numerical format
         """
@@ -819,7 +851,7 @@ class timedelta_trans(trans):
         """
         return timedelta_to_num(x)
 
-    def inverse(self, x: FloatArrayLike) -> Sequence[pd.Timedelta]:  # pyright: ignore[reportIncompatibleMethodOverride]
+    def inverse(self, x: FloatArrayLike) -> TimedeltaArray:  # pyright: ignore[reportIncompatibleMethodOverride]
         """
         Transform to Timedelta from numerical format
         """
@@ -32,6 +32,8 @@ if TYPE_CHECKING:
     NDArrayAny: TypeAlias = NDArray[Any]
     NDArrayFloat: TypeAlias = NDArray[np.floating]
     NDArrayDatetime: TypeAlias = NDArray[np.datetime64]
+    NDArrayTimedelta: TypeAlias = NDArray[np.timedelta64]
+    NDArrayStr: TypeAlias = NDArray[np.str_]
 
     # Panda Series
     AnySeries: TypeAlias = pd.Series[Any]
@@ -46,7 +48,10 @@ if TYPE_CHECKING:
         NDArrayDatetime | DatetimeSeries | Sequence[datetime]
     )
     TimedeltaArrayLike: TypeAlias = (
-        Sequence[timedelta] | Sequence[pd.Timedelta] | TimedeltaSeries
+        Sequence[timedelta]
+        | Sequence[pd.Timedelta]
+        | TimedeltaSeries
+        | NDArrayTimedelta
     )
 
     # Type variable
@@ -90,10 +95,15 @@ if TYPE_CHECKING:
     # Ref: https://github.com/numpy/numpy/issues/16544
     RGBColorArray: TypeAlias = NDArrayFloat
 
+    # Rows of (x, y0, y1) for each channel
+    SegmentData: TypeAlias = (
+        Sequence[tuple[float, float, float]] | NDArrayFloat
+    )
+
     class SegmentedColorMapData(TypedDict):
-        red: Sequence[tuple[float, float, float]]
-        green: Sequence[tuple[float, float, float]]
-        blue: Sequence[tuple[float, float, float]]
+        red: SegmentData
+        green: SegmentData
+        blue: SegmentData
 
     class SegmentFunctionColorMapData(TypedDict):
         red: Callable[[NDArrayFloat], NDArrayFloat]
@@ -111,6 +121,7 @@ if TYPE_CHECKING:
         "seq",
     ]
     ColorPalette: TypeAlias = palette
+    ColorPaletteOutput: TypeAlias = Literal["list", "array", "uint8"]
 
     Timedelta: TypeAlias = timedelta | pd.Timedelta
     Datetime: TypeAlias = date | datetime | np.datetime64
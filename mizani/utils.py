@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import sys
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, overload
+from typing import TYPE_CHECKING, NamedTuple, overload
 from warnings import warn
 
 import numpy as np
@@ -13,6 +15,8 @@ if TYPE_CHECKING:
     from datetime import tzinfo
     from typing import Any, Sequence, TypeGuard, TypeVar
 
+    from numpy.typing import NDArray
+
     from mizani.typing import (
         AnyArrayLike,
         FloatArrayLike,
@@ -36,6 +40,7 @@ __all__ = [
     "get_timezone",
     "has_dtype",
     "forward_fill",
+    "LRUCache",
 ]
 
 # Use sqrt(epsilon) to correct for loss of precision due floating point
@@ -115,7 +120,7 @@ def match(
     nomatch: int = -1,
     incomparables: Any = None,
     start: int = 0,
-) -> list[int]:
+) -> NDArray[np.intp]:
     """
     Return a vector of the positions of (first)
     matches of its first argument in its second.
@@ -138,22 +143,89 @@ def match(
         is assigned the nomatch value.
     start: int
         Type of indexing to use. Most likely 0 or 1
+
+    Returns
+    -------
+    out : numpy.ndarray
+        Integer positions
+
+    Examples
+    --------
+    >>> match(["b", "c", "a", "z"], ["a", "b", "c", "a"])
+    array([ 1,  2,  0, -1])
+    >>> match(["b", "c", "a", "z"], ["a", "b", "c"], incomparables=["c"])
+    array([ 1, -1,  0, -1])
     """
-    # NOTE: This function gets called a lot. If it can
-    # be optimised, it should.
-    lookup: dict[Any, int] = {}
-    for i, x in enumerate(v2, start=start):
-        if x not in lookup:
-            lookup[x] = i
-
-    if incomparables:
-        skip = set(incomparables)
-        lst = [
-            lookup.get(x, nomatch) if x not in skip else nomatch for x in v1
-        ]
+    # NOTE: This function gets called a lot. The matching is done
+    # with the hash table of a pandas Index.
+    index = to_index(v2)
+    if index.is_unique:
+        positions = get_indexer(index, v1)
     else:
-        lst = [lookup.get(x, nomatch) for x in v1]
-    return lst
+        # Only the first occurrence of a value can be matched
+        first = ~index.duplicated()
+        positions = get_indexer(index[first], v1)
+        positions = np.append(np.flatnonzero(first), -1)[positions]
+
+    nomatch_bool_idx = positions == -1
+    if incomparables is not None and len(incomparables):
+        skip = to_index(incomparables).unique()
+        nomatch_bool_idx |= get_indexer(skip, v1) != -1
+
+    if start:
+        positions += start
+    positions[nomatch_bool_idx] = nomatch
+    return positions
+
+
+def to_index(x: AnyArrayLike | pd.Index) -> pd.Index:
+    """
+    Convert x to a pandas Index
+
+    Unlike :class:`pandas.Index`, a sequence of tuples does not
+    become a :class:`pandas.MultiIndex`.
+    """
+    if isinstance(x, pd.Index):
+        return x
+    return pd.Index(x, tupleize_cols=False)
+
+
+def get_indexer(
+    index: pd.Index, x: AnyArrayLike | pd.Index
+) -> NDArray[np.intp]:
+    """
+    Return the positions of x in a (unique) index
+
+    Parameters
+    ----------
+    index : pandas.Index
+        Values to match against. They must be unique.
+    x : array-like
+        Values to locate. Those that are not in the index get -1.
+    """
+    if isinstance(getattr(x, "dtype", None), pd.CategoricalDtype):
+        # Locate the categories, the codes do the rest
+        cat = pd.Categorical(x)
+        cat_positions = np.append(get_indexer(index, cat.categories), -1)
+        return cat_positions[cat.codes]
+
+    if isinstance(x, np.ndarray):
+        # Inferring a dtype for the target costs more than the lookup
+        target = pd.Index(x, dtype=x.dtype, copy=False, tupleize_cols=False)
+    else:
+        target = to_index(x)
+
+    # Unlike a dict, an Index does not match True with 1 and False
+    # with 0, so booleans are compared as the other numbers.
+    kinds = {target.dtype.kind, index.dtype.kind}
+    if len(kinds) == 2 and "b" in kinds and kinds <= set("biuf"):
+        target = to_index(target)
+        if target.dtype.kind == "b":
+            target = target.astype(index.dtype)
+        else:
+            index = index.astype(target.dtype)
+
+    return index.get_indexer(target)
 
 
 def precision(x: FloatArrayLike | float) -> float:
@@ -480,3 +552,114 @@ def trim_breaks(breaks: Sequence[TC], limits: tuple[TC, TC]) -> Sequence[TC]:
             stop = stop + 1
 
     return breaks[start : stop + 1]
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of an :class:`LRUCache`
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """
+    A bounded and thread-safe least recently used cache
+
+    When the cache is full, adding an item evicts the item that
+    was used the longest time ago.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of items in the cache.
+
+    Examples
+    --------
+    >>> cache = LRUCache(maxsize=2)
+    >>> cache.put("a", 1)
+    >>> cache.put("b", 2)
+    >>> cache.get("a")
+    1
+    >>> cache.put("c", 3)  # evicts "b"
+    >>> cache.get("b") is None
+    True
+    >>> cache.info()
+    CacheInfo(hits=1, misses=1, maxsize=2, currsize=2)
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive. Got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.info()})"
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    # Copies of the objects that hold a cache share it
+    def __copy__(self) -> LRUCache:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> LRUCache:
+        return self
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Return the value of key, or default if key is not cached
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Any, value: Any):
+        """
+        Add a value to the cache
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove all items and reset the statistics
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Return the hits, misses, maximum size and current size
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
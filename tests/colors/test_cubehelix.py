@@ -14,3 +14,14 @@ def test_continuous():
     assert colors[2] is None
     assert colors[4] is None
     assert all(colors[i].startswith("#") for i in (0, 1, 3))
+
+
+def test_continuous_uint8():
+    x = [0.1, 0.2, float("nan"), 0.4]
+    chmap = CubeHelixMap()
+    hex_colors = chmap.continuous_palette(x)
+    rgba = chmap.continuous_palette(x, output="uint8")
+    assert rgba.shape == (4, 4)
+    assert rgba[2].tolist() == [0, 0, 0, 0]
+    for c, h in zip(rgba[[0, 1, 3]], [hex_colors[i] for i in (0, 1, 3)]):
+        assert "#{:02x}{:02x}{:02x}".format(*c[:3]) == h
@@ -0,0 +1,46 @@
+import numpy as np
+import numpy.testing as npt
+
+from mizani._colors import hsluv
+from mizani._colors._hex import (
+    hex_to_rgb256,
+    rgb256_to_hex,
+    rgb_to_hex_array,
+)
+
+
+def test_rgb_to_hex_array():
+    rng = np.random.default_rng(123)
+    rgb = rng.uniform(0, 1, (500, 3))
+    rgb[:3] = [[0, 0, 0], [1, 1, 1], [0.5, 0.5, 0.5]]
+    result = rgb_to_hex_array(rgb)
+    expected = [hsluv.rgb_to_hex(c) for c in rgb]
+    assert result.dtype == np.dtype("U7")
+    assert result.tolist() == expected
+
+    # RGBA input, the alpha is ignored
+    rgba = np.column_stack([rgb, np.ones(len(rgb))])
+    assert rgb_to_hex_array(rgba).tolist() == expected
+
+
+def test_rgb_to_hex_array_clips():
+    result = rgb_to_hex_array([[-0.5, 1.5, 0.5]])
+    assert result.tolist() == ["#00ff80"]
+
+
+def test_rgb256_to_hex():
+    rgb256 = np.array([[0, 15, 16], [171, 205, 239], [255, 255, 255]])
+    assert rgb256_to_hex(rgb256).tolist() == [
+        "#000f10",
+        "#abcdef",
+        "#ffffff",
+    ]
+    assert len(rgb256_to_hex(np.zeros((0, 3)))) == 0
+
+
+def test_hex_to_rgb256():
+    rng = np.random.default_rng(123)
+    rgb256 = rng.integers(0, 256, (500, 3)).astype(np.uint8)
+    hex_colors = rgb256_to_hex(rgb256)
+    npt.assert_array_equal(hex_to_rgb256(hex_colors), rgb256)
+    npt.assert_array_equal(hex_to_rgb256(np.char.upper(hex_colors)), rgb256)
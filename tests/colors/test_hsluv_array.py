@@ -0,0 +1,160 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from mizani._colors import _hsluv_array as hsluv_array
+from mizani._colors import hsluv
+
+# Saturations of colors outside the gamut can be very large, so the
+# tolerance is relative for the large values
+ATOL = 1e-10
+RTOL = 1e-12
+
+
+def random_colors(n: int = 5000):
+    rng = np.random.default_rng(123)
+    hsl = np.column_stack(
+        [
+            rng.uniform(0, 360, n),
+            rng.uniform(0, 100, n),
+            rng.uniform(0, 100, n),
+        ]
+    )
+    # White, black and grey
+    hsl[:6, 2] = [0, 1e-9, 100, 100 - 1e-8, 8, 50]
+    hsl[6:12, 1] = 0
+
+    rgb = rng.uniform(0, 1, (n, 3))
+    rgb[:4] = [[0, 0, 0], [1, 1, 1], [0.5, 0.5, 0.5], [1, 0, 0]]
+
+    lch = np.column_stack(
+        [
+            rng.uniform(0, 100, n),
+            rng.uniform(0, 150, n),
+            rng.uniform(0, 360, n),
+        ]
+    )
+    lch[:4, 1] = 0
+    return {"hsluv": hsl, "hpluv": hsl, "rgb": rgb, "lch": lch}
+
+
+COLORS = random_colors()
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "hsluv_to_rgb",
+        "hsluv_to_lch",
+        "hpluv_to_rgb",
+        "hpluv_to_lch",
+        "rgb_to_hsluv",
+        "rgb_to_hpluv",
+        "rgb_to_lch",
+        "rgb_to_xyz",
+        "lch_to_rgb",
+        "lch_to_luv",
+        "lch_to_hsluv",
+        "lch_to_hpluv",
+    ],
+)
+def test_same_as_scalar(name):
+    x = COLORS[name.split("_to_")[0]]
+    func = getattr(hsluv, name)
+    result = getattr(hsluv_array, f"{name}_array")(x)
+    expected = [func(tuple(color)) for color in x]
+    assert result.shape == x.shape
+    assert_allclose(result, expected, rtol=RTOL, atol=ATOL)
+
+
+def test_same_as_scalar_intermediate():
+    xyz = hsluv_array.rgb_to_xyz_array(COLORS["rgb"])
+    luv = hsluv_array.xyz_to_luv_array(xyz)
+    for name, x in [
+        ("xyz_to_rgb", xyz),
+        ("xyz_to_luv", xyz),
+        ("luv_to_xyz", luv),
+        ("luv_to_lch", luv),
+    ]:
+        func = getattr(hsluv, name)
+        result = getattr(hsluv_array, f"{name}_array")(x)
+        expected = [func(tuple(color)) for color in x]
+        assert_allclose(result, expected, rtol=RTOL, atol=ATOL)
+
+
+def test_hex():
+    hsl, lch = COLORS["hsluv"], COLORS["lch"]
+    hex_colors = hsluv_array.hsluv_to_hex_array(hsl)
+    assert hex_colors.tolist() == [hsluv.hsluv_to_hex(tuple(c)) for c in hsl]
+    assert hsluv_array.hpluv_to_hex_array(hsl).tolist() == [
+        hsluv.hpluv_to_hex(tuple(c)) for c in hsl
+    ]
+    assert hsluv_array.lch_to_hex_array(lch).tolist() == [
+        hsluv.lch_to_hex(tuple(c)) for c in lch
+    ]
+
+    assert_allclose(
+        hsluv_array.hex_to_hsluv_array(hex_colors),
+        [hsluv.hex_to_hsluv(c) for c in hex_colors],
+        rtol=RTOL,
+        atol=ATOL,
+    )
+    assert_allclose(
+        hsluv_array.hex_to_hpluv_array(hex_colors),
+        [hsluv.hex_to_hpluv(c) for c in hex_colors],
+        rtol=RTOL,
+        atol=ATOL,
+    )
+
+
+def test_snapshot():
+    filename = Path(__file__).parent / "data/hsluv-snapshot-rev4.json"
+    with filename.open() as f:
+        snapshot = json.load(f)
+
+    hex_colors = list(snapshot)
+
+    def expected(space):
+        return np.array([snapshot[c][space] for c in hex_colors])
+
+    def assert_close(a, b):
+        assert_allclose(a, b, atol=1e-11)
+
+    rgb = hsluv_array.hex_to_hsluv_array(hex_colors)
+    assert_close(rgb, expected("hsluv"))
+    assert_close(hsluv_array.hex_to_hpluv_array(hex_colors), expected("hpluv"))
+    assert_close(
+        hsluv_array.rgb_to_xyz_array(expected("rgb")), expected("xyz")
+    )
+    assert_close(
+        hsluv_array.xyz_to_luv_array(expected("xyz")), expected("luv")
+    )
+    assert_close(
+        hsluv_array.luv_to_lch_array(expected("luv")), expected("lch")
+    )
+    assert_close(
+        hsluv_array.hsluv_to_lch_array(expected("hsluv")), expected("lch")
+    )
+    assert_close(
+        hsluv_array.hpluv_to_lch_array(expected("hpluv")), expected("lch")
+    )
+    assert_close(
+        hsluv_array.lch_to_luv_array(expected("lch")), expected("luv")
+    )
+    assert_close(
+        hsluv_array.luv_to_xyz_array(expected("luv")), expected("xyz")
+    )
+    assert_close(
+        hsluv_array.xyz_to_rgb_array(expected("xyz")), expected("rgb")
+    )
+    assert (
+        hsluv_array.hsluv_to_hex_array(expected("hsluv")).tolist()
+        == hex_colors
+    )
+    assert (
+        hsluv_array.hpluv_to_hex_array(expected("hpluv")).tolist()
+        == hex_colors
+    )
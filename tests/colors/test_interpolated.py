@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 
-from mizani._colors import InterpolatedMap
+from mizani._colors import InterpolatedMap, hsluv
 
 
 def test_number_of_values():
@@ -19,3 +20,21 @@ def test_discrete():
     colors = gmap.discrete_palette(5)
     assert len(colors) == 5
     assert [c is not None and c.startswith("#") for c in colors]
+
+
+def test_lookup_tables():
+    gmap = InterpolatedMap(["blue", "red", "green"], [0, 0.3, 1])
+    x = np.linspace(0, 1, 1000)
+    idx = np.round(x * 255 + 1e-12).astype(int)
+    rgb = np.column_stack(
+        [gmap._r_lookup[idx], gmap._g_lookup[idx], gmap._b_lookup[idx]]
+    )
+    expected = [hsluv.rgb_to_hex(c) for c in rgb]
+    assert gmap.continuous_palette(x) == expected
+
+    assert gmap._hex_lookup.shape == (256,)
+    assert gmap._rgba256_lookup.shape == (256, 4)
+    assert gmap._rgba256_lookup.dtype == np.uint8
+    assert (gmap._rgba256_lookup[:, 3] == 255).all()
+    # The tables are created once
+    assert gmap._hex_lookup is gmap._hex_lookup
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from mizani._colors import get_named_color
@@ -6,3 +7,39 @@ from mizani._colors import get_named_color
 def test_bad_name():
     with pytest.raises(ValueError):
         get_named_color("tada")
+
+
+def test_colormaps():
+    from mizani._colors.named_colors import _colormap_lookup
+
+    lookup = _colormap_lookup()
+    viridis = lookup["viridis"]
+    assert lookup["viridis"] is viridis
+    assert viridis.discrete_palette(2) == ["#440154", "#fde725"]
+
+    # Only the colormaps that are looked up are created
+    assert list(lookup.d) == ["viridis"]
+
+    for name in lookup.modules:
+        colors = lookup[name].continuous_palette([0, 0.5, 1])
+        assert all(c.startswith("#") and len(c) == 7 for c in colors)
+
+    with pytest.raises(ValueError):
+        lookup["tada"]
+
+
+def test_colormap_data():
+    from mizani._colors._colormaps._maps import _data
+
+    data = _data._colormap_data()
+    for key in data.files:
+        arr = data[key]
+        assert arr.dtype == np.float64
+        assert arr.ndim == 2 and arr.shape[1] == 3
+        if key.startswith("listed/"):
+            assert ((arr >= 0) & (arr <= 1)).all()
+        else:
+            # The segments go from 0 to 1
+            x = arr[:, 0]
+            assert x[0] == 0 and x[-1] == 1
+            assert (np.diff(x) >= 0).all()
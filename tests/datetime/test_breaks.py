@@ -1,9 +1,17 @@
 import sys
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 
+import numpy as np
 import pytest
 
-from mizani._datetime.breaks import by_n, by_width
+from mizani._datetime import rounding
+from mizani._datetime.breaks import (
+    by_n,
+    by_width,
+    datetime64_range,
+    round_limits,
+)
 from mizani._datetime.utils import dt
 
 LT_PY311 = sys.version_info < (3, 11)
@@ -30,6 +38,14 @@ def test_by_n_microseconds():
     ]
 
 
+def test_by_n_microseconds_round_up_to_second():
+    # The upper limit rounds up to the next second
+    l1 = dt(("2025-01-01 01:10:30.999000", "2025-01-01 01:10:31.999999"))
+    breaks = by_n(l1)
+    assert breaks[0] <= l1[0]
+    assert breaks[-1] == datetime(2025, 1, 1, 1, 10, 32)
+
+
 def test_by_n_seconds():
     l1 = dt(("2025-01-01 01:10:30", "2025-01-01 01:11:30"))
     l2 = dt(("2025-01-01 01:10:30", "2025-01-01 01:11:31"))
@@ -263,6 +279,51 @@ def test_by_n_century():
     ]
 
 
+def test_datetime64_range():
+    start = np.datetime64("2024-01-31T06:00", "us")
+    until = np.datetime64("2024-12-31T06:00", "us")
+    res = datetime64_range(start, until, "months", 1)
+    # The months without a 31st day are skipped
+    assert [str(d)[:10] for d in res] == [
+        "2024-01-31",
+        "2024-03-31",
+        "2024-05-31",
+        "2024-07-31",
+        "2024-08-31",
+        "2024-10-31",
+        "2024-12-31",
+    ]
+
+    start = np.datetime64("2024-02-29", "us")
+    until = np.datetime64("2033-01-01", "us")
+    res = datetime64_range(start, until, "years", 1)
+    assert [str(d)[:10] for d in res] == [
+        "2024-02-29",
+        "2028-02-29",
+        "2032-02-29",
+    ]
+
+    res = datetime64_range(start, until, "weeks", 200)
+    assert len(res) == 3
+    assert (np.diff(res) == np.timedelta64(1400, "D")).all()
+    assert len(datetime64_range(until, start, "days", 1)) == 0
+
+
+def test_round_limits():
+    # The limits are rounded as by the scalar rounders, in the clock
+    # time of the start
+    NY = ZoneInfo("America/New_York")
+    start = datetime(2025, 3, 8, 20, 17, 3, tzinfo=NY)
+    until = datetime(2025, 11, 2, 1, 30, 59, tzinfo=NY)
+    for name in ("seconds", "minutes", "hours", "days", "months", "years"):
+        rounder = getattr(rounding, name)
+        t0, t1 = round_limits(rounder, start, until)
+        naive_start = start.replace(tzinfo=None)
+        naive_until = until.replace(tzinfo=None)
+        assert t0 == np.datetime64(rounder.floor(naive_start))
+        assert t1 == np.datetime64(rounder.ceil(naive_until))
+
+
 def test_by_width_microseconds():
     l1 = dt(("2025-01-01 01:10:30.000250", "2025-01-01 01:10:30.000600"))
     assert by_width(l1, "250 microseconds") == [
@@ -464,3 +525,19 @@ def test_by_width_century():
 def test_breaks_timezone():
     l1 = dt(("2025-01-01 01:10:30+03", "2025-01-03 05:10:30+03"))
     assert all(b.tzinfo is not None for b in by_n(l1))
+
+    # Breaks are at regular clock times across daylight saving changes
+    NY = ZoneInfo("America/New_York")
+    l2 = (
+        datetime(2025, 3, 8, 20, tzinfo=NY),
+        datetime(2025, 3, 10, tzinfo=NY),
+    )
+    assert [b.hour for b in by_width(l2, "6 hours")] == [
+        18,
+        0,
+        6,
+        12,
+        18,
+        0,
+    ]
+    assert all(b.tzinfo is NY for b in by_width(l2, "6 hours"))
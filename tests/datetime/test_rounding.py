@@ -1,7 +1,32 @@
 from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import pytest
 
 from mizani._datetime import rounding
 
+ROUNDERS = [
+    rounding.microseconds,
+    rounding.seconds,
+    rounding.minutes,
+    rounding.hours,
+    rounding.days,
+    rounding.weeks,
+    rounding.months,
+    rounding.years,
+    rounding.decades,
+    rounding.centurys,
+]
+
+
+def as_tz(x, tz):
+    """
+    Convert UTC datetime64 values to timezone aware datetimes
+    """
+    return pd.DatetimeIndex(x).tz_localize("UTC").tz_convert(tz)
+
 
 def test_microseconds():
     d = datetime(2025, 6, 10, 10, 10, 24, 1)
@@ -101,3 +126,49 @@ def test_centurys():
     assert rounding.centurys.ceil(d1) == datetime(2100, 1, 1)
     assert rounding.centurys.ceil(d2) == datetime(2100, 1, 1)
     assert rounding.centurys.ceil(d3) == datetime(2000, 1, 1)
+
+
+@pytest.mark.parametrize("rounder", ROUNDERS)
+def test_array_rounding(rounder):
+    rng = np.random.default_rng(123)
+    us = rng.integers(-(2 * 10**15), 4 * 10**15, 500)
+    us[:100] = us[:100] // 10**6 * 10**6
+    us[100:200] = us[100:200] // (86400 * 10**6) * (86400 * 10**6)
+    x = us.astype("datetime64[us]")
+    lst = x.tolist()
+
+    floor, ceil = rounder.floor_array(x), rounder.ceil_array(x)
+    assert floor.dtype == x.dtype
+    assert floor.tolist() == [rounder.floor(d) for d in lst]
+    assert ceil.tolist() == [rounder.ceil(d) for d in lst]
+
+    # Sequences of datetimes
+    res = rounder.floor_array(lst)
+    assert res.tolist() == [rounder.floor(d) for d in lst]
+
+    # Timezone aware datetimes are rounded in local time, and the
+    # results are UTC instants
+    tz = ZoneInfo("America/New_York")
+    idx = pd.DatetimeIndex(x[:200]).tz_localize("UTC").tz_convert(tz)
+    res = rounder.ceil_array(idx)
+    assert isinstance(res, np.ndarray)
+    assert list(as_tz(res, tz)) == [
+        rounder.ceil(d.to_pydatetime()) for d in idx
+    ]
+
+
+def test_array_rounding_dst():
+    tz = ZoneInfo("America/New_York")
+    # Two hours after midnight is the start of daylight saving time
+    x = pd.DatetimeIndex(["2025-03-09 01:30", "2025-03-09 04:00", "NaT"])
+    x = x.tz_localize(tz)
+    res = as_tz(rounding.hours.ceil_array(x), tz)
+    assert res[0] == datetime(2025, 3, 9, 3, tzinfo=tz)
+    assert res[1] == x[1]
+    assert res[2] is pd.NaT
+
+    # The ambiguous hour after the end of daylight saving time
+    x = pd.DatetimeIndex(["2025-11-02 05:40", "2025-11-02 06:40"], tz="UTC")
+    res = rounding.hours.floor_array(x.tz_convert(tz))
+    expected = ["2025-11-02T05:00", "2025-11-02T06:00"]
+    assert list(res) == list(np.array(expected, dtype=res.dtype))
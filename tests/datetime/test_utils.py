@@ -2,6 +2,7 @@ from datetime import datetime
 from zoneinfo import ZoneInfo
 
 import numpy as np
+import pandas as pd
 import pytest
 from dateutil.relativedelta import relativedelta
 
@@ -27,6 +28,18 @@ def test_datetime_to_num():
     assert len(datetime_to_num([])) == 0
 
 
+def test_datetime_to_num_tz_aware_pandas():
+    x = pd.date_range("2022-03-12", periods=48, freq="h", tz="US/Eastern")
+    expected = datetime_to_num(list(x))
+    np.testing.assert_array_equal(datetime_to_num(x), expected)
+    np.testing.assert_array_equal(datetime_to_num(pd.Series(x)), expected)
+
+    x = pd.Series([x[0], pd.NaT], dtype=x.dtype)
+    res = datetime_to_num(x)
+    assert res[0] == expected[0]
+    assert np.isnan(res[1])
+
+
 def test_num_to_datetime():
     limits = num_to_datetime((25552, 27743))
     assert limits[0] == datetime(2039, 12, 17, tzinfo=ZoneInfo("UTC"))
@@ -40,6 +53,24 @@ def test_num_to_datetime():
     with pytest.raises(ValueError):
         num_to_datetime(datetime_to_num(limits))
 
+    with pytest.raises(ValueError):
+        num_to_datetime([0, np.inf])
+
+
+def test_num_to_datetime_array():
+    EST = ZoneInfo("EST")
+    res = num_to_datetime([0, 0.5, np.nan], EST)
+    assert isinstance(res, pd.arrays.DatetimeArray)
+    assert res.tz == EST
+    assert res[0] == datetime(1970, 1, 1, tzinfo=ZoneInfo("UTC"))
+    assert res[1] == datetime(1970, 1, 1, 7, tzinfo=EST)
+    assert res[2] is pd.NaT
+
+    # Far from the epoch, the microseconds are rounded to 20
+    x = np.array([-80000, 80000]) + 1e-5 / 86400
+    res = num_to_datetime(x)
+    assert list(res.microsecond) == [0, 0]
+
 
 def test_dt():
     assert dt("2020-02-03 10:11:12") == datetime(2020, 2, 3, 10, 11, 12)
@@ -1,3 +1,4 @@
+import copy
 from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 
@@ -7,6 +8,7 @@ import pandas as pd
 import pytest
 
 from mizani.breaks import (
+    breaks_batch,
     breaks_date,
     breaks_date_width,
     breaks_extended,
@@ -16,7 +18,8 @@ from mizani.breaks import (
     minor_breaks,
     minor_breaks_trans,
 )
-from mizani.transforms import log_trans, trans
+from mizani.transforms import identity_trans, log_trans, trans
+from mizani.utils import LRUCache
 
 
 def test_log_breaks():
@@ -369,6 +372,12 @@ def test_breaks_timedelta():
         timedelta(days=10000),
     ]
 
+    # Beyond the range of timedelta64[ns]
+    limits = (timedelta(days=0), timedelta(days=900000))
+    assert list(breaks(limits)) == [
+        timedelta(days=200000 * i) for i in range(6)
+    ]
+
     limits = (timedelta(), timedelta(microseconds=25))
     assert list(breaks(limits)) == [
         timedelta(0),
@@ -438,3 +447,130 @@ def test_breaks_extended():
     limits = [np.pi, np.pi]
     assert len(breaks(limits)) == 1
     assert breaks(limits)[0] == limits[1]
+
+    # Wide limits, many candidate starting points
+    breaks = breaks_extended(n=5, cache=None)
+    npt.assert_array_equal(
+        breaks((1e-3, 1e6)), [0, 250000, 500000, 750000, 1000000]
+    )
+    breaks = breaks_extended(n=5, only_inside=True, cache=None)
+    npt.assert_array_equal(breaks((-1e9, 1)), [-1e9, -7.5e8, -5e8, -2.5e8, 0])
+
+
+@pytest.mark.parametrize("only_inside", [False, True])
+def test_breaks_extended_batch_scoring(monkeypatch, only_inside):
+    # The candidates scored one at a time and as an array give the
+    # same breaks
+    limits = [(0, 10), (1e-3, 1e6), (-1e9, 1), (0.999999, 1.000001)]
+    breaks = breaks_extended(n=7, only_inside=only_inside, cache=None)
+    expected = [breaks(lim) for lim in limits]
+
+    monkeypatch.setattr("mizani.breaks.EXTENDED_BATCH_STARTS", 0)
+    for lim, exp in zip(limits, expected):
+        npt.assert_array_equal(breaks(lim), exp)
+
+
+def test_breaks_batch():
+    func = breaks_extended(n=5, cache=None)
+    limits = np.array([(0, 9), (0.13, 8.7), (-1, 1), (0, 9), (5, 5)])
+    values, offsets = breaks_batch(func, limits)
+    assert len(offsets) == len(limits) + 1
+    for i, lim in enumerate(limits):
+        npt.assert_array_equal(values[offsets[i] : offsets[i + 1]], func(lim))
+
+    # Other breaks and transforms
+    t = log_trans()
+    limits = [(1, 1000), (10, 10**6), (1, 1000)]
+    values, offsets = t.breaks_batch(limits)
+    for i, lim in enumerate(limits):
+        npt.assert_array_equal(
+            values[offsets[i] : offsets[i + 1]], t.breaks(lim)
+        )
+
+    values, offsets = breaks_batch(breaks_log(), [])
+    assert len(values) == 0
+    npt.assert_array_equal(offsets, [0])
+
+    with pytest.raises(ValueError):
+        breaks_batch(func, [0, 1, 2])
+
+
+def test_breaks_date_cache():
+    cache = LRUCache(maxsize=10)
+    UTC = ZoneInfo("UTC")
+    EAT = ZoneInfo("Africa/Kampala")
+    limits = (
+        datetime(2020, 1, 1, tzinfo=UTC),
+        datetime(2020, 1, 3, tzinfo=UTC),
+    )
+    breaks = breaks_date(cache=cache)
+    expected = breaks_date(cache=None)(limits)
+
+    assert breaks(limits) == expected
+    assert breaks(limits) == expected
+    assert cache.info().hits == 1
+
+    # The cached breaks are returned as a copy
+    breaks(limits).clear()
+    assert breaks(limits) == expected
+
+    # The same instants in another timezone have other breaks
+    limits_eat = (limits[0].astimezone(EAT), limits[1].astimezone(EAT))
+    assert breaks(limits_eat) == breaks_date(cache=None)(limits_eat)
+    assert breaks(limits_eat)[0].tzinfo == EAT
+
+    breaks = breaks_date_width("6 hours", offset=["1 hour"], cache=cache)
+    expected = breaks_date_width("6 hours", offset=["1 hour"], cache=None)
+    assert breaks(limits) == expected(limits)
+    assert breaks(limits) == expected(limits)
+    assert cache.info().misses == 3
+
+    # The cache is not part of the repr or equality and copies share it
+    for b in (breaks_date(), breaks_date_width("1 day")):
+        assert "LRUCache" not in repr(b)
+        assert copy.deepcopy(b).cache is b.cache
+    assert breaks_date() == breaks_date(cache=None)
+
+
+def test_breaks_extended_cache():
+    cache = LRUCache(maxsize=2)
+    breaks = breaks_extended(n=5, cache=cache)
+    uncached = breaks_extended(n=5, cache=None)
+
+    limits = (0.13, 8.7)
+    result = breaks(limits)
+    npt.assert_array_equal(result, uncached(limits))
+    assert cache.info().misses == 1
+
+    # The cached breaks are returned as a copy
+    result[0] = -1
+    npt.assert_array_equal(breaks(limits), uncached(limits))
+    assert cache.info().hits == 1
+
+    # Different parameters do not share breaks
+    npt.assert_array_equal(
+        breaks_extended(n=8, cache=cache)(limits),
+        breaks_extended(n=8, cache=None)(limits),
+    )
+    assert cache.info().misses == 2
+
+    # Limits are only similar up to the cache digits
+    breaks = breaks_extended(n=5, cache=cache, cache_digits=3)
+    breaks((0, 10.0001))
+    breaks((0, 10.0002))
+    assert cache.info().hits == 2
+    assert len(cache) == 2
+
+    # Transforms can share a cache
+    cache.clear()
+    t1 = identity_trans(breaks_func=breaks_extended(cache=cache))
+    t2 = identity_trans(breaks_func=breaks_extended(cache=cache))
+    t1.breaks((1, 5))
+    t2.breaks((1, 5))
+    assert cache.info().hits == 1
+
+    # The cache is not part of the repr or equality and copies share it
+    assert "LRUCache" not in repr(breaks_extended())
+    assert breaks_extended() == breaks_extended(cache=None)
+    t3 = copy.deepcopy(identity_trans())
+    assert t3.breaks_func.cache is breaks_extended().cache
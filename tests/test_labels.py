@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import tracemalloc
 import warnings
 from datetime import datetime, timedelta, tzinfo
 from zoneinfo import ZoneInfo
@@ -99,6 +100,10 @@ def test_label_number():
     label = label_number(precision=2, decimal_mark=",")
     assert label([98.23, 34.67]) == ["98,23", "34,67"]
 
+    # The marks are not mixed up when they are swapped
+    label = label_number(precision=1, big_mark=".", decimal_mark=",")
+    assert label([1234.5, 1234567.25]) == ["1.234,5", "1.234.567,2"]
+
     label = label_number(style_negative="hyphen")
     assert label([-1, 0, 1]) == ["\u22121", "0", "1"]
 
@@ -106,6 +111,53 @@ def test_label_number():
         label_number(accuracy=0.01, precision=2)
 
 
+def test_label_number_same_as_format():
+    # Ties, large, non-finite and random values are formatted
+    # exactly as python does
+    x = np.hstack(
+        [
+            [0.125, 2.675, 1.005, 0.5, 1.5, 2.5, 0, 123456789.125],
+            [1e20, 2**60, np.nan, np.inf],
+            np.random.default_rng(123).normal(0, 1e6, 500),
+        ]
+    )
+    for precision in (0, 2, 3, 18):
+        label = label_number(precision=precision, big_mark=",")
+        expected = [f"{abs(v):,.{precision}f}" for v in x]
+        expected = [
+            f"-{s}" if v < 0 and s.strip("0.,") else s
+            for v, s in zip(x, expected)
+        ]
+        assert label(x) == expected
+
+    label = label_number(big_mark=" ", decimal_mark=",", precision=1)
+    assert label([1234567.89, -1000]) == ["1 234 567,9", "-1 000,0"]
+
+    label = label_number(width=6, fill="*", align="^", prefix="$")
+    assert label([1, -10, 100, 100000]) == [
+        "**$1**",
+        "*-$10*",
+        "*$100*",
+        "$100000",
+    ]
+
+
+def test_label_number_allocations():
+    # The characters of all the labels are created in one array.
+    # With wide labels, any other allocation of that size would
+    # at least double the peak memory.
+    x = np.random.default_rng(123).normal(0, 1e4, 10_000)
+    label = label_number(precision=2, big_mark=",", width=100)
+    tracemalloc.start()
+    try:
+        res = label._format(x)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert res.nbytes >= 100 * 4 * len(x)
+    assert peak < 1.5 * res.nbytes
+
+
 def test_label_log():
     label = label_log()
     assert label([0.001, 0.1, 100]) == ["0.001", "0.1", "100"]
@@ -186,6 +238,33 @@ def test_label_date():
         label_date()(x)
 
 
+def test_label_date_datetime64():
+    x = pd.date_range("2023-03-11 22:30", periods=100, freq="47min", tz="UTC")
+    fmts = [
+        "%Y-%m-%d %H:%M:%S.%f",
+        "%b %d, %Y %I:%M %p",
+        "%A %B %j %y %%",
+        "%Y-%m-%d %Z",  # Not vectorized
+    ]
+    NY = ZoneInfo("America/New_York")
+    for fmt in fmts:
+        expected = [d.astimezone(NY).strftime(fmt) for d in x]
+        assert label_date(fmt, tz=NY)(x) == expected
+        assert label_date(fmt, tz=NY)(pd.Series(x)) == expected
+
+        expected = [d.strftime(fmt) for d in x.tz_localize(None)]
+        assert label_date(fmt)(x.tz_localize(None)) == expected
+        assert label_date(fmt)(x.tz_localize(None).to_numpy()) == expected
+
+    x = np.array(["2020-01-01", "NaT"], dtype="datetime64[D]")
+    assert label_date("%d/%m/%Y")(x) == ["01/01/2020", "NaT"]
+
+    # Naive dates are converted to the timezone with datetime.astimezone
+    x = pd.date_range("2023-03-11", periods=3, freq="D")
+    expected = [d.to_pydatetime().astimezone(NY).strftime("%d %H") for d in x]
+    assert label_date("%d %H", tz=NY)(x.to_numpy()) == expected
+
+
 def test_label_timedelta():
     x = [timedelta(days=7 * i) for i in range(5)]
     labels = label_timedelta()(x)
@@ -223,6 +302,34 @@ def test_label_timedelta():
     ]
 
 
+def test_label_timedelta_arrays():
+    x = pd.to_timedelta([0, 600, 1200, 3600, np.nan], unit="s")
+    expected = ["0 min", "10 min", "20 min", "60 min", "NaT"]
+    assert label_timedelta()(x) == expected
+    assert label_timedelta()(pd.Series(x)) == expected
+    assert label_timedelta()(x.to_numpy()) == expected
+    assert label_timedelta()(list(x[:-1])) == expected[:-1]
+    assert label_timedelta(show_units=False)(x) == [
+        "0",
+        "10",
+        "20",
+        "60",
+        "NaT",
+    ]
+
+    # Beyond the range of timedelta64[ns]
+    x = [timedelta(days=900000), timedelta(days=-1)]
+    assert label_timedelta()(x) == ["900000 d", "-1 d"]
+
+    x = pd.to_timedelta([0, 1, 2], unit="D")
+    label = label_timedelta(units="d", use_si_units=False)
+    assert label(x.to_numpy()) == [
+        "0 days",
+        "1 day",
+        "2 days",
+    ]
+
+
 def test_label_pvalue():
     x = [0.90, 0.15, 0.015, 0.009, 0.0005]
     labels = label_pvalue()(x)
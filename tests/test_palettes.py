@@ -1,7 +1,11 @@
+import colorsys
+import copy
+
 import numpy as np
 import numpy.testing as npt
 import pytest
 
+from mizani._colors import hsluv
 from mizani.palettes import (
     abs_area,
     area_pal,
@@ -22,6 +26,7 @@ from mizani.palettes import (
     rescale_pal,
     xkcd_palette,
 )
+from mizani.utils import LRUCache
 
 
 def test_hls_palette():
@@ -36,6 +41,14 @@ def test_hsluv_palette():
     assert all(len(c) == 3 for c in colors)
 
 
+@pytest.mark.parametrize("l", [0, 0.25, 0.5, 0.6, 1])
+@pytest.mark.parametrize("s", [0, 0.3, 1])
+def test_hls_palette_same_as_colorsys(l, s):
+    hues = (np.linspace(0, 1, 37)[:-1] + 0.01) % 1
+    expected = [colorsys.hls_to_rgb(h, l, s) for h in hues]
+    assert hls_palette(36, h=0.01, l=l, s=s) == expected
+
+
 def test_rescale_pal():
     palette = rescale_pal()
     x = np.arange(0, 1 + 0.01, 0.1)
@@ -100,6 +113,82 @@ def test_hue_pal():
     pal = hue_pal()
     assert pal(3) == ["#f8766d", "#00ba38", "#619cff"]
 
+    pal = hue_pal((30, 300), c=50, l=80, direction=-1, cache=None)
+    hues = np.linspace(30, 300, 50)[::-1]
+    assert pal(50) == [hsluv.lch_to_hex((80, 50, h)) for h in hues]
+
+
+def test_hue_pal_cache():
+    cache = LRUCache(maxsize=10)
+    expected = hue_pal(cache=None)(5)
+    pal = hue_pal(cache=cache)
+    assert pal(5) == expected
+    assert pal(5) == expected
+    assert cache.info().hits == 1
+
+    # The cached colors are returned as a copy
+    pal(5).clear()
+    assert pal(5) == expected
+
+    # Palettes with other parameters do not share colors
+    assert hue_pal(direction=-1, cache=cache)(5) == expected[::-1]
+    assert hls_pal(cache=cache)(5) == hls_pal(cache=None)(5)
+    assert hls_pal(color_space="hsluv", cache=cache)(5) == (
+        hls_pal(color_space="hsluv", cache=None)(5)
+    )
+    assert cache.info().misses == 4
+
+
+@pytest.mark.parametrize(
+    "make_palette",
+    [
+        lambda cache: brewer_pal("div", "RdBu", cache=cache),
+        lambda cache: grey_pal(0.1, 0.9, cache=cache),
+        lambda cache: hls_pal(cache=cache),
+        lambda cache: hue_pal(cache=cache),
+        lambda cache: cmap_d_pal("Set1", cache=cache),
+        lambda cache: cubehelix_pal(rotation=1, cache=cache),
+    ],
+)
+def test_discrete_pal_cache(make_palette):
+    cache = LRUCache(maxsize=10)
+    pal = make_palette(cache)
+    expected = make_palette(None)(6)
+    assert pal(6) == expected
+    assert pal(6) == expected
+    assert pal(3) == make_palette(None)(3)
+    assert cache.info().hits == 1
+    assert cache.info().misses == 2
+
+    # The colors are cached as tuples
+    assert isinstance(cache.get(pal._cache_key(6)), tuple)
+
+    # The cache is not a parameter of the palette
+    assert "LRUCache" not in repr(pal)
+    assert pal == make_palette(None)
+    assert copy.deepcopy(pal).cache is cache
+
+
+def test_discrete_pal_cache_shared():
+    cache = LRUCache(maxsize=10)
+    assert cmap_d_pal("viridis", cache=cache)(5) == cmap_d_pal(
+        "viridis", cache=None
+    )(5)
+    # The reversed colormap has other colors
+    assert cmap_d_pal("viridis_r", cache=cache)(5) == cmap_d_pal(
+        "viridis_r", cache=None
+    )(5)
+
+    # Every call warns about the missing colors, cached or not
+    pal = brewer_pal(cache=cache)
+    for _ in range(2):
+        with pytest.warns(UserWarning):
+            colors = pal(12)
+        assert colors[-3:] == [None, None, None]
+
+    assert cache.info().hits == 1
+    assert cache.info().misses == 3
+
 
 def test_brewer_pal():
     result = brewer_pal()(5)
@@ -151,6 +240,29 @@ def test_brewer_palette_modules():
         get_palette_module("cyclic")
 
 
+def test_brewer_palette_swatches():
+    from mizani._colors._palettes._palette import (
+        RGB256Swatch_to_RGBHexSwatch,
+    )
+    from mizani._colors._palettes.brewer import get_brewer_palette
+
+    bpal = get_brewer_palette("div", "RdBu")
+    for n in range(bpal.min_colors, bpal.max_colors + 1):
+        swatch = bpal.get_swatch(n)
+        hex_swatch = bpal.get_hex_swatch(n)
+        assert hex_swatch == RGB256Swatch_to_RGBHexSwatch(swatch)
+
+        arr = bpal.get_swatch_array(n)
+        assert arr.dtype == np.uint8
+        assert arr.tolist() == [list(color) for color in swatch]
+
+    # Built once, and the callers cannot change them
+    assert bpal.get_swatch_array(3) is bpal.get_swatch_array(3)
+    assert not bpal.get_swatch_array(3).flags.writeable
+    bpal.get_hex_swatch(3).clear()
+    assert len(bpal.get_hex_swatch(3)) == 3
+
+
 def assert_hex_colors(lst):
     assert all(s[0] == "#" and len(s) == 7 for s in lst)
 
@@ -161,12 +273,17 @@ def test_gradient_n_pal():
     assert result[0].lower() == "#ff0000"
     assert result[-1].lower() == "#0000ff"
     assert palette([0])[0].lower() == "#ff0000"
+    assert palette(0.5) == palette([0.5])
 
     # symmetric gradient
     palette = gradient_n_pal(["red", "blue", "red"], [0, 0.5, 1])
     result = palette([0.2, 0.8])
     assert result[0] == result[1]
 
+    rgba = palette([0.2, 0.8, np.nan], output="uint8")
+    npt.assert_array_equal(rgba[0], rgba[1])
+    npt.assert_array_equal(rgba[2], [0, 0, 0, 0])
+
 
 def test_cmap_pal():
     palette = cmap_pal("viridis")
@@ -176,6 +293,34 @@ def test_cmap_pal():
     palette_r = cmap_pal("viridis_r")
     result_r = palette_r([0, 0.25, 0.5, 0.75, 1])
     assert result == result_r[::-1]
+    assert palette(0.5) == palette([0.5])
+
+
+@pytest.mark.parametrize("name", ["viridis", "coolwarm", "gnuplot"])
+def test_cmap_pal_output(name):
+    palette = cmap_pal(name)
+    x = np.array([0, 0.25, np.nan, 0.75, 1, np.inf])
+    bad = ~np.isfinite(x)
+    result = palette(x)
+
+    arr = palette(x, output="array")
+    assert arr.dtype == np.dtype("U7")
+    npt.assert_array_equal(arr.mask, bad)
+    assert arr.tolist() == result
+
+    rgba = palette(x, output="uint8")
+    assert rgba.shape == (len(x), 4)
+    assert rgba.dtype == np.uint8
+    assert (rgba[bad] == 0).all()
+    assert (rgba[~bad, 3] == 255).all()
+    expected = ["#{:02x}{:02x}{:02x}".format(*c) for c in rgba[~bad, :3]]
+    assert expected == [c for c in result if c is not None]
+
+    with pytest.raises(ValueError):
+        palette(x, output="str")  # pyright: ignore[reportCallIssue,reportArgumentType]
+
+    # The input is not modified
+    assert np.isnan(x[2])
 
 
 def test_cmap_d_pal():
@@ -1,10 +1,19 @@
+import pickle
+from functools import partial
+
 import numpy as np
 import numpy.testing as npt
 import pandas as pd
 import pytest
 
-from mizani.bounds import rescale
-from mizani.scale import scale_continuous, scale_discrete
+from mizani.bounds import expand_range, rescale
+from mizani.palettes import cmap_pal
+from mizani.scale import (
+    range_continuous,
+    range_discrete,
+    scale_continuous,
+    scale_discrete,
+)
 from mizani.transforms import identity_trans
 
 
@@ -34,6 +43,115 @@ def test_scale_continuous():
         limits = scale_continuous.train(["a", "b", "c"])
 
 
+def test_range_continuous():
+    rng = np.random.default_rng(123)
+    chunks = [rng.normal(size=100) for _ in range(10)]
+    chunks[3][5] = np.nan
+    chunks[6][:3] = [np.inf, -np.inf, np.nan]
+    expected = scale_continuous.train(np.hstack(chunks))
+
+    r = range_continuous()
+    assert r.is_empty
+    assert r.limits == (-np.inf, np.inf)
+    for chunk in chunks:
+        r.train(chunk)
+    assert r.limits == expected
+
+    # Merging ranges trained separately
+    r1, r2 = range_continuous(), range_continuous()
+    for chunk in chunks[:4]:
+        r1.train(chunk)
+    for chunk in chunks[4:]:
+        r2.train(chunk)
+    assert r1.merge(r2) == r
+    assert range_continuous().merge(r) == r
+    assert r.merge(range_continuous()).limits == expected
+
+    # Pickling
+    r3 = pickle.loads(pickle.dumps(r))
+    assert r3 == r
+    assert r3.train([100]).limits == (expected[0], 100)
+
+    # Initial limits and empty data
+    r4 = range_continuous((0, 1)).train([]).train([np.nan])
+    assert r4.limits == (0, 1)
+
+    # Integer limits are floats, so they can be expanded
+    for dtype in (np.int8, np.uint8):
+        x = np.array([1, 100], dtype=dtype)
+        limits = scale_continuous.train(x)
+        assert all(isinstance(v, np.float64) for v in limits)
+        assert expand_range(limits, mul=0.05) == pytest.approx((-3.95, 104.95))
+
+    r5 = range_continuous().train([0.5]).train(np.array([-100], np.int8))
+    assert all(isinstance(v, np.float64) for v in r5.limits)
+
+    with pytest.raises(TypeError):
+        range_continuous().train(["a", "b"])
+
+
+def test_scale_continuous_map_chunked(tmp_path):
+    x = np.linspace(-2, 12, 1001)
+    x[[3, 50, 999]] = np.nan
+    palette = cmap_pal("viridis")
+    limits = (0, 10)
+    expected = scale_continuous.map(x, palette, limits, na_value="red")
+
+    result = scale_continuous.map_chunked(
+        x, palette, limits, na_value="red", chunksize=64
+    )
+    npt.assert_array_equal(result, expected)
+
+    # Memory-mapped input and caller-supplied output
+    path = tmp_path / "x.dat"
+    mmx = np.memmap(path, dtype=float, mode="w+", shape=x.shape)
+    mmx[:] = x
+    out = np.empty(len(x), dtype=object)
+    result = scale_continuous.map_chunked(
+        mmx, palette, limits, na_value="red", out=out, chunksize=100
+    )
+    assert result is out
+    npt.assert_array_equal(out, expected)
+
+    # An iterator of chunks
+    chunks = iter(np.array_split(x, 7))
+    result = scale_continuous.map_chunked(
+        chunks, palette, limits, na_value="red"
+    )
+    npt.assert_array_equal(result, expected)
+
+    # A list of chunks of different sizes
+    chunks = np.split(x, [100, 350])
+    result = scale_continuous.map_chunked(
+        chunks, palette, limits, na_value="red"
+    )
+    npt.assert_array_equal(result, expected)
+
+    # A list of values is not made of chunks
+    result = scale_continuous.map_chunked(
+        list(x), palette, limits, na_value="red", chunksize=64
+    )
+    npt.assert_array_equal(result, expected)
+
+    # RGBA values
+    rgba = scale_continuous.map_chunked(
+        x,
+        partial(palette, output="uint8"),
+        limits,
+        na_value=0,
+        out=np.empty((len(x), 4), dtype=np.uint8),
+        chunksize=100,
+    )
+    assert rgba.shape == (len(x), 4)
+    assert (rgba[3] == 0).all()
+
+    with pytest.raises(ValueError):
+        scale_continuous.map_chunked(x, palette, limits, out=out[:10])
+
+    with pytest.raises(ValueError):
+        scale_continuous.map_chunked(x, palette, limits, chunksize=0)
+
+
 def test_scale_discrete():
     def assert_equal_with_nan(lst1, lst2):
         assert lst1[:-1] == lst2[:-1] and np.isnan(lst2[-1])
@@ -118,3 +236,62 @@ def test_scale_discrete():
     limits = scale_discrete.train(x1)
     limits = scale_discrete.train(x2, old=limits)
     assert limits == [(1, 2), (3, 4), (5, 6), (7, 8)]
+
+
+def test_range_discrete():
+    rng = np.random.default_rng(123)
+    levels = np.array([f"l{i:03d}" for i in range(300)], dtype=object)
+    chunks = [rng.choice(levels, 1000) for _ in range(5)]
+    chunks[2][7] = None
+
+    # Training in chunks is the same as training once
+    r = range_discrete()
+    for chunk in chunks:
+        r.train(chunk)
+    limits = scale_discrete.train(chunks[0])
+    for chunk in chunks[1:]:
+        limits = scale_discrete.train(chunk, limits)
+    assert r.limits[:-1] == limits[:-1]
+    assert np.isnan(r.limits[-1]) and np.isnan(limits[-1])
+    assert len(r) == len(limits)
+
+    # The index is reused until new values are added
+    index = r.index
+    r.train(chunks[0])
+    assert r.index is index
+    r.train(["new"])
+    assert r.index is not index
+
+    # Mapping
+    x = np.hstack(chunks)
+    result = r.map(x, np.arange, na_value=-1)
+    expected = scale_discrete.map(x, np.arange, r.limits, na_value=-1)
+    npt.assert_array_equal(result, expected)
+    assert result[1000 * 2 + 7] == -1
+    assert r.limits[result[0]] == x[0]
+
+    # Categoricals map through the categories
+    cat = pd.Categorical(x[:50], categories=levels[::-1])
+    npt.assert_array_equal(r.map(cat, np.arange), result[:50])
+
+    # Merging ranges trained separately
+    r1 = range_discrete().train(["b", "c"])
+    r2 = range_discrete().train(["d", "a", "c"])
+    assert r1.merge(r2).limits == ["b", "c", "a", "d"]
+    assert range_discrete().merge(r1).limits == r1.limits
+
+    # Pickling
+    r3 = pickle.loads(pickle.dumps(r))
+    assert r3.limits[:-2] == r.limits[:-2]
+    npt.assert_array_equal(r3.map(x, np.arange, na_value=-1), result)
+
+    # Duplicate limits match the first position
+    r4 = range_discrete(["a", "b", "a"])
+    npt.assert_array_equal(r4.get_indexer(["a", "b", "c"]), [0, 1, -1])
+
+    # Tuples
+    r5 = range_discrete().train(pd.Series([(1, 2), (3, 4), (1, 2)]))
+    assert r5.limits == [(1, 2), (3, 4)]
+    npt.assert_array_equal(
+        r5.map(pd.Series([(3, 4), (1, 2)]), np.arange), [1, 0]
+    )
@@ -249,13 +249,13 @@ def test_datetime_trans_tz():
     # Same trans as data
     t = datetime_trans()
     x2 = t.inverse(t.transform(x))
-    assert_equal(x, x2)
+    assert_equal(x, list(x2))
     assert all(val.tzinfo == EST for val in x2)
 
     # UTC trans
     t = datetime_trans(UTC)
     x2 = t.inverse(t.transform(x))
-    assert_equal(x, x2)
+    assert_equal(x, list(x2))
     assert all(val.tzinfo == UTC for val in x2)
 
     t = datetime_trans("MST")
@@ -1,10 +1,15 @@
+import copy
+import pickle
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+import numpy as np
+import numpy.testing as npt
 import pandas as pd
 import pytest
 
 from mizani.utils import (
+    LRUCache,
     get_categories,
     get_null_value,
     get_timezone,
@@ -65,21 +70,64 @@ def test_match():
     v1 = [0, 1, 2, 3, 4, 5]
     v2 = [5, 4, 3, 2, 1, 0]
     result = match(v1, v2)
-    assert result == v2
+    npt.assert_array_equal(result, v2)
 
     # Positions of the first match
     result = match(v1, v2 + v2)
-    assert result == v2
+    npt.assert_array_equal(result, v2)
 
     result = match(v1, v2, incomparables=[1, 2])
-    assert result == [5, -1, -1, 2, 1, 0]
+    npt.assert_array_equal(result, [5, -1, -1, 2, 1, 0])
 
     result = match(v1, v2, start=1)
-    assert result == [6, 5, 4, 3, 2, 1]
+    npt.assert_array_equal(result, [6, 5, 4, 3, 2, 1])
 
     v2 = [5, 99, 3, 2, 1, 0]
     result = match(v1, v2)
-    assert result == [5, 4, 3, 2, -1, 0]
+    npt.assert_array_equal(result, [5, 4, 3, 2, -1, 0])
+
+    # Other nomatch values, with start
+    result = match(v1, v2, nomatch=0, start=1)
+    npt.assert_array_equal(result, [6, 5, 4, 3, 0, 1])
+
+    # Missing values match each other
+    result = match([None, np.nan], ["a", None, np.nan])
+    npt.assert_array_equal(result, [1, 1])
+    result = match(np.array([np.nan, 1.0]), np.array([1.0, np.nan]))
+    npt.assert_array_equal(result, [1, 0])
+
+    # incomparables should be list-like
+    with pytest.raises(TypeError):
+        match(["a", "c"], ["a", "c"], incomparables="c")
+
+
+@pytest.mark.parametrize(
+    "v1, v2",
+    [
+        (["b", "c", "x", "a"], ["a", "b", "c", "b"]),
+        (np.array(["b", "c", "x", "a"]), np.array(["a", "b", "c"])),
+        (pd.Series(["b", "c", "x"], dtype="category"), ["c", "b"]),
+        (pd.Categorical(["b", None, "a"]), ["a", "b"]),
+        (np.array([2.5, 1, 7]), [1.0, 2.5]),
+        ([(1, 2), (3, 4), (5, 6)], [(3, 4), (1, 2)]),
+        ([True, False], [1, 0]),
+        ([1, 0, 2], [False, True]),
+        (np.array([1.0, 0.5]), np.array([True, False])),
+        (pd.Categorical([True, False]), [0, 1]),
+        ([1, 2, 3], []),
+        ([], [1, 2]),
+    ],
+)
+def test_match_types(v1, v2):
+    def _match(v1, v2):
+        lookup = {}
+        for i, x in enumerate(v2):
+            lookup.setdefault(x, i)
+        return [lookup.get(x, -1) for x in v1]
+
+    result = match(v1, v2)
+    assert result.dtype == np.intp
+    npt.assert_array_equal(result, _match(v1, v2))
 
 
 def test_precision():
@@ -144,3 +192,34 @@ def test_get_timezone():
 def test_get_null_value():
     x = [datetime(2022, 3, 24)]
     assert get_null_value(x) is None
+
+
+def test_lru_cache():
+    cache = LRUCache(maxsize=2)
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    # "b" is the least recently used
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert "a" in cache
+    assert cache.get("b", 0) == 0
+    assert cache.info() == (1, 2, 2, 2)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info() == (0, 0, 2, 0)
+
+    # Picklable
+    cache.put("a", 1)
+    cache2 = pickle.loads(pickle.dumps(cache))
+    assert cache2.get("a") == 1
+
+    # Copies are the same cache
+    assert copy.copy(cache) is cache
+    assert copy.deepcopy(cache) is cache
+
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
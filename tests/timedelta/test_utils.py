@@ -1,10 +1,15 @@
 from datetime import timedelta
 
+import numpy as np
+import numpy.testing as npt
+import pandas as pd
 import pytest
 from dateutil.relativedelta import relativedelta
 
 from mizani._timedelta.utils import (
     as_timedelta,
+    as_timedelta64,
+    num_to_timedelta,
     parse_timedelta_width,
     timedelta_to_num,
 )
@@ -14,6 +19,61 @@ def test_timedelta_to_num():
     res = timedelta_to_num([])
     assert len(res) == 0
 
+    x = [timedelta(days=1, microseconds=7), timedelta(hours=-6)]
+    expected = [td.total_seconds() / 86400 for td in x]
+    npt.assert_array_equal(timedelta_to_num(x), expected)
+    assert timedelta_to_num(x[0]) == expected[0]
+
+    # timedelta64 keeps the nanoseconds
+    x = pd.to_timedelta([1, 86400 * 10**9 + 1, None], unit="ns")
+    expected = [1e-9 / 86400, (86400 + 1e-9) / 86400, np.nan]
+    npt.assert_allclose(timedelta_to_num(x), expected, rtol=1e-15)
+    npt.assert_allclose(timedelta_to_num(pd.Series(x)), expected, rtol=1e-15)
+    npt.assert_allclose(timedelta_to_num(x.to_numpy()), expected, rtol=1e-15)
+
+    # Beyond the range of timedelta64[ns]
+    x = [timedelta(days=900000, microseconds=7), timedelta(days=-1)]
+    expected = [td.total_seconds() / 86400 for td in x]
+    npt.assert_array_equal(timedelta_to_num(x), expected)
+    x = np.array([900000, -1, "NaT"], dtype="timedelta64[D]")
+    npt.assert_array_equal(timedelta_to_num(x), [900000, -1, np.nan])
+
+
+def test_as_timedelta64():
+    x = pd.to_timedelta([1, 2, None], unit="D").as_unit("ns").to_numpy()
+    assert as_timedelta64(x) is x
+
+    expected = x.astype(np.int64)
+    res = as_timedelta64(x.astype("timedelta64[D]"))
+    npt.assert_array_equal(res.view(np.int64), expected)
+    res = as_timedelta64([timedelta(days=1), timedelta(days=2), None])
+    npt.assert_array_equal(res.view(np.int64), expected)
+
+    # Beyond the range of timedelta64[ns], the values do not wrap
+    with pytest.raises(pd.errors.OutOfBoundsTimedelta):
+        as_timedelta64([timedelta(days=900000), timedelta(days=-1)])
+
+    with pytest.raises(pd.errors.OutOfBoundsTimedelta):
+        as_timedelta64(np.array([900000, -1], dtype="timedelta64[D]"))
+
+
+def test_num_to_timedelta():
+    x = [0, 1 / 3, -0.5, 1e5 + 0.25, np.nan]
+    res = num_to_timedelta(x)
+    assert isinstance(res, pd.arrays.TimedeltaArray)
+    assert list(res[:-1]) == [
+        pd.Timedelta(0),
+        pd.Timedelta(hours=8),
+        pd.Timedelta(hours=-12),
+        pd.Timedelta(days=1e5, hours=6),
+    ]
+    assert res[-1] is pd.NaT
+
+    # Round trip
+    x = pd.to_timedelta(np.arange(-500, 500) * 10**11 + 7, unit="ns")
+    res = num_to_timedelta(timedelta_to_num(x))
+    assert np.abs(res.asi8 - x.asi8).max() <= 1
+
 
 def test_parse_timedelta_width():
     assert parse_timedelta_width("2 sec") == ("seconds", 2)
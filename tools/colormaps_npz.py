@@ -0,0 +1,63 @@
+"""
+Write the colormap data file, mizani/_colors/_colormaps/_maps/colormaps.npz
+
+The colors of the listed and segment interpolated colormaps are taken
+from matplotlib (3.11) and, as mizani has always stored them, rounded
+to 6 decimal places. The names of the colormaps come from the
+``_kinds`` of the modules that create them, so to add a colormap,
+add it there and run this script.
+
+Usage:
+
+    python tools/colormaps_npz.py
+"""
+
+from pathlib import Path
+
+import numpy as np
+from matplotlib import _cm, _cm_listed
+
+from mizani._colors._colormaps._maps import _listed, _segment_interpolated
+from mizani._colors._colormaps._maps._data import DATA_FILE
+
+OUTPUT = Path(_listed.__file__).parent / DATA_FILE
+
+# Colormaps whose colors are stored as given by matplotlib
+UNROUNDED = {"twilight", "twilight_shifted", "Wistia", "coolwarm"}
+
+
+def as_array(data, name: str) -> np.ndarray:
+    """
+    Return colormap data as a float64 array
+    """
+    arr = np.asarray(data, dtype=np.float64)
+    return arr if name in UNROUNDED else np.round(arr, 6)
+
+
+def listed_colors(name: str) -> np.ndarray:
+    """
+    Return the (n, 3) colors of a listed colormap
+    """
+    if name in _cm_listed.cmaps:
+        return as_array(_cm_listed.cmaps[name].colors, name)
+    # matplotlib makes brg by interpolating a list of colors
+    return as_array(_cm.datad[name], name)
+
+
+def main():
+    arrays = {}
+    for name in _listed._kinds:
+        arrays[f"listed/{name}"] = listed_colors(name)
+
+    for name in _segment_interpolated._kinds:
+        for channel in ("red", "green", "blue"):
+            arrays[f"segmented/{name}/{channel}"] = as_array(
+                _cm.datad[name][channel], name
+            )
+
+    np.savez(OUTPUT, **arrays)
+    print(f"Wrote {len(arrays)} arrays to {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()